@@ -0,0 +1,113 @@
+#===============================================================================
+# PyDealer - Benchmarks - Deck Batch
+#-------------------------------------------------------------------------------
+# Version: 1.4.0
+# Updated: 10-01-2015
+# Author: Alex Crawford
+# License: GPLv3
+#===============================================================================
+
+"""
+Compares dealing Texas Hold'em tables (shuffle, a hand of 2 cards for each
+player, burns, and a 5 card board) with a ``Deck`` per table, and with a
+``DeckBatch`` of many tables, and compares the shuffles by hand (riffle,
+overhand, and strip) of a ``Deck``, and of a ``DeckBatch``. Requires NumPy.
+Run from the repository root with::
+
+    python benchmarks/bench_batch.py
+
+"""
+
+
+#===============================================================================
+# Imports
+#===============================================================================
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import pydealer
+
+
+#===============================================================================
+# Benchmarks
+#===============================================================================
+
+NUM_DECKS = 100000
+
+
+def bench_deck(num_players):
+    """"""
+    def deal():
+        deck = pydealer.Deck()
+        deck.shuffle()
+        deck.deal_hands(num_players, 2, codes=True)
+        deck.deal_codes(1)
+        deck.deal_codes(3)
+        deck.deal_codes(1)
+        deck.deal_codes(1)
+        deck.deal_codes(1)
+        deck.deal_codes(1)
+    return deal, 1
+
+
+def bench_batch(num_players):
+    """"""
+    batch = pydealer.DeckBatch(NUM_DECKS)
+    def deal():
+        batch.build()
+        batch.shuffle()
+        batch.deal_hands(num_players, 2)
+        batch.burn()
+        batch.deal(3)
+        batch.burn()
+        batch.deal(1)
+        batch.burn()
+        batch.deal(1)
+    return deal, NUM_DECKS
+
+
+BENCHMARKS = [
+    ("Deck", bench_deck),
+    ("DeckBatch", bench_batch),
+]
+
+METHODS = ["riffle", "overhand", "strip"]
+
+
+def bench_methods(number=5):
+    """"""
+    print("%-12s %10s %14s" % ("benchmark", "method", "decks/s"))
+    for method in METHODS:
+        deck = pydealer.Deck()
+        time = min(timeit.repeat(lambda: deck.shuffle(method=method),
+            number=number * 200, repeat=3))
+        print("%-12s %10s %14.0f" % ("Deck", method, number * 200 / time))
+
+        batch = pydealer.DeckBatch(NUM_DECKS)
+        time = min(timeit.repeat(lambda: batch.shuffle(method=method),
+            number=number, repeat=3))
+        print("%-12s %10s %14.0f" % (
+            "DeckBatch", method, NUM_DECKS * number / time))
+
+
+def main(number=5):
+    """"""
+    print("%-12s %8s %14s" % ("benchmark", "players", "deals/s"))
+    for num_players in (2, 9):
+        for name, bench in BENCHMARKS:
+            func, num_deals = bench(num_players)
+            scale = 1000 if num_deals == 1 else 1
+            time = min(timeit.repeat(func, number=number * scale, repeat=3))
+            print("%-12s %8d %14.0f" % (
+                name, num_players, num_deals * number * scale / time))
+
+    print("")
+    bench_methods(number)
+
+
+if __name__ == "__main__":
+    main()
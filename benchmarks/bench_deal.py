@@ -0,0 +1,97 @@
+#===============================================================================
+# PyDealer - Benchmarks - Dealing
+#-------------------------------------------------------------------------------
+# Version: 1.4.0
+# Updated: 10-01-2015
+# Author: Alex Crawford
+# License: GPLv3
+#===============================================================================
+
+"""
+Compares the ways of dealing two cards to each of 10 hands, from a rebuilding
+deck: ``hand.add(deck.deal(2))``, ``deck.deal_into(hand, 2)``,
+``deck.deal_codes(2)``, and ``deck.deal_hands(10, 2)``. Run from the repository root with::
+
+    python benchmarks/bench_deal.py
+
+"""
+
+
+#===============================================================================
+# Imports
+#===============================================================================
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import pydealer
+
+
+#===============================================================================
+# Benchmarks
+#===============================================================================
+
+NUM_HANDS = 10
+
+
+def bench_deal(deck, hands):
+    """"""
+    def deal():
+        for hand in hands:
+            hand.add(deck.deal(2))
+            hand.empty()
+    return deal
+
+
+def bench_deal_into(deck, hands):
+    """"""
+    def deal():
+        for hand in hands:
+            deck.deal_into(hand, 2)
+            hand.empty()
+    return deal
+
+
+def bench_deal_codes(deck, hands):
+    """"""
+    def deal():
+        for hand in hands:
+            deck.deal_codes(2)
+    return deal
+
+
+def bench_deal_hands(deck, hands):
+    """"""
+    return lambda: deck.deal_hands(NUM_HANDS, 2)
+
+
+def bench_deal_hands_codes(deck, hands):
+    """"""
+    return lambda: deck.deal_hands(NUM_HANDS, 2, codes=True)
+
+
+BENCHMARKS = [
+    ("deal + add", bench_deal),
+    ("deal_into", bench_deal_into),
+    ("deal_codes", bench_deal_codes),
+    ("deal_hands", bench_deal_hands),
+    ("deal_hands codes", bench_deal_hands_codes),
+]
+
+
+def main(number=2000):
+    """"""
+    print("%-18s %10s" % ("benchmark", "us/table"))
+    for name, bench in BENCHMARKS:
+        deck = pydealer.Deck(rebuild=True, re_shuffle=True)
+        hands = [pydealer.Stack() for _ in range(NUM_HANDS)]
+        func = bench(deck, hands)
+        time = min(timeit.repeat(func, number=number, repeat=3))
+        print("%-18s %10.2f" % (name, time / number * 1000000))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+#===============================================================================
+# PyDealer - Benchmarks - Provably Fair Commitments
+#-------------------------------------------------------------------------------
+# Version: 1.4.0
+# Updated: 10-01-2015
+# Author: Alex Crawford
+# License: GPLv3
+#===============================================================================
+
+"""
+Compares the throughput of making deck commitments: hashing the str of each
+deck, hashing the byte encoding of each deck with ``commit_orders``, making,
+and committing fair decks with ``commit``, and ``commit_many``, and hashing
+the decks of a ``DeckBatch``. Run from the repository root with::
+
+    python benchmarks/bench_fair.py
+
+"""
+
+
+#===============================================================================
+# Imports
+#===============================================================================
+
+from hashlib import sha256
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import pydealer
+from pydealer import fair
+from pydealer.batch import numpy
+
+
+#===============================================================================
+# Benchmarks
+#===============================================================================
+
+def bench_str(decks):
+    """"""
+    return [sha256(str(deck).encode("utf-8")).hexdigest() for deck in decks]
+
+
+def bench_orders(decks):
+    """"""
+    return fair.commit_orders(decks, "salt")
+
+
+def bench_commit(num):
+    """"""
+    return [fair.commit("server", "client", i)[1] for i in range(num)]
+
+
+def bench_commit_many(num):
+    """"""
+    return fair.commit_many("server", "client", range(num))
+
+
+def main(num=10000):
+    """"""
+    decks = [pydealer.Deck.from_seed(1234, i) for i in range(num)]
+    benchmarks = [
+        ("sha256(str(deck))", lambda: bench_str(decks)),
+        ("commit_orders", lambda: bench_orders(decks)),
+        ("commit", lambda: bench_commit(num)),
+        ("commit_many", lambda: bench_commit_many(num)),
+    ]
+
+    if numpy is not None:
+        batch = pydealer.DeckBatch(num, rng=1234)
+        batch.shuffle()
+        codes = batch.codes
+        benchmarks.append(("commit_orders(batch)",
+            lambda: fair.commit_orders(codes, "salt")))
+
+    print("%-22s %10s %12s" % ("benchmark", "us/deck", "decks/s"))
+    for name, bench in benchmarks:
+        elapsed = min(timeit.repeat(bench, number=1, repeat=3)) / num
+        print("%-22s %10.2f %12.0f" % (name, elapsed * 1000000, 1 / elapsed))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+#===============================================================================
+# PyDealer - Benchmarks - Random Number Generators
+#-------------------------------------------------------------------------------
+# Version: 1.4.0
+# Updated: 10-01-2015
+# Author: Alex Crawford
+# License: GPLv3
+#===============================================================================
+
+"""
+Compares the shuffle throughput of the random number generators, shuffling
+a list of 52 cards: the global ``random.shuffle``, a ``random.Random``
+instance, a ``CounterRNG``, plus making a deck with ``Deck.from_seed``, and
+the secure generators, ``random.SystemRandom``, and ``SecureRNG``.
+Run from the repository root with::
+
+    python benchmarks/bench_rng.py
+
+"""
+
+
+#===============================================================================
+# Imports
+#===============================================================================
+
+import os
+import random
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import pydealer
+from pydealer.rng import (
+    CounterRNG,
+    SecureRNG
+)
+
+
+#===============================================================================
+# Benchmarks
+#===============================================================================
+
+def bench_shuffle(rng):
+    """"""
+    cards = pydealer.tools.build_cards()
+    return lambda: rng.shuffle(cards)
+
+
+def bench_from_seed():
+    """"""
+    indices = iter(range(10 ** 9))
+    return lambda: pydealer.Deck.from_seed(1234, next(indices))
+
+
+BENCHMARKS = [
+    ("random.shuffle", lambda: bench_shuffle(random)),
+    ("Random.shuffle", lambda: bench_shuffle(random.Random(1234))),
+    ("CounterRNG.shuffle", lambda: bench_shuffle(CounterRNG(1234))),
+    ("Deck.from_seed", bench_from_seed),
+    ("SystemRandom.shuffle", lambda: bench_shuffle(random.SystemRandom())),
+    ("SecureRNG.shuffle", lambda: bench_shuffle(SecureRNG())),
+]
+
+
+def main(number=5000):
+    """"""
+    print("%-22s %10s %12s" % ("benchmark", "us/deck", "decks/s"))
+    for name, bench in BENCHMARKS:
+        time = min(timeit.repeat(bench(), number=number, repeat=3)) / number
+        print("%-22s %10.2f %12.0f" % (name, time * 1000000, 1 / time))
+
+
+if __name__ == "__main__":
+    main()
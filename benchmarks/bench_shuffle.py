@@ -0,0 +1,75 @@
+#===============================================================================
+# PyDealer - Benchmarks - Shuffling
+#-------------------------------------------------------------------------------
+# Version: 1.4.0
+# Updated: 10-01-2015
+# Author: Alex Crawford
+# License: GPLv3
+#===============================================================================
+
+"""
+Compares the cost of shuffling a deck, and dealing a 9 card hand from it,
+with a full shuffle, a lazy shuffle (``lazy_shuffle=True``), and
+``Stack.sample``, for decks of 1, and 6 standard decks. Run from the
+repository root with::
+
+    python benchmarks/bench_shuffle.py
+
+"""
+
+
+#===============================================================================
+# Imports
+#===============================================================================
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import pydealer
+
+
+#===============================================================================
+# Benchmarks
+#===============================================================================
+
+HAND_SIZE = 9
+
+
+def bench_shuffle(deck):
+    """"""
+    def deal():
+        deck.shuffle()
+        deck.add(deck.deal(HAND_SIZE))
+    return deal
+
+
+def bench_sample(deck):
+    """"""
+    return lambda: deck.add(deck.sample(HAND_SIZE))
+
+
+BENCHMARKS = [
+    ("shuffle + deal", bench_shuffle, False),
+    ("lazy shuffle + deal", bench_shuffle, True),
+    ("sample", bench_sample, False),
+]
+
+
+def main(number=2000):
+    """"""
+    print("%-20s %6s %10s" % ("benchmark", "decks", "us/hand"))
+    for num_decks in (1, 6):
+        cards = pydealer.tools.build_cards() * num_decks
+        for name, bench, lazy in BENCHMARKS:
+            deck = pydealer.Deck(cards=cards, lazy_shuffle=lazy)
+            func = bench(deck)
+            time = min(timeit.repeat(func, number=number, repeat=3))
+            print("%-20s %6d %10.2f" % (
+                name, num_decks, time / number * 1000000))
+
+
+if __name__ == "__main__":
+    main()
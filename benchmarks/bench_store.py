@@ -0,0 +1,146 @@
+#===============================================================================
+# PyDealer - Benchmarks - Card Stores
+#-------------------------------------------------------------------------------
+# Version: 1.4.0
+# Updated: 10-01-2015
+# Author: Alex Crawford
+# License: GPLv3
+#===============================================================================
+
+"""
+Compares the default ``deque`` card store with ``ListDeque``, and
+``BlockList``, on stacks of 1, 8, 100 and 1000 decks. "slice (old)" is the card
+by card slicing that ``Stack`` used to do. Run from the repository root with::
+
+    python benchmarks/bench_store.py
+
+"""
+
+
+#===============================================================================
+# Imports
+#===============================================================================
+
+from collections import deque
+import os
+import random
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import pydealer
+from pydealer.const import BOTTOM
+from pydealer.store import (
+    BlockList,
+    ListDeque
+)
+
+
+#===============================================================================
+# Benchmarks
+#===============================================================================
+
+DECKS = [1, 8, 100, 1000]
+STORES = [deque, ListDeque, BlockList]
+
+
+def make_stack(num_decks, store):
+    """"""
+    return pydealer.Stack(cards=pydealer.tools.build_cards() * num_decks,
+        store=store)
+
+
+def bench_index(stack):
+    """"""
+    size = stack.size
+    indices = [random.randrange(size) for _ in range(1000)]
+    return lambda: [stack[i] for i in indices]
+
+
+def bench_slice(stack):
+    """"""
+    size = stack.size
+    return lambda: stack[size // 4:size - size // 4]
+
+
+def bench_slice_per_index(stack):
+    """"""
+    size = stack.size
+    cards = stack.cards
+    return lambda: [cards[i] for i in range(size // 4, size - size // 4)]
+
+
+def bench_split(stack):
+    """"""
+    return lambda: stack.split()
+
+
+def bench_reverse(stack):
+    """"""
+    return lambda: stack.reverse()
+
+
+def bench_deal_ends(stack):
+    """"""
+    def deal():
+        stack.add(stack.deal(10))
+        stack.add(stack.deal(10, BOTTOM), BOTTOM)
+    return deal
+
+
+def bench_insert_mid(stack):
+    """"""
+    card = stack[0]
+    size = stack.size
+    indices = [random.randrange(size) for _ in range(100)]
+    def insert():
+        for i in indices:
+            stack.insert(card, i)
+        for i in reversed(indices):
+            del stack[i]
+    return insert
+
+
+def bench_insert_list_mid(stack):
+    """"""
+    cards = stack[:5]
+    size = stack.size
+    def insert():
+        stack.insert_list(cards, size // 3)
+        for _ in cards:
+            del stack[size // 3]
+    return insert
+
+
+BENCHMARKS = [
+    ("index x1000", bench_index),
+    ("slice 1/2", bench_slice),
+    ("slice (old)", bench_slice_per_index),
+    ("split", bench_split),
+    ("reverse", bench_reverse),
+    ("deal both ends", bench_deal_ends),
+    ("insert/del x100", bench_insert_mid),
+    ("insert_list", bench_insert_list_mid),
+]
+
+
+def main(number=20):
+    """"""
+    print(("%-16s %6s" + " %14s" * len(STORES)) % (("benchmark", "decks") +
+        tuple("%s (ms)" % (store.__name__,) for store in STORES)))
+    for name, bench in BENCHMARKS:
+        for num_decks in DECKS:
+            times = []
+            for store in STORES:
+                func = bench(make_stack(num_decks, store))
+                times.append(
+                    min(timeit.repeat(func, number=number, repeat=3)) /
+                    number * 1000
+                )
+            print(("%-16s %6d" + " %14.4f" * len(STORES)) % (
+                (name, num_decks) + tuple(times)))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,7 @@
+from pydealer.batch import DeckBatch
 from pydealer.card import Card
 from pydealer.const import *
 from pydealer.deck import Deck
+from pydealer.ranks import Ranks
+from pydealer.shoe import Shoe
 from pydealer.stack import Stack
\ No newline at end of file
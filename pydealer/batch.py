@@ -0,0 +1,439 @@
+#===============================================================================
+# PyDealer - Deck Batch Class
+#-------------------------------------------------------------------------------
+# Version: 1.4.0
+# Updated: 10-01-2015
+# Author: Alex Crawford
+# License: GPLv3
+#===============================================================================
+
+"""
+This module contains the ``DeckBatch`` class, which holds many standard 52
+card decks as a NumPy matrix of card codes, one deck per row, for Monte
+Carlo simulations. The decks are shuffled, and dealt all at once, with
+vectorized NumPy operations, and are only converted to ``Card`` instances,
+or ``Stack`` instances when asked.
+
+The module also has vectorized versions of the shuffles of the ``shuffles``
+module, which work on a whole matrix of card codes at once, and
+``rising_sequences``, for measuring how well the decks are mixed.
+
+NumPy is optional for the rest of PyDealer, but required by this module.
+
+"""
+
+
+#===============================================================================
+# Imports
+#===============================================================================
+
+from pydealer.card import CARDS
+from pydealer.const import (
+    BLOCK,
+    JOKER_CODE,
+    OVERHAND,
+    RIFFLE,
+    ROUND_ROBIN,
+    STRIP
+)
+from pydealer.shuffles import (
+    OVERHAND_CUT_PROB,
+    STRIP_CUT_PROB
+)
+from pydealer.stack import Stack
+
+# NumPy is optional. It is only needed for DeckBatch.
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+#===============================================================================
+# DeckBatch Class
+#===============================================================================
+
+class DeckBatch(object):
+    """
+    A batch of standard 52 card decks, held as a ``(num_decks, 52)`` int8
+    matrix of card codes, in ``DeckBatch.codes``. Each row is a deck, and
+    like a ``Stack``, the top of each deck is the end of its row. The
+    remaining cards of every deck are in the first ``size`` columns, and
+    all of the decks are dealt in step, so each deal is a slice of the
+    matrix.
+
+    Shuffling is lazy, like a ``Stack`` with ``lazy_shuffle=True``.
+    ``DeckBatch.shuffle`` only marks the decks as shuffled, and each card is
+    picked at random from the remaining cards of every deck as it is dealt,
+    so the cost of a shuffle is spread over the cards that are actually
+    dealt. The order of the remaining cards is only fixed when
+    ``DeckBatch.codes`` is read.
+
+    :arg int num_decks:
+        The number of decks in the batch.
+    :arg rng:
+        The random number generator. Can be a NumPy ``Generator``, a
+        ``NumPyRNG``, or an int seed. Defaults to a new, randomly seeded
+        generator.
+
+    """
+    def __init__(self, num_decks, rng=None):
+        """
+        DeckBatch constructor method.
+
+        :arg int num_decks:
+            The number of decks in the batch.
+        :arg rng:
+            The random number generator, or seed.
+
+        """
+        if numpy is None:
+            raise ImportError("DeckBatch requires NumPy.")
+
+        if num_decks < 0:
+            raise ValueError("Invalid number of decks: %r" % (num_decks,))
+
+        if rng is None or isinstance(rng, int):
+            rng = numpy.random.default_rng(rng)
+        elif not isinstance(rng, numpy.random.Generator):
+            rng = getattr(rng, "generator", None)
+            if not isinstance(rng, numpy.random.Generator):
+                raise TypeError("DeckBatch requires a NumPy Generator.")
+
+        self.rng = rng
+        self.size = 0
+        self._codes = numpy.empty((num_decks, JOKER_CODE), dtype=numpy.int8)
+        self._lazy = False
+
+        self.build()
+
+    def __len__(self):
+        """
+        Allows checking the number of decks in the batch, with len.
+
+        :returns:
+            The number of decks.
+
+        """
+        return len(self._codes)
+
+    def __repr__(self):
+        """
+        Returns a string representation of the ``DeckBatch`` instance.
+
+        :returns:
+            A string representation of the DeckBatch instance.
+
+        """
+        return "DeckBatch(num_decks=%r, size=%r)" % (len(self), self.size)
+
+    def _deal_lazy(self, num):
+        """
+        Deals ``num`` cards from every deck, while the decks are lazily
+        shuffled. Each card is picked uniformly at random from the remaining
+        cards of its deck, and the card on top of the deck is moved into its
+        place, one step of a Fisher-Yates shuffle, for all of the decks at
+        once.
+
+        :arg int num:
+            The number of cards to deal. Must not be more than ``size``.
+
+        :returns:
+            A ``(num_decks, num)`` array of the dealt card codes.
+
+        """
+        num_decks = len(self._codes)
+        flat_codes = self._codes.reshape(-1)
+        rows = numpy.arange(num_decks) * JOKER_CODE
+        tops = rows + (self.size - 1)
+        # Exact integer draws, from [0, size - i) for step i.
+        highs = numpy.arange(self.size, self.size - num, -1)[:, None]
+        picks = self.rng.integers(0, highs, size=(num, num_decks),
+            dtype=numpy.intp)
+        dealt_codes = numpy.empty((num, num_decks), dtype=numpy.int8)
+
+        for i in range(num):
+            indices = picks[i] + rows
+            dealt_codes[i] = flat_codes[indices]
+            flat_codes[indices] = flat_codes[tops]
+            tops -= 1
+
+        self.size -= num
+
+        return dealt_codes.T.copy()
+
+    def _materialize(self):
+        """
+        Fixes the order of the remaining cards of lazily shuffled decks, by
+        sorting each deck on random keys.
+
+        """
+        self._lazy = False
+
+        size = self.size
+        keys = self.rng.random((len(self._codes), size))
+        order = numpy.argsort(keys, axis=1)
+        self._codes[:, :size] = numpy.take_along_axis(
+            self._codes[:, :size], order, axis=1)
+
+    def build(self):
+        """
+        Puts all 52 cards back into every deck, in the order of
+        ``build_cards``.
+
+        """
+        self._codes[:] = numpy.arange(JOKER_CODE, dtype=numpy.int8)
+        self.size = JOKER_CODE
+        self._lazy = False
+
+    def burn(self, num=1):
+        """
+        Discards the given number of cards from the top of every deck.
+
+        :arg int num:
+            The number of cards to burn.
+
+        """
+        if self._lazy:
+            self.deal(num)
+        else:
+            self.size -= min(num, self.size)
+
+    @property
+    def codes(self):
+        """
+        The card code matrix, with a row for each deck. Only the first
+        ``size`` columns are still in the decks.
+
+        :returns:
+            The ``(num_decks, 52)`` int8 array.
+
+        """
+        if self._lazy:
+            self._materialize()
+
+        return self._codes
+
+    def deal(self, num=1):
+        """
+        Deals the given number of cards from the top of every deck, such as
+        a board. If the decks run out, fewer cards are dealt.
+
+        :arg int num:
+            The number of cards to deal.
+
+        :returns:
+            A ``(num_decks, num)`` array of the dealt card codes, in the
+            order they were dealt.
+
+        """
+        num = min(num, self.size)
+
+        if self._lazy:
+            return self._deal_lazy(num)
+
+        start = self.size - num
+        dealt_codes = self._codes[:, start:self.size][:, ::-1].copy()
+        self.size = start
+
+        return dealt_codes
+
+    def deal_hands(self, num_players, num_cards, order=ROUND_ROBIN):
+        """
+        Deals a hand of ``num_cards`` cards to each of ``num_players``
+        players, from every deck.
+
+        :arg int num_players:
+            The number of hands to deal from each deck.
+        :arg int num_cards:
+            The number of cards to deal to each hand.
+        :arg str order:
+            The order to deal in. ``ROUND_ROBIN`` ("round_robin") deals one
+            card to each hand in turn. ``BLOCK`` ("block") deals each hand
+            all of its cards, before moving on to the next hand.
+
+        :returns:
+            A ``(num_decks, num_players, num_cards)`` array of the card
+            codes of the hands.
+
+        """
+        if order not in (ROUND_ROBIN, BLOCK):
+            raise ValueError("Invalid order: %r" % (order,))
+
+        if num_players * num_cards > self.size:
+            raise ValueError("Not enough cards to deal %d hands of %d." % (
+                num_players, num_cards))
+
+        dealt_codes = self.deal(num_players * num_cards)
+
+        if order == ROUND_ROBIN:
+            return dealt_codes.reshape(
+                (-1, num_cards, num_players)).transpose(0, 2, 1)
+        else:
+            return dealt_codes.reshape((-1, num_players, num_cards))
+
+    def shuffle(self, times=1, method=None):
+        """
+        Shuffles the remaining cards of every deck, independently. Unless a
+        ``method`` is given, the decks are only marked as shuffled, and the
+        cards are picked as they are dealt.
+
+        :arg int times:
+            The number of times to shuffle, if a ``method`` is given.
+        :arg str method:
+            Optional. The way to shuffle, to simulate shuffling by hand. Can
+            be ``RIFFLE`` ("riffle"), ``OVERHAND`` ("overhand"), or
+            ``STRIP`` ("strip"). Defaults to a perfect, uniform shuffle.
+
+        """
+        if method is None:
+            self._lazy = True
+            return
+
+        try:
+            shuffle = BATCH_SHUFFLES[method]
+        except KeyError:
+            raise ValueError("Invalid shuffle method: %r" % (method,))
+
+        size = self.size
+        codes = self.codes[:, :size]
+        for _ in range(times):
+            codes = shuffle(codes, self.rng)
+        self._codes[:, :size] = codes
+
+    def to_stacks(self):
+        """
+        Converts the remaining cards of every deck to a ``Stack``.
+
+        :returns:
+            A list of ``Stack`` instances, one for each deck.
+
+        """
+        return [
+            Stack(cards=[CARDS[code] for code in row])
+            for row in self.codes[:, :self.size].tolist()
+        ]
+
+
+#===============================================================================
+# Helper Functions
+#===============================================================================
+
+def to_cards(codes):
+    """
+    Converts an array of card codes, such as the hands dealt from a
+    ``DeckBatch``, to ``Card`` instances.
+
+    :arg codes:
+        The array of card codes, of any shape.
+
+    :returns:
+        A NumPy object array of the same shape, of the shared ``Card``
+        instances for the codes.
+
+    """
+    if numpy is None:
+        raise ImportError("to_cards requires NumPy.")
+
+    cards = numpy.empty(len(CARDS), dtype=object)
+    cards[:] = CARDS
+
+    return cards[numpy.asarray(codes, dtype=numpy.intp)]
+
+
+def overhand_codes(codes, rng, cut_prob=OVERHAND_CUT_PROB):
+    """
+    Overhand shuffles every row of the given card code matrix. See
+    ``shuffles.overhand``. Each card gets the number of the packet it is
+    in, and the rows are stably sorted on the packet numbers, in reverse.
+
+    :arg codes:
+        The ``(num_decks, num_cards)`` array of card codes to shuffle.
+    :arg rng:
+        The NumPy ``Generator`` to use.
+    :arg float cut_prob:
+        The chance of a packet ending between two cards.
+
+    :returns:
+        A new array of the shuffled card codes.
+
+    """
+    cuts = rng.random(codes.shape) < cut_prob
+    cuts[:, 0] = False
+    packets = numpy.cumsum(cuts, axis=1, dtype=numpy.int16)
+    order = numpy.argsort(-packets, axis=1, kind="stable")
+
+    return numpy.take_along_axis(codes, order, axis=1)
+
+
+def riffle_codes(codes, rng):
+    """
+    Riffle shuffles every row of the given card code matrix, with the
+    Gilbert-Shannon-Reeds model. See ``shuffles.riffle``. Each position gets
+    a coin flip, and a stable sort on the flips gives the positions that
+    the cards of the first, and the second packet drop into, in order.
+
+    :arg codes:
+        The ``(num_decks, num_cards)`` array of card codes to shuffle.
+    :arg rng:
+        The NumPy ``Generator`` to use.
+
+    :returns:
+        A new array of the shuffled card codes.
+
+    """
+    flips = rng.integers(0, 2, size=codes.shape, dtype=numpy.int8)
+    positions = numpy.argsort(flips, axis=1, kind="stable")
+    shuffled_codes = numpy.empty_like(codes)
+    numpy.put_along_axis(shuffled_codes, positions, codes, axis=1)
+
+    return shuffled_codes
+
+
+def rising_sequences(codes):
+    """
+    Counts the rising sequences of every row of the given card code matrix,
+    relative to code order, such as a ``DeckBatch`` that was built, and then
+    shuffled. A rising sequence is a run of consecutive codes that are in
+    order in the deck, though not necessarily next to each other. An
+    unshuffled deck has ``1``, and ``k`` riffle shuffles make at most
+    ``2 ** k``. A well mixed 52 card deck has about ``26.5``. The codes in
+    each row must be unique.
+
+    :arg codes:
+        The ``(num_decks, num_cards)`` array of card codes.
+
+    :returns:
+        An array of the number of rising sequences of each row.
+
+    """
+    positions = numpy.argsort(codes, axis=1)
+
+    return (positions[:, 1:] < positions[:, :-1]).sum(axis=1) + 1
+
+
+def strip_codes(codes, rng, cut_prob=STRIP_CUT_PROB):
+    """
+    Strip shuffles every row of the given card code matrix. The same as
+    ``overhand_codes``, but with a few large packets.
+
+    :arg codes:
+        The ``(num_decks, num_cards)`` array of card codes to shuffle.
+    :arg rng:
+        The NumPy ``Generator`` to use.
+    :arg float cut_prob:
+        The chance of a packet ending between two cards.
+
+    :returns:
+        A new array of the shuffled card codes.
+
+    """
+    return overhand_codes(codes, rng, cut_prob)
+
+
+# The batch shuffle functions, by method name.
+BATCH_SHUFFLES = {
+    RIFFLE: riffle_codes,
+    OVERHAND: overhand_codes,
+    STRIP: strip_codes,
+}
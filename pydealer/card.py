@@ -18,7 +18,16 @@ single playing card, of a given value and suit.
 # Imports
 #===============================================================================
 
-from pydealer.const import DEFAULT_RANKS
+from pydealer.const import (
+    DEFAULT_RANKS,
+    JOKER_CODE,
+    SUITS,
+    VALUES
+)
+from pydealer.ranks import (
+    DEFAULT,
+    Ranks
+)
 
 
 #===============================================================================
@@ -29,15 +38,24 @@ class Card(object):
     """
     The Card class, each instance representing a single playing card.
 
+    Cards are immutable. Besides the ``value``, ``suit``, ``abbrev`` and
+    ``name`` strings, each card carries an integer ``code`` (``None`` for
+    cards outside of the card registry), and an ``ordinal``, which is its
+    precomputed position under ``DEFAULT_RANKS``.
+
     :arg str value:
         The card value.
     :arg str suit:
         The card suit.
 
     """
-    def __init__(self, value, suit):
+    __slots__ = ("value", "suit", "abbrev", "name", "code", "ordinal", "_hash")
+
+    def __new__(cls, value, suit):
         """
-        Card constructor method.
+        Card constructor method. The cards of a standard French deck, and the
+        joker, are interned, so asking for one of them returns the shared
+        instance from the card registry, instead of building a new one.
 
         :arg str value:
             The card value.
@@ -45,10 +63,30 @@ class Card(object):
             The card suit.
 
         """
-        self.value = str(value).capitalize()
-        self.suit = str(suit).capitalize() if suit else suit
-        self.abbrev = card_abbrev(self.value, self.suit)
-        self.name = card_name(self.value, self.suit)
+        if cls is Card:
+            card = _CARDS_BY_KEY.get((value, suit))
+            if card is not None:
+                return card
+
+        value = str(value).capitalize()
+        suit = str(suit).capitalize() if suit else suit
+
+        if cls is Card:
+            card = _CARDS_BY_KEY.get((value, suit))
+            if card is not None:
+                return card
+
+        return _new_card(cls, value, suit, None)
+
+    def __delattr__(self, name):
+        """
+        Prevents deleting attributes, since cards are immutable.
+
+        :arg str name:
+            The attribute name.
+
+        """
+        raise AttributeError("Card instances are immutable.")
 
     def __eq__(self, other):
         """
@@ -61,10 +99,16 @@ class Card(object):
             ``True`` or ``False``.
 
         """
-        return (
-            isinstance(other, Card) and self.value == other.value and
-            self.suit == other.suit
-        )
+        if self is other:
+            return True
+        elif isinstance(other, Card):
+            # Interned cards are only ever equal to themselves.
+            return (
+                (self.code is None or other.code is None) and
+                self.value == other.value and self.suit == other.suit
+            )
+        else:
+            return False
 
     def __ne__(self, other):
         """
@@ -77,10 +121,7 @@ class Card(object):
             ``True`` or ``False``.
 
         """
-        return (
-            isinstance(other, Card) and self.value != other.value or
-            self.suit != other.suit
-        )
+        return not self.__eq__(other)
 
     def __ge__(self, other):
         """
@@ -94,16 +135,9 @@ class Card(object):
 
         """
         if isinstance(other, Card):
-            return (
-                DEFAULT_RANKS["values"][self.value] >
-                DEFAULT_RANKS["values"][other.value] or
-                (
-                    DEFAULT_RANKS["values"][self.value] >=
-                    DEFAULT_RANKS["values"][other.value] and
-                    DEFAULT_RANKS["suits"][self.suit] >=
-                    DEFAULT_RANKS["suits"][other.suit]
-                )
-            )
+            if self.ordinal is None or other.ordinal is None:
+                return self.ge(other, DEFAULT_RANKS)
+            return self.ordinal >= other.ordinal
         else:
             return False
 
@@ -119,16 +153,9 @@ class Card(object):
 
         """
         if isinstance(other, Card):
-            return (
-                DEFAULT_RANKS["values"][self.value] >
-                DEFAULT_RANKS["values"][other.value] or
-                (
-                    DEFAULT_RANKS["values"][self.value] >=
-                    DEFAULT_RANKS["values"][other.value] and
-                    DEFAULT_RANKS["suits"][self.suit] >
-                    DEFAULT_RANKS["suits"][other.suit]
-                )
-            )
+            if self.ordinal is None or other.ordinal is None:
+                return self.gt(other, DEFAULT_RANKS)
+            return self.ordinal > other.ordinal
         else:
             return False
 
@@ -140,7 +167,18 @@ class Card(object):
             A unique number, or hash for the Card.
 
         """
-        return hash((self.value, self.suit))
+        return self._hash
+
+    def __reduce__(self):
+        """
+        Allows ``Card`` instances to be pickled and copied. Interned cards
+        are restored as the shared registry instance.
+
+        :returns:
+            The callable and arguments used to rebuild the card.
+
+        """
+        return (self.__class__, (self.value, self.suit))
 
     def __repr__(self):
         """
@@ -152,6 +190,18 @@ class Card(object):
         """
         return "Card(value=%r, suit=%r)" % (self.value, self.suit)
 
+    def __setattr__(self, name, value):
+        """
+        Prevents setting attributes, since cards are immutable.
+
+        :arg str name:
+            The attribute name.
+        :arg value:
+            The value to set.
+
+        """
+        raise AttributeError("Card instances are immutable.")
+
     def __str__(self):
         """
         Returns the full name of the ``Card`` instance.
@@ -169,24 +219,16 @@ class Card(object):
 
         :arg Card other:
             The second Card to compare.
-        :arg dict ranks:
-            The ranks to refer to for comparisons.
+        :arg ranks:
+            The ranks to refer to for comparisons. Can be a rank dict, or a
+            ``Ranks`` instance.
 
         :returns:
             ``True`` or ``False``.
 
         """
-        ranks = ranks or DEFAULT_RANKS
         if isinstance(other, Card):
-            if ranks.get("suits"):
-                return (
-                    ranks["values"][self.value] ==
-                    ranks["values"][other.value] and
-                    ranks["suits"][self.suit] ==
-                    ranks["suits"][other.suit]
-                )
-            else:
-                return ranks[self.value] == ranks[other.value]
+            return compare_cards(self, other, ranks) == 0
         else:
             return False
 
@@ -198,28 +240,16 @@ class Card(object):
 
         :arg Card other:
             The second Card to compare.
-        :arg dict ranks:
-            The ranks to refer to for comparisons.
+        :arg ranks:
+            The ranks to refer to for comparisons. Can be a rank dict, or a
+            ``Ranks`` instance.
 
         :returns:
             ``True`` or ``False``.
 
         """
-        ranks = ranks or DEFAULT_RANKS
         if isinstance(other, Card):
-            if ranks.get("suits"):
-                return (
-                    ranks["values"][self.value] >
-                    ranks["values"][other.value] or
-                    (
-                        ranks["values"][self.value] >=
-                        ranks["values"][other.value] and
-                        ranks["suits"][self.suit] >=
-                        ranks["suits"][other.suit]
-                    )
-                )
-            else:
-                return ranks[self.value] >= ranks[other.value]
+            return compare_cards(self, other, ranks) >= 0
         else:
             return False
 
@@ -230,28 +260,16 @@ class Card(object):
 
         :arg Card other:
             The second Card to compare.
-        :arg dict ranks:
-            The ranks to refer to for comparisons.
+        :arg ranks:
+            The ranks to refer to for comparisons. Can be a rank dict, or a
+            ``Ranks`` instance.
 
         :returns:
             ``True`` or ``False``.
 
         """
-        ranks = ranks or DEFAULT_RANKS
         if isinstance(other, Card):
-            if ranks.get("suits"):
-                return (
-                    ranks["values"][self.value] >
-                    ranks["values"][other.value] or
-                    (
-                        ranks["values"][self.value] >=
-                        ranks["values"][other.value] and
-                        ranks["suits"][self.suit] >
-                        ranks["suits"][other.suit]
-                    )
-                )
-            else:
-                return ranks[self.value] > ranks[other.value]
+            return compare_cards(self, other, ranks) > 0
         else:
             return False
 
@@ -263,28 +281,16 @@ class Card(object):
 
         :arg Card other:
             The second Card to compare.
-        :arg dict ranks:
-            The ranks to refer to for comparisons.
+        :arg ranks:
+            The ranks to refer to for comparisons. Can be a rank dict, or a
+            ``Ranks`` instance.
 
         :returns:
             ``True`` or ``False``.
 
         """
-        ranks = ranks or DEFAULT_RANKS
         if isinstance(other, Card):
-            if ranks.get("suits"):
-                return (
-                    ranks["values"][self.value] <=
-                    ranks["values"][other.value] or
-                    (
-                        ranks["values"][self.value] <=
-                        ranks["values"][other.value] and
-                        ranks["suits"][self.suit] <=
-                        ranks["suits"][other.suit]
-                    )
-                )
-            else:
-                return ranks[self.value] <= ranks[other.value]
+            return compare_cards(self, other, ranks) <= 0
         else:
             return False
 
@@ -295,28 +301,16 @@ class Card(object):
 
         :arg Card other:
             The second Card to compare.
-        :arg dict ranks:
-            The ranks to refer to for comparisons.
+        :arg ranks:
+            The ranks to refer to for comparisons. Can be a rank dict, or a
+            ``Ranks`` instance.
 
         :returns:
             ``True`` or ``False``.
 
         """
-        ranks = ranks or DEFAULT_RANKS
         if isinstance(other, Card):
-            if ranks.get("suits"):
-                return (
-                    ranks["values"][self.value] <
-                    ranks["values"][other.value] or
-                    (
-                        ranks["values"][self.value] <=
-                        ranks["values"][other.value] and
-                        ranks["suits"][self.suit] <
-                        ranks["suits"][other.suit]
-                    )
-                )
-            else:
-                return ranks[self.value] < ranks[other.value]
+            return compare_cards(self, other, ranks) < 0
         else:
             return False
 
@@ -327,24 +321,16 @@ class Card(object):
 
         :arg Card other:
             The second Card to compare.
-        :arg dict ranks:
-            The ranks to refer to for comparisons.
+        :arg ranks:
+            The ranks to refer to for comparisons. Can be a rank dict, or a
+            ``Ranks`` instance.
 
         :returns:
             ``True`` or ``False``.
 
         """
-        ranks = ranks or DEFAULT_RANKS
         if isinstance(other, Card):
-            if ranks.get("suits"):
-                return (
-                    ranks["values"][self.value] !=
-                    ranks["values"][other.value] or
-                    ranks["suits"][self.suit] !=
-                    ranks["suits"][other.suit]
-                )
-            else:
-                return ranks[self.value] != ranks[other.value]
+            return compare_cards(self, other, ranks) != 0
         else:
             return False
 
@@ -393,4 +379,186 @@ def card_name(value, suit):
     if value == "Joker":
         return "Joker"
     else:
-        return "%s of %s" % (value, suit)
\ No newline at end of file
+        return "%s of %s" % (value, suit)
+
+
+def card_ordinal(value, suit):
+    """
+    Computes the position of a card with the given value and suit, under
+    ``DEFAULT_RANKS``. Comparing ordinals gives the same result as comparing
+    the value ranks first, and then the suit ranks.
+
+    :arg str value:
+        The value to use.
+    :arg str suit:
+        The suit to use.
+
+    :returns:
+        The ordinal, or ``None`` if the value or suit is not ranked.
+
+    """
+    try:
+        return DEFAULT.rank(value, suit)
+    except KeyError:
+        return None
+
+
+def compare_cards(card, other, ranks=None):
+    """
+    Compares the two given cards, by the given ranks. The default ranks
+    compare the card ordinals, a ``Ranks`` instance looks the keys up in its
+    table, and a rank dict is read directly, so changes to it, such as a new
+    trump suit, are always seen, without compiling it.
+
+    :arg Card card:
+        The first card.
+    :arg Card other:
+        The second card.
+    :arg ranks:
+        The ranks to refer to. Can be a rank dict, or a ``Ranks`` instance.
+        If ``None``, it will default to ``DEFAULT_RANKS``.
+
+    :returns:
+        ``-1`` if ``card`` ranks lower than ``other``, ``0`` if they rank
+        the same, and ``1`` if ``card`` ranks higher. Raises ``KeyError`` if
+        a card is not ranked.
+
+    """
+    if not ranks or ranks is DEFAULT_RANKS:
+        key, other_key = card.ordinal, other.ordinal
+        if key is not None and other_key is not None:
+            return (key > other_key) - (key < other_key)
+        ranks = DEFAULT
+
+    if isinstance(ranks, Ranks):
+        keys = ranks.keys
+        key = keys[card.code] if card.code is not None else None
+        other_key = keys[other.code] if other.code is not None else None
+        if key is None:
+            key = ranks.rank(card.value, card.suit)
+        if other_key is None:
+            other_key = ranks.rank(other.value, other.suit)
+        return (key > other_key) - (key < other_key)
+
+    values = ranks.get("values")
+    suits = ranks.get("suits")
+    if values is None and suits is None:
+        values = ranks
+
+    if values:
+        key = values[card.value]
+        other_key = values[other.value]
+        if key != other_key or not suits:
+            return (key > other_key) - (key < other_key)
+
+    if not suits:
+        return 0
+
+    key = suits[card.suit] if card.suit is not None else 0
+    other_key = suits[other.suit] if other.suit is not None else 0
+    return (key > other_key) - (key < other_key)
+
+
+def lookup_abbrev(abbrev):
+    """
+    Returns the interned card with the given abbreviation.
+
+    :arg str abbrev:
+        The card abbreviation, such as "AS", or "10H". Not case sensitive.
+
+    :returns:
+        The shared ``Card`` instance, or ``None`` if no such card is
+        registered.
+
+    """
+    return _CARDS_BY_ABBREV.get(str(abbrev).upper())
+
+
+def lookup_card(value, suit):
+    """
+    Returns the interned card with the given value and suit.
+
+    :arg str value:
+        The card value.
+    :arg str suit:
+        The card suit.
+
+    :returns:
+        The shared ``Card`` instance, or ``None`` if no such card is
+        registered.
+
+    """
+    card = _CARDS_BY_KEY.get((value, suit))
+    if card is None:
+        card = _CARDS_BY_KEY.get((
+            str(value).capitalize(),
+            str(suit).capitalize() if suit else suit
+        ))
+
+    return card
+
+
+def lookup_code(code):
+    """
+    Returns the interned card with the given integer code. Codes ``0``-``51``
+    follow the order of ``build_cards``, and the joker is ``JOKER_CODE``.
+
+    :arg int code:
+        The card code.
+
+    :returns:
+        The shared ``Card`` instance, or ``None`` if no such card is
+        registered.
+
+    """
+    if 0 <= code < len(CARDS):
+        return CARDS[code]
+
+
+def _new_card(cls, value, suit, code):
+    """
+    Builds a new ``Card`` instance, bypassing the card registry.
+
+    :arg cls:
+        The class to instantiate.
+    :arg str value:
+        The (normalized) card value.
+    :arg str suit:
+        The (normalized) card suit.
+    :arg int code:
+        The card code, or ``None`` for cards outside of the registry.
+
+    :returns:
+        The new card.
+
+    """
+    card = object.__new__(cls)
+    set_attr = object.__setattr__
+    set_attr(card, "value", value)
+    set_attr(card, "suit", suit)
+    set_attr(card, "abbrev", card_abbrev(value, suit))
+    set_attr(card, "name", card_name(value, suit))
+    set_attr(card, "code", code)
+    set_attr(card, "ordinal", card_ordinal(value, suit))
+    set_attr(card, "_hash", hash((value, suit)))
+
+    return card
+
+
+#===============================================================================
+# Card Registry
+#===============================================================================
+
+
+# Every interned card, indexed by card code.
+CARDS = tuple(
+    [_new_card(Card, value, suit, i * len(SUITS) + j)
+        for i, value in enumerate(VALUES) for j, suit in enumerate(SUITS)] +
+    [_new_card(Card, "Joker", None, JOKER_CODE)]
+)
+
+# The interned joker.
+JOKER = CARDS[JOKER_CODE]
+
+_CARDS_BY_KEY = dict(((card.value, card.suit), card) for card in CARDS)
+_CARDS_BY_ABBREV = dict((card.abbrev, card) for card in CARDS)
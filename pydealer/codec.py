@@ -0,0 +1,209 @@
+#===============================================================================
+# PyDealer - Codec
+#-------------------------------------------------------------------------------
+# Version: 1.4.0
+# Updated: 10-01-2015
+# Author: Alex Crawford
+# License: GPLv3
+#===============================================================================
+
+"""
+The codec module contains functions for converting cards to, and from their
+integer codes, and bitmasks. Codes ``0``-``51`` follow the order of
+``build_cards``, and the joker is ``JOKER_CODE``. A bitmask has the bit
+``1 << code`` set for each card it contains, so set operations on hands, such
+as membership tests, or dead card exclusion, are a single ``&``, or ``|``.
+
+The byte encoding, from ``to_bytes``, is one byte per card, holding its code,
+in the order of the cards. It is the canonical form of a stack's order, for
+hashing, or storing it, and is 52 bytes for a standard deck.
+
+"""
+
+
+#===============================================================================
+# Imports
+#===============================================================================
+
+from pydealer.card import CARDS
+from pydealer.const import JOKER_CODE
+
+
+#===============================================================================
+# Constants
+#===============================================================================
+
+# Bitmask of the 52 cards of a standard deck.
+DECK_MASK = (1 << JOKER_CODE) - 1
+
+# Bitmask of the joker.
+JOKER_MASK = 1 << JOKER_CODE
+
+
+#===============================================================================
+# Codec Functions
+#===============================================================================
+
+def count_mask(mask):
+    """
+    Counts the cards in the given bitmask.
+
+    :arg int mask:
+        The bitmask to count.
+
+    :returns:
+        The number of cards in the bitmask.
+
+    """
+    return bin(mask).count("1")
+
+
+def from_bytes(data):
+    """
+    Converts the given byte encoding back to cards.
+
+    :arg bytes data:
+        The encoded cards, as returned by ``to_bytes``.
+
+    :returns:
+        A list of the shared ``Card`` instances, in the encoded order.
+
+    """
+    return from_codes(bytearray(data))
+
+
+def from_code(code):
+    """
+    Returns the card with the given code.
+
+    :arg int code:
+        The card code.
+
+    :returns:
+        The shared ``Card`` instance for the code.
+
+    """
+    if 0 <= code < len(CARDS):
+        return CARDS[code]
+    else:
+        raise ValueError("Invalid card code: %r" % (code,))
+
+
+def from_codes(codes):
+    """
+    Converts the given card codes to cards.
+
+    :arg codes:
+        An iterable of card codes.
+
+    :returns:
+        A list of the shared ``Card`` instances for the codes.
+
+    """
+    codes = list(codes)
+    if codes and (min(codes) < 0 or max(codes) >= len(CARDS)):
+        return [from_code(code) for code in codes]
+
+    return [CARDS[code] for code in codes]
+
+
+def from_mask(mask):
+    """
+    Converts the given bitmask to cards.
+
+    :arg int mask:
+        The bitmask to convert.
+
+    :returns:
+        A list of the cards in the bitmask, in code order.
+
+    """
+    if mask >> len(CARDS):
+        raise ValueError("Invalid card mask: %r" % (mask,))
+
+    cards = []
+
+    while mask:
+        low = mask & -mask
+        cards.append(CARDS[low.bit_length() - 1])
+        mask ^= low
+
+    return cards
+
+
+def to_bytes(cards):
+    """
+    Encodes the order of the given cards, one byte per card code. The codes
+    of a ``Shoe`` are copied directly, without going through the cards.
+
+    :arg cards:
+        The cards to encode. Can be a ``Stack``, ``Deck``, or ``list``.
+
+    :returns:
+        The encoded cards, as ``bytes``.
+
+    """
+    # A stack shuffled lazily fixes its order, when its cards are fetched.
+    store = getattr(cards, "cards", cards)
+    codes = getattr(store, "codes", None)
+    if codes is None:
+        codes = bytearray(to_codes(store))
+
+    return bytes(codes)
+
+
+def to_code(card):
+    """
+    Returns the code of the given card.
+
+    :arg Card card:
+        The card to encode.
+
+    :returns:
+        The card code.
+
+    """
+    code = card.code
+    if code is None:
+        raise ValueError("Card has no code: %r" % (card,))
+
+    return code
+
+
+def to_codes(cards):
+    """
+    Converts the given cards to card codes.
+
+    :arg cards:
+        The cards to convert. Can be a ``Stack``, ``Deck``, or ``list``.
+
+    :returns:
+        A list of the card codes, in the same order as the cards.
+
+    """
+    codes = [card.code for card in cards]
+    if None in codes:
+        raise ValueError("Card has no code: %r" % (
+            list(cards)[codes.index(None)],))
+
+    return codes
+
+
+def to_mask(cards):
+    """
+    Converts the given cards to a bitmask. Cards that appear more than once
+    (such as in multi-deck stacks) are only counted once.
+
+    :arg cards:
+        The cards to convert. Can be a ``Stack``, ``Deck``, or ``list``.
+
+    :returns:
+        The bitmask of the cards.
+
+    """
+    mask = 0
+
+    for code in to_codes(cards):
+        mask |= 1 << code
+
+    return mask
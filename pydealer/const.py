@@ -24,6 +24,10 @@ SUITS = ["Diamonds", "Clubs", "Hearts", "Spades"]
 VALUES = ["2", "3", "4", "5", "6", "7", "8", "9","10",
          "Jack", "Queen", "King", "Ace"]
 
+# Integer card codes. Codes 0-51 follow the order of ``build_cards`` (value
+# major, suit minor), and the joker takes the code after them.
+JOKER_CODE = len(VALUES) * len(SUITS)
+
 #===============================================================================
 # Card Rank Dicts
 #===============================================================================
@@ -83,4 +87,13 @@ DEFAULT_RANKS = {
 
 # Stack/Deck ends.
 TOP = "top"
-BOTTOM = "bottom"
\ No newline at end of file
+BOTTOM = "bottom"
+
+# Deal orders, for ``Deck.deal_hands``.
+ROUND_ROBIN = "round_robin"
+BLOCK = "block"
+
+# Shuffle methods, for ``Stack.shuffle``. See the ``shuffles`` module.
+RIFFLE = "riffle"
+OVERHAND = "overhand"
+STRIP = "strip"
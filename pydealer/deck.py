@@ -19,15 +19,21 @@ a subclass of the ``Stack`` class, with a few extra/differing methods.
 # Imports
 #===============================================================================
 
-from collections import deque
-
+from pydealer.codec import to_codes
 from pydealer.const import (
-    BOTTOM,
-    DEFAULT_RANKS,
+    BLOCK,
+    ROUND_ROBIN,
     TOP
 )
+from pydealer.rng import (
+    CounterRNG,
+    make_randbelow
+)
 from pydealer.stack import Stack
-from pydealer.tools import build_cards
+from pydealer.tools import (
+    STANDARD_CARDS,
+    deck_template
+)
 
 # Dirty little try/except, to make PyDealer work with Python 3.
 try:
@@ -36,6 +42,10 @@ except:
     xrange = range
 
 
+# The keyword arguments that ``Deck`` takes the fast path for.
+_BUILD_KWARGS = {"build": True}
+
+
 #===============================================================================
 # Deck Class
 #===============================================================================
@@ -65,9 +75,24 @@ class Deck(Stack):
         cards due to dealing.
     :arg bool re_shuffle:
         Whether or not to shuffle the deck after rebuilding.
-    :arg dict ranks:
-        The rank dict that will be referenced by the sorting
-        methods etc. Defaults to ``DEFAULT_RANKS``
+    :arg ranks:
+        The rank dict, or ``Ranks`` instance that will be referenced by the
+        sorting methods etc. Defaults to ``DEFAULT_RANKS``
+    :arg store:
+        The type of container to hold the cards in. Defaults to
+        ``collections.deque``. See the ``store`` module for the alternatives.
+    :arg bool indexed:
+        Whether or not to keep a membership index of the cards, which makes
+        ``in`` checks, and ``Deck.count`` O(1).
+    :arg bool lazy_shuffle:
+        Whether or not to shuffle lazily. If ``True``, ``Deck.shuffle`` only
+        marks the deck as shuffled, and each card is picked at random as it
+        is dealt.
+    :arg rng:
+        The random number generator for shuffling, and dealing at random.
+        Can be any ``random.Random`` compatible object, a NumPy
+        ``Generator``, or an int seed. Defaults to the global ``random``
+        module.
 
     """
     def __init__(self, **kwargs):
@@ -75,16 +100,22 @@ class Deck(Stack):
         Deck constructor method.
 
         """
-        self._cards = deque(kwargs.get("cards", []))
+        # Fast path for a plain, standard deck, which is just a copy of the
+        # deck template.
+        fast = type(self) is Deck and (not kwargs or kwargs == _BUILD_KWARGS)
+
+        if fast:
+            self._setup(STANDARD_CARDS)
+        else:
+            Stack.__init__(self, **kwargs)
 
         self.jokers = kwargs.get("jokers", False)
         self.num_jokers = kwargs.get("num_jokers", 0)
         self.rebuild = kwargs.get("rebuild", False)
         self.re_shuffle = kwargs.get("re_shuffle", False)
-        self.ranks = kwargs.get("ranks", DEFAULT_RANKS)
-        self.decks_used = 0
+        self.decks_used = 1 if fast else 0
 
-        if kwargs.get("build", True):
+        if not fast and kwargs.get("build", True):
             self.build()
 
     def __add__(self, other):
@@ -100,10 +131,11 @@ class Deck(Stack):
 
         """
         try:
-            new_deck = Deck(cards=(list(self.cards) + list(other.cards)),
-                build=False)
+            new_deck = Deck(cards=(list(self._fixed_cards()) +
+                list(other.cards)), build=False)
         except:
-            new_deck = Deck(cards=list(self.cards) + other, build=False)
+            new_deck = Deck(cards=list(self._fixed_cards()) + other,
+                build=False)
 
         return new_deck
 
@@ -115,24 +147,124 @@ class Deck(Stack):
             A string representation of the Deck instance.
 
         """
-        return "Deck(cards=%r)" % (self.cards)
+        return "Deck(cards=%r)" % (self._fixed_cards())
 
-    def build(self, jokers=False, num_jokers=0):
+    def _build_cards(self, jokers=False, num_jokers=0):
         """
-        Builds a standard 52 card French deck of Card instances.
+        Returns the cards for one build of the deck, and counts the decks
+        used.
 
         :arg bool jokers:
             Whether or not to include jokers in the deck.
         :arg int num_jokers:
             The number of jokers to include.
 
+        :returns:
+            A tuple of the cards.
+
         """
         jokers = jokers or self.jokers
         num_jokers = num_jokers or self.num_jokers
 
         self.decks_used += 1
 
-        self.cards += build_cards(jokers, num_jokers)
+        return deck_template(jokers, num_jokers)
+
+    def _stream(self, pool, size=None, codes=False):
+        """
+        The generator behind ``stream``.
+
+        :arg list pool:
+            The cards, or card codes left in the pool.
+        :arg int size:
+            The number of cards in each chunk, or ``None`` for single cards.
+        :arg bool codes:
+            Whether or not the pool holds card codes.
+
+        :returns:
+            A generator of cards, or chunks of cards.
+
+        """
+        randbelow = make_randbelow(self.rng)
+
+        def refill():
+            cards = self._build_cards()
+            return to_codes(cards) if codes else list(cards)
+
+        # Each card is swapped with the last card of the pool, so it can be
+        # popped off the end.
+        if size is None:
+            while True:
+                n = len(pool)
+                if not n:
+                    pool = refill()
+                    n = len(pool)
+                i = randbelow(n)
+                card = pool[i]
+                pool[i] = pool[-1]
+                pool.pop()
+                yield card
+        else:
+            while True:
+                chunk = [None] * size
+                for j in xrange(size):
+                    n = len(pool)
+                    if not n:
+                        pool = refill()
+                        n = len(pool)
+                    i = randbelow(n)
+                    chunk[j] = pool[i]
+                    pool[i] = pool[-1]
+                    pool.pop()
+                yield chunk
+
+    def _deal_cards(self, num, end=TOP, rebuild=False, shuffle=False):
+        """
+        Removes up to ``num`` cards from the given end of the deck. If the
+        deck runs out, and rebuilding is on, the deck is rebuilt (and
+        shuffled, if re-shuffling is on), and dealing carries on, so exactly
+        ``num`` cards are dealt.
+
+        :arg int num:
+            The number of cards to deal.
+        :arg str end:
+            Which end to deal from. Can be ``TOP`` or ``BOTTOM``.
+        :arg bool rebuild:
+            Whether or not to rebuild the deck when cards run out.
+        :arg bool shuffle:
+            Whether or not to shuffle on rebuild.
+
+        :returns:
+            A list of the dealt cards, in the order they were dealt.
+
+        """
+        rebuild = rebuild or self.rebuild
+        re_shuffle = shuffle or self.re_shuffle
+
+        dealt_cards = Stack._deal_cards(self, num, end)
+
+        while rebuild and len(dealt_cards) < num:
+            self.build()
+            if re_shuffle:
+                self.shuffle()
+            dealt_cards += Stack._deal_cards(self, num - len(dealt_cards), end)
+
+        return dealt_cards
+
+    def build(self, jokers=False, num_jokers=0):
+        """
+        Builds a standard 52 card French deck of Card instances.
+
+        :arg bool jokers:
+            Whether or not to include jokers in the deck.
+        :arg int num_jokers:
+            The number of jokers to include.
+
+        """
+        cards = self._build_cards(jokers, num_jokers)
+
+        self._cards.extend(cards)
+        self._added(cards, TOP)
 
     def deal(self, num=1, rebuild=False, shuffle=False, end=TOP):
         """
@@ -152,35 +284,180 @@ class Deck(Stack):
             A given number of cards from the deck.
 
         """
-        _num = num
+        return Stack(cards=self._deal_cards(num, end, rebuild, shuffle))
 
-        rebuild = rebuild or self.rebuild
-        re_shuffle = shuffle or self.re_shuffle
+    def deal_codes(self, num=1, rebuild=False, shuffle=False, end=TOP):
+        """
+        Deals cards from the deck, and returns their card codes, instead of
+        a new ``Stack``.
+
+        :arg int num:
+            The number of cards to deal.
+        :arg bool rebuild:
+            Whether or not to rebuild the deck when cards run out.
+        :arg bool shuffle:
+            Whether or not to shuffle on rebuild.
+        :arg str end:
+            Which end to deal from. Can be ``TOP`` ("top") or ``BOTTOM``
+            ("bottom").
+
+        :returns:
+            A tuple of the card codes of the dealt cards.
+
+        """
+        return tuple(to_codes(self._deal_cards(num, end, rebuild, shuffle)))
+
+    def deal_hands(self, num_players, num_cards, order=ROUND_ROBIN,
+            hands=None, codes=False, rebuild=False, shuffle=False, end=TOP):
+        """
+        Deals a hand of ``num_cards`` cards to each of ``num_players``
+        players, in one call. All of the cards are dealt from the deck at
+        once, and then split into the hands. If the deck runs out, and is not
+        rebuilt, the later cards of the deal are missing, so some hands may
+        end up short.
+
+        :arg int num_players:
+            The number of hands to deal.
+        :arg int num_cards:
+            The number of cards to deal to each hand.
+        :arg str order:
+            The order to deal in. ``ROUND_ROBIN`` ("round_robin") deals one
+            card to each hand in turn, like a dealer at a table. ``BLOCK``
+            ("block") deals each hand all of its cards, before moving on to
+            the next hand.
+        :arg list hands:
+            Optional. A list of ``num_players`` existing ``Stack`` instances
+            to deal the cards into, instead of creating new ones.
+        :arg bool codes:
+            Whether or not to return the hands as tuples of card codes,
+            instead of ``Stack`` instances. Can not be combined with
+            ``hands``.
+        :arg bool rebuild:
+            Whether or not to rebuild the deck when cards run out.
+        :arg bool shuffle:
+            Whether or not to shuffle on rebuild.
+        :arg str end:
+            Which end to deal from. Can be ``TOP`` ("top") or ``BOTTOM``
+            ("bottom").
+
+        :returns:
+            A list of the hands. Either the given ``hands``, new ``Stack``
+            instances, or tuples of card codes.
+
+        """
+        if order == ROUND_ROBIN:
+            bounds = [
+                (i, None, num_players) for i in xrange(num_players)
+            ]
+        elif order == BLOCK:
+            bounds = [
+                (i * num_cards, (i + 1) * num_cards, 1)
+                for i in xrange(num_players)
+            ]
+        else:
+            raise ValueError("Invalid order: %r" % (order,))
+
+        if hands is not None:
+            if codes:
+                raise ValueError("Can not deal codes into hands.")
+            if len(hands) != num_players:
+                raise ValueError("Expected %d hands, got %d." % (num_players,
+                    len(hands)))
+
+        dealt_cards = self._deal_cards(num_players * num_cards, end,
+            rebuild, shuffle)
+
+        if codes:
+            dealt_codes = tuple(to_codes(dealt_cards))
+            return [dealt_codes[i:j:k] for i, j, k in bounds]
+        elif hands is not None:
+            for hand, (i, j, k) in zip(hands, bounds):
+                hand.add(dealt_cards[i:j:k])
+            return hands
+        else:
+            return [Stack(cards=dealt_cards[i:j:k]) for i, j, k in bounds]
+
+    def deal_into(self, target, num=1, rebuild=False, shuffle=False,
+            end=TOP):
+        """
+        Deals cards from the deck straight into the given ``Stack`` (such as
+        a hand), without creating a new ``Stack`` for them.
+
+        :arg Stack target:
+            The stack to deal the cards into.
+        :arg int num:
+            The number of cards to deal.
+        :arg bool rebuild:
+            Whether or not to rebuild the deck when cards run out.
+        :arg bool shuffle:
+            Whether or not to shuffle on rebuild.
+        :arg str end:
+            Which end to deal from. Can be ``TOP`` ("top") or ``BOTTOM``
+            ("bottom").
+
+        :returns:
+            The number of cards dealt.
+
+        """
+        dealt_cards = self._deal_cards(num, end, rebuild, shuffle)
+        target.add(dealt_cards)
+
+        return len(dealt_cards)
+
+    @classmethod
+    def from_seed(cls, seed, index=0, **kwargs):
+        """
+        Returns shuffled deck number ``index`` of the given seed. The deck
+        is shuffled with stream ``index`` of a ``CounterRNG``, which is kept
+        as the deck's ``rng``, so any deck of a seed can be made directly,
+        without making the decks before it, and the same seed, and index
+        always give the same deck, and the same deals from it.
+
+        :arg seed:
+            The seed. Can be an int, str, or bytes.
+        :arg int index:
+            The deck number, from ``0`` to ``2 ** 64 - 1``.
+
+        The other arguments are passed on to the constructor, except for
+        ``rng``.
+
+        :returns:
+            The shuffled deck.
+
+        """
+        kwargs["rng"] = CounterRNG(seed, index)
+        deck = cls(**kwargs)
+        deck.shuffle()
+
+        return deck
+
+    def stream(self, size=None, codes=False):
+        """
+        Returns an endless stream of cards, like a continuous shuffling
+        machine. The cards of the deck are moved into the pool of the
+        stream, leaving the deck empty, and each card is drawn at random from
+        the pool, in O(1). When the pool runs out, it is refilled with the
+        cards of a new build of the deck, without building any new ``Card``
+        instances, and without shuffling.
+
+        :arg int size:
+            Optional. The number of cards in each chunk. If given, the stream
+            produces lists of ``size`` cards, instead of single cards.
+        :arg bool codes:
+            Whether or not to produce card codes, instead of ``Card``
+            instances.
+
+        :returns:
+            A generator of cards, or lists of cards.
+
+        """
+        pool = list(self._cards)
+        self.empty()
+
+        if codes:
+            pool = to_codes(pool)
 
-        self_size = self.size
-
-        if rebuild or num <= self_size:
-            dealt_cards = [None] * num
-        elif num > self_size:
-            dealt_cards = [None] * self_size
-
-        while num > 0:
-            ends = {TOP: self.cards.pop, BOTTOM: self.cards.popleft}
-            n = _num - num
-            try:
-                card = ends[end]()
-                dealt_cards[n] = card
-                num -= 1
-            except:
-                if self.size == 0:
-                    if rebuild:
-                        self.build()
-                        if re_shuffle:
-                            self.shuffle()
-                    else:
-                        break
-
-        return Stack(cards=dealt_cards)
+        return self._stream(pool, size, codes)
 
 
 #===============================================================================
@@ -0,0 +1,235 @@
+#===============================================================================
+# PyDealer - Provably Fair Shuffles
+#-------------------------------------------------------------------------------
+# Version: 1.4.0
+# Updated: 10-01-2015
+# Author: Alex Crawford
+# License: GPLv3
+#===============================================================================
+
+"""
+This module contains the functions for provably fair shuffles. The order of
+each deck is derived from a secret server seed, a client seed, and a nonce
+(the deck number), so it can be checked by the players, once the server seed
+is revealed.
+
+Before a hand is dealt, the server publishes the commitment of the deck,
+from ``commit``, which is the SHA-256 hash of the deck order, salted with
+the secret seed. After the hand, the server seed is revealed, and anyone can
+check the deck with ``verify``. Commitments for many decks are made at once
+with ``commit_many``, or ``commit_orders``, which hash the byte encoding of
+each deck, from ``codec.to_bytes``, without building any strings.
+
+"""
+
+
+#===============================================================================
+# Imports
+#===============================================================================
+
+from hashlib import sha256
+import hmac
+from struct import Struct
+
+from pydealer.codec import to_bytes
+from pydealer.const import JOKER_CODE
+from pydealer.deck import Deck
+from pydealer.rng import CounterRNG
+
+
+#===============================================================================
+# Constants
+#===============================================================================
+
+# The nonce, as it is hashed into the commitments.
+_NONCE = Struct("<Q")
+
+
+#===============================================================================
+# Fair Functions
+#===============================================================================
+
+def _seed_bytes(seed):
+    """
+    Converts the given seed to bytes.
+
+    :arg seed:
+        The seed. Can be a str, or bytes.
+
+    :returns:
+        The seed, as bytes.
+
+    """
+    if isinstance(seed, bytes):
+        return seed
+    elif isinstance(seed, str):
+        return seed.encode("utf-8")
+    else:
+        raise TypeError("Invalid seed type: %r" % (type(seed),))
+
+
+def commit(server_seed, client_seed, nonce=0, **kwargs):
+    """
+    Returns the fair deck of the given seeds, and nonce, with its
+    commitment, to publish before the deck is dealt.
+
+    :arg server_seed:
+        The server seed, which is kept secret until after the hand. Can be a
+        str, or bytes.
+    :arg client_seed:
+        The client seed. Can be a str, or bytes.
+    :arg int nonce:
+        The deck number, from ``0`` to ``2 ** 64 - 1``.
+
+    The other arguments are passed on to the ``Deck`` constructor.
+
+    :returns:
+        A tuple of the shuffled ``Deck``, and its commitment, as a hex str.
+
+    """
+    seed = fair_seed(server_seed, client_seed)
+    deck = Deck.from_seed(seed, nonce, **kwargs)
+    hasher = sha256(seed)
+    hasher.update(_NONCE.pack(nonce))
+    hasher.update(to_bytes(deck))
+
+    return deck, hasher.hexdigest()
+
+
+def commit_many(server_seed, client_seed, nonces):
+    """
+    Returns the commitments of the fair decks of the given seeds, for each
+    of the given nonces. The decks are standard 52 card decks, shuffled as
+    card codes, without making ``Deck`` instances, and each commitment is
+    the same as the one from ``commit``.
+
+    :arg server_seed:
+        The server seed. Can be a str, or bytes.
+    :arg client_seed:
+        The client seed. Can be a str, or bytes.
+    :arg nonces:
+        An iterable of the deck numbers.
+
+    :returns:
+        A list of the commitments, as hex strs, in the order of the nonces.
+
+    """
+    seed = fair_seed(server_seed, client_seed)
+    base = sha256(seed)
+    template = list(range(JOKER_CODE))
+    pack = _NONCE.pack
+    commitments = []
+
+    for nonce in nonces:
+        codes = template[:]
+        CounterRNG(seed, nonce).shuffle(codes)
+        hasher = base.copy()
+        hasher.update(pack(nonce))
+        hasher.update(bytearray(codes))
+        commitments.append(hasher.hexdigest())
+
+    return commitments
+
+
+def commit_orders(orders, salt=b""):
+    """
+    Returns the commitments of the given deck orders, which have already
+    been shuffled, such as the decks of a ``DeckBatch``. Each commitment is
+    the SHA-256 hash of the salt, followed by the byte encoding of the order.
+
+    :arg orders:
+        The deck orders. Can be an iterable of ``bytes``, from
+        ``codec.to_bytes``, or of ``Stack``, or ``Deck`` instances, or a 2D
+        NumPy array of card codes, with one deck per row.
+    :arg salt:
+        The salt, which should be kept secret until the orders are revealed.
+        Can be a str, or bytes.
+
+    :returns:
+        A list of the commitments, as hex strs, in the order of the decks.
+
+    """
+    base = sha256(_seed_bytes(salt))
+
+    # A NumPy array is encoded all at once, and split into rows.
+    if getattr(orders, "ndim", 1) == 2:
+        width = orders.shape[1]
+        data = memoryview(orders.astype("uint8").tobytes())
+        orders = [data[i:i + width] for i in range(0, len(data), width)]
+
+    commitments = []
+
+    for order in orders:
+        if not isinstance(order, (bytes, bytearray, memoryview)):
+            order = to_bytes(order)
+        hasher = base.copy()
+        hasher.update(order)
+        commitments.append(hasher.hexdigest())
+
+    return commitments
+
+
+def fair_deck(server_seed, client_seed, nonce=0, **kwargs):
+    """
+    Returns the fair deck of the given seeds, and nonce. It is deck number
+    ``nonce`` of the seed from ``fair_seed``, as made by ``Deck.from_seed``.
+
+    :arg server_seed:
+        The server seed. Can be a str, or bytes.
+    :arg client_seed:
+        The client seed. Can be a str, or bytes.
+    :arg int nonce:
+        The deck number, from ``0`` to ``2 ** 64 - 1``.
+
+    The other arguments are passed on to the ``Deck`` constructor.
+
+    :returns:
+        The shuffled ``Deck``.
+
+    """
+    return Deck.from_seed(fair_seed(server_seed, client_seed), nonce,
+        **kwargs)
+
+
+def fair_seed(server_seed, client_seed):
+    """
+    Derives the shuffle seed of the given seeds, as the HMAC-SHA256 of the
+    client seed, keyed with the server seed.
+
+    :arg server_seed:
+        The server seed. Can be a str, or bytes.
+    :arg client_seed:
+        The client seed. Can be a str, or bytes.
+
+    :returns:
+        The seed, as 32 bytes.
+
+    """
+    return hmac.new(_seed_bytes(server_seed), _seed_bytes(client_seed),
+        sha256).digest()
+
+
+def verify(commitment, server_seed, client_seed, nonce=0, **kwargs):
+    """
+    Checks the given commitment, against the fair deck of the revealed
+    server seed, the client seed, and the nonce.
+
+    :arg str commitment:
+        The published commitment.
+    :arg server_seed:
+        The revealed server seed. Can be a str, or bytes.
+    :arg client_seed:
+        The client seed. Can be a str, or bytes.
+    :arg int nonce:
+        The deck number.
+
+    The other arguments are passed on to the ``Deck`` constructor, and
+    should be the same as those given to ``commit``.
+
+    :returns:
+        ``True`` if the commitment matches, and ``False`` if not.
+
+    """
+    expected = commit(server_seed, client_seed, nonce, **kwargs)[1]
+
+    return hmac.compare_digest(expected, commitment)
@@ -0,0 +1,211 @@
+#===============================================================================
+# PyDealer - Ranks
+#-------------------------------------------------------------------------------
+# Version: 1.4.0
+# Updated: 10-01-2015
+# Author: Alex Crawford
+# License: GPLv3
+#===============================================================================
+
+"""
+This module contains the ``Ranks`` class, which compiles a rank dict (such as
+``DEFAULT_RANKS``, ``POKER_RANKS``, or ``BIG2_RANKS``) into a flat table of
+sort keys, indexed by card code. The sorting and comparison functions in
+PyDealer accept either a rank dict, or a ``Ranks`` instance. Rank dicts are
+compiled once, and the result is cached, until the rank dict is changed.
+
+"""
+
+
+#===============================================================================
+# Imports
+#===============================================================================
+
+from pydealer.const import (
+    DEFAULT_RANKS,
+    SUITS,
+    VALUES
+)
+
+
+#===============================================================================
+# Ranks Class
+#===============================================================================
+
+class Ranks(object):
+    """
+    A compiled rank dict. Each card gets a single sort key, which orders
+    cards by value rank first, and then by suit rank, the same way as the
+    rank dict does.
+
+    :arg dict ranks:
+        The rank dict to compile. Can have a ``"values"`` key, a ``"suits"``
+        key, or both. A dict with neither key is treated as a flat dict of
+        value ranks.
+
+    """
+    def __init__(self, ranks):
+        """
+        Ranks constructor method.
+
+        :arg dict ranks:
+            The rank dict to compile.
+
+        """
+        values = ranks.get("values")
+        suits = ranks.get("suits")
+
+        if "values" not in ranks and "suits" not in ranks:
+            values = ranks
+
+        self.source = ranks
+        self.values = values or None
+        self.suits = suits or None
+
+        if self.suits:
+            suit_ranks = list(self.suits.values()) + [0]
+            self._suit_base = min(suit_ranks)
+            self._suit_span = max(suit_ranks) - self._suit_base + 1
+            self._int_keys = all(
+                isinstance(rank, int) for rank in suit_ranks +
+                list((self.values or {}).values())
+            )
+
+        keys = []
+        for value, suit in _CARD_KEYS:
+            try:
+                keys.append(self.rank(value, suit))
+            except KeyError:
+                keys.append(None)
+
+        self.keys = tuple(keys)
+
+    def __repr__(self):
+        """
+        Returns a string representation of the ``Ranks`` instance.
+
+        :returns:
+            A string representation of the Ranks instance.
+
+        """
+        return "Ranks(%r)" % (self.source,)
+
+    def key(self, card):
+        """
+        Returns the sort key of the given card.
+
+        :arg Card card:
+            The card to get the key for.
+
+        :returns:
+            The sort key of the card.
+
+        """
+        code = card.code
+        if code is not None:
+            key = self.keys[code]
+            if key is not None:
+                return key
+
+        return self.rank(card.value, card.suit)
+
+    def rank(self, value, suit):
+        """
+        Computes the sort key for a card with the given value and suit.
+
+        :arg str value:
+            The card value.
+        :arg str suit:
+            The card suit.
+
+        :returns:
+            The sort key. Raises ``KeyError`` if the value, or suit is not
+            in the rank dict.
+
+        """
+        value_rank = self.values[value] if self.values else 0
+
+        if not self.suits:
+            return value_rank
+
+        suit_rank = self.suits[suit] if suit is not None else 0
+
+        if self._int_keys:
+            return (
+                value_rank * self._suit_span + suit_rank - self._suit_base
+            )
+        else:
+            return (value_rank, suit_rank)
+
+
+#===============================================================================
+# Helper Functions
+#===============================================================================
+
+def _snapshot(ranks):
+    """
+    Returns a copy of the given rank dict, and of the dicts nested in it, to
+    check whether the rank dict has been changed since it was compiled.
+
+    :arg dict ranks:
+        The rank dict to copy.
+
+    :returns:
+        The copy of the rank dict.
+
+    """
+    return dict(
+        (key, dict(item) if isinstance(item, dict) else item)
+        for key, item in ranks.items()
+    )
+
+
+def compile_ranks(ranks=None):
+    """
+    Compiles the given rank dict into a ``Ranks`` instance. The result is
+    cached, so each rank dict is only compiled once, unless it is changed,
+    such as when the trump suit changes between hands, in which case it is
+    compiled again.
+
+    :arg dict ranks:
+        The rank dict to compile. If ``None``, it will default to
+        ``DEFAULT_RANKS``. If it is already a ``Ranks`` instance, it is
+        returned as is.
+
+    :returns:
+        The compiled ``Ranks`` instance.
+
+    """
+    if isinstance(ranks, Ranks):
+        return ranks
+
+    ranks = ranks or DEFAULT_RANKS
+
+    cached = _COMPILED.get(id(ranks))
+    if cached is not None and cached[1] == ranks:
+        return cached[2]
+
+    if len(_COMPILED) >= _COMPILED_LIMIT:
+        _COMPILED.clear()
+    snapshot = _snapshot(ranks)
+    compiled = Ranks(snapshot)
+    # Keep a reference to the dict, so that its id is not reused, and a
+    # copy of it, to check it against.
+    _COMPILED[id(ranks)] = (ranks, snapshot, compiled)
+    return compiled
+
+
+#===============================================================================
+# Compiled Ranks
+#===============================================================================
+
+# The value & suit of each card, indexed by card code.
+_CARD_KEYS = [
+    (value, suit) for value in VALUES for suit in SUITS
+] + [("Joker", None)]
+
+# Compiled rank dicts, keyed by the id of the dict, with a copy of the dict.
+_COMPILED = {}
+_COMPILED_LIMIT = 256
+
+DEFAULT = compile_ranks(DEFAULT_RANKS)
@@ -0,0 +1,680 @@
+#===============================================================================
+# PyDealer - Random Number Generators
+#-------------------------------------------------------------------------------
+# Version: 1.4.0
+# Updated: 10-01-2015
+# Author: Alex Crawford
+# License: GPLv3
+#===============================================================================
+
+"""
+This module contains the helpers for the random number generators used for
+shuffling, and dealing at random. A ``Stack``, or ``Deck`` can be given its
+own generator with the ``rng`` argument, which can be any ``random.Random``
+compatible object, a NumPy ``Generator``, or an int seed. Without one, the
+global ``random`` module is used.
+
+For parallel work, ``spawn_rngs`` derives independent child generators from
+a seed, or a generator, so each worker gets its own reproducible stream.
+``CounterRNG`` is a counter based generator, where every stream of a seed
+can be started directly, without generating the streams before it, so
+shuffled deck number ``N`` of a seed is always the same, wherever it is
+dealt. ``SecureRNG`` is a cryptographically secure generator, for dealing
+real money games.
+
+"""
+
+
+#===============================================================================
+# Imports
+#===============================================================================
+
+from hashlib import blake2b
+import os
+import random
+from struct import Struct
+import threading
+import weakref
+
+# NumPy is optional. It is only needed for NumPy generators.
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+#===============================================================================
+# Constants
+#===============================================================================
+
+# The number of floats fetched from a NumPy generator at a time.
+NUMPY_BUFFER_SIZE = 1024
+
+# The largest stream index, or block counter of a CounterRNG.
+MAX_INDEX = (1 << 64) - 1
+
+# Masks the low 64 bits of an int.
+_WORD_MASK = (1 << 64) - 1
+
+# Packs the stream index, and block counter of a CounterRNG block.
+_BLOCK = Struct("<QQ")
+
+# Unpacks a 64 byte CounterRNG block into 64 bit words.
+_WORDS = Struct("<8Q")
+
+# The number of bytes read from os.urandom at a time by a SecureRNG.
+SECURE_BUFFER_SIZE = 4096
+
+# Scales a 53 bit int to a float in [0, 1).
+_FLOAT_SCALE = 2.0 ** -53
+
+
+#===============================================================================
+# WordRNG Class
+#===============================================================================
+
+class _WordRNG(random.Random):
+    """
+    The base class of the generators that produce their output as blocks of
+    64 bit words. Subclasses add the words to the ``_words`` buffer in
+    ``_refill``, and the words are used from the end of the buffer.
+
+    """
+    def _refill(self):
+        """
+        Adds the next block of words to the word buffer.
+
+        """
+        raise NotImplementedError
+
+    def _randbelow(self, n):
+        """
+        Returns a random int, in the range [0, n), with Lemire's multiply,
+        and shift method, which is exactly uniform. Used by ``randrange``,
+        and ``choice``.
+
+        :arg int n:
+            The end of the range.
+
+        :returns:
+            The int.
+
+        """
+        if n > _WORD_MASK:
+            k = n.bit_length()
+            num = self.getrandbits(k)
+            while num >= n:
+                num = self.getrandbits(k)
+            return num
+
+        return _lemire(self._words, self._refill, n)
+
+    def getrandbits(self, k):
+        """
+        Returns an int with ``k`` random bits.
+
+        :arg int k:
+            The number of bits.
+
+        :returns:
+            The int.
+
+        """
+        if k < 0:
+            raise ValueError("number of bits must be non-negative")
+
+        words = self._words
+        bits = 0
+        num = 0
+
+        while bits < k:
+            if not words:
+                self._refill()
+            num = (num << 64) | words.pop()
+            bits += 64
+
+        return num >> (bits - k)
+
+    def random(self):
+        """
+        Returns a random float, in the range [0, 1).
+
+        :returns:
+            The float.
+
+        """
+        words = self._words
+        if not words:
+            self._refill()
+
+        return (words.pop() >> 11) * _FLOAT_SCALE
+
+    def shuffle(self, x):
+        """
+        Shuffles the given mutable sequence in place, with a Fisher-Yates
+        shuffle. Each swap index is taken from a 64 bit word with Lemire's
+        multiply, and shift method, which is exactly uniform, and only
+        rarely needs a second word.
+
+        :arg x:
+            The sequence to shuffle. Can be a ``list``, or ``deque``.
+
+        """
+        words = self._words
+        refill = self._refill
+
+        for i in range(len(x) - 1, 0, -1):
+            num = i + 1
+            if not words:
+                refill()
+            product = words.pop() * num
+            if (product & _WORD_MASK) < num:
+                threshold = (1 << 64) % num
+                while (product & _WORD_MASK) < threshold:
+                    if not words:
+                        refill()
+                    product = words.pop() * num
+            j = product >> 64
+            x[i], x[j] = x[j], x[i]
+
+
+#===============================================================================
+# CounterRNG Class
+#===============================================================================
+
+class CounterRNG(_WordRNG):
+    """
+    A counter based random number generator. Each 64 byte block of output
+    is the keyed BLAKE2b hash of the stream index, and a block counter, with
+    a key derived from the seed. So any stream of a seed can be started
+    directly, in O(1), and streams can be handed out to separate processes,
+    without them having to share anything but the seed.
+
+    It is a subclass of ``random.Random``, so it has all of the same
+    methods, and can be used anywhere a ``random.Random`` can.
+
+    :arg seed:
+        The seed. Can be an int, str, or bytes. If ``None``, a random key is
+        used.
+    :arg int index:
+        The stream index, from ``0`` to ``2 ** 64 - 1``.
+
+    """
+    def __init__(self, seed=None, index=0):
+        """
+        CounterRNG constructor method.
+
+        :arg seed:
+            The seed.
+        :arg int index:
+            The stream index.
+
+        """
+        if not 0 <= index <= MAX_INDEX:
+            raise ValueError("Invalid stream index: %r" % (index,))
+
+        self.index = index
+        self._words = []
+        random.Random.__init__(self, seed)
+
+    def __repr__(self):
+        """
+        Returns a string representation of the ``CounterRNG`` instance.
+
+        :returns:
+            A string representation of the CounterRNG instance.
+
+        """
+        return "CounterRNG(index=%r)" % (self.index,)
+
+    def _refill(self):
+        """
+        Hashes the next block of the stream into the word buffer.
+
+        """
+        if self._counter > MAX_INDEX:
+            raise OverflowError("The stream is exhausted.")
+
+        hasher = self._hasher.copy()
+        hasher.update(_BLOCK.pack(self.index, self._counter))
+        self._counter += 1
+
+        # The words are used from the end of the buffer.
+        self._words.extend(reversed(_WORDS.unpack(hasher.digest())))
+
+    def getstate(self):
+        """
+        Returns the internal state of the generator.
+
+        :returns:
+            A tuple of the state, which can be passed to ``setstate``.
+
+        """
+        return (self._key, self.index, self._counter, tuple(self._words),
+            self._spawned, self.gauss_next)
+
+    def seed(self, a=None, version=2):
+        """
+        Seeds the generator, and starts its stream from the beginning.
+
+        :arg a:
+            The seed. Can be an int, str, or bytes. If ``None``, a random
+            key is used.
+
+        """
+        if a is None:
+            data = os.urandom(32)
+        elif isinstance(a, bytes):
+            data = b"b" + a
+        elif isinstance(a, int):
+            data = b"i" + str(a).encode("ascii")
+        elif isinstance(a, str):
+            data = b"s" + a.encode("utf-8")
+        else:
+            raise TypeError("Invalid seed type: %r" % (type(a),))
+
+        self._key = blake2b(data, digest_size=32, person=b"pydealer").digest()
+        self._hasher = blake2b(key=self._key, digest_size=64)
+        self._counter = 0
+        self._spawned = 0
+        self._words[:] = []
+        self.gauss_next = None
+
+    def setstate(self, state):
+        """
+        Restores the internal state of the generator.
+
+        :arg tuple state:
+            A state returned by ``getstate``.
+
+        """
+        key, self.index, self._counter, words, self._spawned, \
+            self.gauss_next = state
+        self._key = key
+        self._hasher = blake2b(key=key, digest_size=64)
+        self._words[:] = words
+
+    def spawn(self, num):
+        """
+        Returns ``num`` independent child generators, each with its own key,
+        derived from the key, and stream index of this generator. Each call
+        returns new children.
+
+        :arg int num:
+            The number of child generators.
+
+        :returns:
+            A list of ``CounterRNG`` instances.
+
+        """
+        children = [
+            CounterRNG(self._key + _BLOCK.pack(self.index, i))
+            for i in range(self._spawned, self._spawned + num)
+        ]
+        self._spawned += num
+
+        return children
+
+
+#===============================================================================
+# SecureRNG Class
+#===============================================================================
+
+class SecureRNG(_WordRNG):
+    """
+    A cryptographically secure random number generator, like
+    ``random.SystemRandom``, that reads from ``os.urandom`` in large
+    buffers, instead of making a system call for each number. Shuffle
+    indices are made from the entropy by rejection sampling, so they are
+    exactly uniform.
+
+    It can not be seeded, and has no state to save, or restore. A
+    ``SecureRNG`` should not be shared between threads. ``secure_rng``
+    returns one for the current thread. The buffered entropy of every
+    ``SecureRNG`` is dropped in the child of an ``os.fork``, so a parent,
+    and child never deal the same cards.
+
+    :arg int buffer_size:
+        The number of bytes read from ``os.urandom`` at a time. Rounded
+        down to a multiple of 8. Defaults to ``SECURE_BUFFER_SIZE``.
+
+    """
+    def __init__(self, buffer_size=SECURE_BUFFER_SIZE):
+        """
+        SecureRNG constructor method.
+
+        :arg int buffer_size:
+            The number of bytes read from ``os.urandom`` at a time.
+
+        """
+        if buffer_size < 8:
+            raise ValueError("Invalid buffer size: %r" % (buffer_size,))
+
+        self._words = []
+        self._unpack = Struct("<%dQ" % (buffer_size // 8)).unpack
+        self._buffer_size = buffer_size // 8 * 8
+        random.Random.__init__(self)
+        _SECURE_RNGS.add(self)
+
+    def __repr__(self):
+        """
+        Returns a string representation of the ``SecureRNG`` instance.
+
+        :returns:
+            A string representation of the SecureRNG instance.
+
+        """
+        return "SecureRNG(buffer_size=%r)" % (self._buffer_size,)
+
+    def _notimplemented(self, *args, **kwargs):
+        """
+        Raises ``NotImplementedError``. The generator has no state.
+
+        """
+        raise NotImplementedError("SecureRNG has no state.")
+
+    getstate = setstate = _notimplemented
+
+    def _refill(self):
+        """
+        Reads the next buffer of entropy into the word buffer.
+
+        """
+        self._words.extend(self._unpack(os.urandom(self._buffer_size)))
+
+    def seed(self, *args, **kwargs):
+        """
+        Does nothing. The generator can not be seeded.
+
+        """
+        return None
+
+    def spawn(self, num):
+        """
+        Returns ``num`` new secure generators.
+
+        :arg int num:
+            The number of generators.
+
+        :returns:
+            A list of ``SecureRNG`` instances.
+
+        """
+        return [SecureRNG(self._buffer_size) for _ in range(num)]
+
+
+#===============================================================================
+# NumPyRNG Class
+#===============================================================================
+
+class NumPyRNG(object):
+    """
+    Wraps a NumPy ``Generator``, with the methods of ``random.Random`` that
+    PyDealer uses. Floats are fetched from the generator in blocks, since
+    calling into NumPy for each one is slow.
+
+    :arg generator:
+        The ``numpy.random.Generator`` to wrap.
+
+    """
+    def __init__(self, generator):
+        """
+        NumPyRNG constructor method.
+
+        :arg generator:
+            The ``numpy.random.Generator`` to wrap.
+
+        """
+        self.generator = generator
+        self._buffer = []
+        self._words = []
+
+    def __repr__(self):
+        """
+        Returns a string representation of the ``NumPyRNG`` instance.
+
+        :returns:
+            A string representation of the NumPyRNG instance.
+
+        """
+        return "NumPyRNG(%r)" % (self.generator,)
+
+    def _refill(self):
+        """
+        Adds the next block of 64 bit words from the generator to the word
+        buffer.
+
+        """
+        self._words += self.generator.bit_generator.random_raw(
+            NUMPY_BUFFER_SIZE).tolist()
+
+    def choice(self, seq):
+        """
+        Returns a random item from the given sequence.
+
+        :arg seq:
+            The sequence to pick from.
+
+        :returns:
+            The picked item.
+
+        """
+        if not len(seq):
+            raise IndexError("Cannot choose from an empty sequence")
+
+        return seq[self.randrange(len(seq))]
+
+    def random(self):
+        """
+        Returns a random float, in the range [0, 1).
+
+        :returns:
+            The float.
+
+        """
+        buffer = self._buffer
+        if not buffer:
+            buffer += self.generator.random(NUMPY_BUFFER_SIZE).tolist()
+
+        return buffer.pop()
+
+    def randrange(self, stop):
+        """
+        Returns a random int, in the range [0, stop), which is exactly
+        uniform.
+
+        :arg int stop:
+            The end of the range.
+
+        :returns:
+            The int.
+
+        """
+        if stop <= 0:
+            raise ValueError("Empty range for randrange(%r)" % (stop,))
+        elif stop > _WORD_MASK:
+            return int(self.generator.integers(stop))
+
+        return _lemire(self._words, self._refill, stop)
+
+    def shuffle(self, x):
+        """
+        Shuffles the given mutable sequence in place, with a permutation
+        from the generator.
+
+        :arg x:
+            The sequence to shuffle. Can be a ``list``, or ``deque``.
+
+        """
+        items = list(x)
+        for i, j in enumerate(self.generator.permutation(len(items)).tolist()):
+            x[i] = items[j]
+
+    def spawn(self, num):
+        """
+        Returns ``num`` independent child generators, using the seed
+        sequence of the wrapped generator.
+
+        :arg int num:
+            The number of child generators.
+
+        :returns:
+            A list of ``NumPyRNG`` instances.
+
+        """
+        bit_generator = self.generator.bit_generator
+        seed_seq = getattr(bit_generator, "seed_seq", None)
+        if seed_seq is None:
+            seed_seq = bit_generator._seed_seq
+
+        return [
+            NumPyRNG(numpy.random.Generator(type(bit_generator)(child)))
+            for child in seed_seq.spawn(num)
+        ]
+
+
+#===============================================================================
+# Helper Functions
+#===============================================================================
+
+def _lemire(words, refill, num):
+    """
+    Returns a random int, in the range [0, num), from the given buffer of
+    64 bit words, with Lemire's multiply, and shift method. Words that
+    would make the result biased are rejected, so it is exactly uniform.
+
+    :arg list words:
+        The word buffer. Words are used from the end.
+    :arg refill:
+        The function that adds more words to the buffer.
+    :arg int num:
+        The end of the range, from ``1`` to ``2 ** 64 - 1``.
+
+    :returns:
+        The int.
+
+    """
+    if not words:
+        refill()
+    product = words.pop() * num
+    if (product & _WORD_MASK) < num:
+        threshold = (1 << 64) % num
+        while (product & _WORD_MASK) < threshold:
+            if not words:
+                refill()
+            product = words.pop() * num
+
+    return product >> 64
+
+
+def make_randbelow(rng=None):
+    """
+    Returns a function, that returns an exactly uniform random int, in the
+    range [0, n), for an int n, from the given generator.
+
+    :arg rng:
+        The generator, as returned by ``make_rng``. ``None`` for the global
+        ``random`` module.
+
+    :returns:
+        The function.
+
+    """
+    rng = rng or random
+
+    return getattr(rng, "_randbelow", None) or rng.randrange
+
+
+def make_rng(rng=None):
+    """
+    Converts the given ``rng`` argument into a generator object.
+
+    :arg rng:
+        ``None`` for the global ``random`` module, an int seed for a new
+        ``random.Random``, a NumPy ``Generator``, or any ``random.Random``
+        compatible object, which is returned as is.
+
+    :returns:
+        The generator, or ``None`` for the global ``random`` module.
+
+    """
+    if rng is None:
+        return None
+    elif isinstance(rng, int):
+        return random.Random(rng)
+    elif numpy is not None and isinstance(rng, numpy.random.Generator):
+        return NumPyRNG(rng)
+    else:
+        return rng
+
+
+def secure_rng():
+    """
+    Returns the ``SecureRNG`` of the current thread, which is made on the
+    first call.
+
+    :returns:
+        The SecureRNG instance.
+
+    """
+    try:
+        return _THREAD.secure_rng
+    except AttributeError:
+        _THREAD.secure_rng = SecureRNG()
+        return _THREAD.secure_rng
+
+
+def spawn_rngs(rng, num):
+    """
+    Derives ``num`` independent child generators from the given seed, or
+    generator, such as one for each parallel worker. The same seed always
+    gives the same children, and child ``i`` does not depend on ``num``.
+
+    :arg rng:
+        The parent generator, or seed. Takes the same values as
+        ``make_rng``. Generators with a ``spawn`` method (such as NumPy
+        generators) are split with it. Other generators are used to seed
+        a new ``random.Random`` for each child.
+    :arg int num:
+        The number of child generators.
+
+    :returns:
+        A list of the child generators.
+
+    """
+    rng = make_rng(rng) or random
+
+    if hasattr(rng, "spawn"):
+        return rng.spawn(num)
+
+    return [random.Random(rng.getrandbits(128)) for _ in range(num)]
+
+
+#===============================================================================
+# Thread Locals
+#===============================================================================
+
+# Holds the SecureRNG of each thread.
+_THREAD = threading.local()
+
+# Every SecureRNG, so their buffers can be dropped after a fork.
+_SECURE_RNGS = weakref.WeakSet()
+
+
+def _after_fork():
+    """
+    Drops the buffered entropy of every ``SecureRNG`` in the child of an
+    ``os.fork``, which would otherwise be the same as the parent's, and
+    the ``SecureRNG`` of each thread.
+
+    """
+    global _THREAD
+
+    _THREAD = threading.local()
+    for rng in list(_SECURE_RNGS):
+        rng._words[:] = []
+
+
+# Not available before Python 3.7, or on Windows, which can not fork.
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_after_fork)
@@ -0,0 +1,294 @@
+#===============================================================================
+# PyDealer - Shoe Class
+#-------------------------------------------------------------------------------
+# Version: 1.4.0
+# Updated: 10-01-2015
+# Author: Alex Crawford
+# License: GPLv3
+#===============================================================================
+
+"""
+This module contains the ``Shoe`` class. A ``Shoe`` holds several decks of
+cards, shuffled together, like the shoe used for dealing casino games such as
+blackjack, and baccarat. It is a subclass of the ``Deck`` class, and adds a
+cut card, burn cards, and the remaining composition of the shoe.
+
+"""
+
+
+#===============================================================================
+# Imports
+#===============================================================================
+
+import random
+
+from pydealer.deck import Deck
+from pydealer.rng import secure_rng
+from pydealer.shuffles import SHUFFLES
+from pydealer.store import CodeStore
+from pydealer.tools import (
+    compile_term,
+    deck_template
+)
+
+
+#===============================================================================
+# Shoe Class
+#===============================================================================
+
+class Shoe(Deck):
+    """
+    The Shoe class, representing a shoe of several decks, that is shuffled
+    once, and then dealt down to a cut card. It is a subclass of Deck,
+    sharing all of the same methods. The cards are held in a ``CodeStore``,
+    as one byte card codes, so even large shoes are compact, and the number
+    of each card left in the shoe is known without scanning it.
+
+    The cut card is placed ``penetration`` of the way into the shoe, counted
+    from the top. Once it has been reached, ``needs_shuffle`` becomes
+    ``True``, and the shoe should be reshuffled with ``reshuffle``, usually
+    after the current round is over.
+
+    :arg int num_decks:
+        The number of decks in the shoe. Defaults to ``6``.
+    :arg float penetration:
+        The part of the shoe that is dealt before the cut card comes out,
+        from ``0`` to ``1``. Defaults to ``0.75``.
+    :arg int burn_cards:
+        The number of cards burned after each reshuffle. Defaults to ``1``.
+
+    The other arguments are the same as for ``Deck``, except that the
+    ``store`` is always a ``CodeStore``.
+
+    """
+    def __init__(self, **kwargs):
+        """
+        Shoe constructor method.
+
+        """
+        self.num_decks = kwargs.get("num_decks", 6)
+        self.penetration = kwargs.get("penetration", 0.75)
+        self.burn_cards = kwargs.get("burn_cards", 1)
+        self.cut_card = 0
+
+        kwargs["store"] = CodeStore
+        Deck.__init__(self, **kwargs)
+
+    def __contains__(self, card):
+        """
+        Allows for Card inclusion checks. O(1), using the card counts of the
+        shoe.
+
+        :arg Card card:
+            The Card instance to check for.
+
+        :returns:
+            Whether or not the Card instance is in the Shoe.
+
+        """
+        return self._cards.count(card) > 0
+
+    def __repr__(self):
+        """
+        Returns a string representation of the ``Shoe`` instance.
+
+        :returns:
+            A string representation of the Shoe instance.
+
+        """
+        return "Shoe(cards=%r)" % (self._fixed_cards())
+
+    def _build_cards(self, jokers=False, num_jokers=0):
+        """
+        Returns the cards for one build of the shoe, ``num_decks`` decks,
+        and counts the decks used.
+
+        :arg bool jokers:
+            Whether or not to include jokers in each deck.
+        :arg int num_jokers:
+            The number of jokers to include in each deck.
+
+        :returns:
+            A tuple of the cards.
+
+        """
+        jokers = jokers or self.jokers
+        num_jokers = num_jokers or self.num_jokers
+
+        self.decks_used += self.num_decks
+
+        return deck_template(jokers, num_jokers) * self.num_decks
+
+    def build(self, jokers=False, num_jokers=0):
+        """
+        Adds ``num_decks`` standard 52 card French decks to the shoe, and
+        places the cut card.
+
+        :arg bool jokers:
+            Whether or not to include jokers in each deck.
+        :arg int num_jokers:
+            The number of jokers to include in each deck.
+
+        """
+        Deck.build(self, jokers, num_jokers)
+        self.place_cut_card()
+
+    def burn(self, num=None):
+        """
+        Deals the given number of cards from the top of the shoe, face down,
+        out of play.
+
+        :arg int num:
+            The number of cards to burn. Defaults to ``burn_cards``.
+
+        :returns:
+            A tuple of the card codes of the burned cards.
+
+        """
+        if num is None:
+            num = self.burn_cards
+
+        return self.deal_codes(num)
+
+    @property
+    def counts(self):
+        """
+        The number of each card left in the shoe, indexed by card code. See
+        the ``codec`` module for converting codes to cards.
+
+        :returns:
+            A tuple of the number of cards left with each card code.
+
+        """
+        return self._cards.counts()
+
+    def cut(self, indice=None):
+        """
+        Cuts the shoe, moving the cards from the given indice up, to the
+        bottom of the shoe.
+
+        :arg int indice:
+            The indice to cut the shoe at. Defaults to the middle of the
+            shoe.
+
+        """
+        if indice is None:
+            indice = self.size // 2
+
+        if self._lazy:
+            self._materialize()
+
+        self._cards.rotate(-indice)
+        self._sorted_ranks = None
+        self._positions = None
+
+    @property
+    def needs_shuffle(self):
+        """
+        Whether or not the cut card has been reached.
+
+        :returns:
+            ``True`` or ``False``.
+
+        """
+        return self.size <= self.cut_card
+
+    def place_cut_card(self, penetration=None):
+        """
+        Places the cut card, ``penetration`` of the way into the cards left
+        in the shoe.
+
+        :arg float penetration:
+            The part of the shoe that is dealt before the cut card comes out,
+            from ``0`` to ``1``. Defaults to the shoe's ``penetration``.
+
+        """
+        if penetration is not None:
+            self.penetration = penetration
+
+        if not 0 <= self.penetration <= 1:
+            raise ValueError("Invalid penetration: %r" % (self.penetration,))
+
+        size = self.size
+        self.cut_card = size - int(round(size * self.penetration))
+
+    def remaining(self, term):
+        """
+        Counts the cards left in the shoe, that match the given search term,
+        without scanning the shoe.
+
+        :arg str term:
+            The search term. Can be a card full name, value, suit,
+            or abbreviation.
+
+        :returns:
+            The number of matching cards left in the shoe.
+
+        """
+        counts = self._cards.counts()
+        return sum(counts[code] for code in compile_term(term))
+
+    def reshuffle(self, times=1, secure=False):
+        """
+        Gathers all of the cards back into the shoe, shuffles them, places
+        the cut card, and burns ``burn_cards`` cards.
+
+        :arg int times:
+            The number of times to shuffle.
+        :arg bool secure:
+            Whether or not to shuffle with a cryptographically secure
+            generator. See ``Stack.shuffle``.
+
+        """
+        self.empty()
+        self.build()
+        self.shuffle(times, secure)
+        self.burn()
+
+    def shuffle(self, times=1, secure=False, method=None):
+        """
+        Shuffles the Shoe. The card codes are shuffled directly, without
+        going through the ``Card`` instances. If the shoe shuffles lazily,
+        the cards are only marked as shuffled.
+
+        :arg int times:
+            The number of times to shuffle.
+        :arg bool secure:
+            Whether or not to shuffle with a cryptographically secure
+            generator. See ``Stack.shuffle``.
+        :arg str method:
+            Optional. The way to shuffle, to simulate shuffling by hand. See
+            ``Stack.shuffle``.
+
+        """
+        if method is not None and method not in SHUFFLES:
+            raise ValueError("Invalid shuffle method: %r" % (method,))
+
+        if self.lazy_shuffle and not secure and method is None:
+            Deck.shuffle(self, times)
+            return
+
+        self._sorted_ranks = None
+        self._positions = None
+
+        if secure:
+            rng = secure_rng()
+        else:
+            rng = self.rng or random
+
+        # A shuffle by hand depends on the order of the cards, but a uniform
+        # shuffle does not.
+        if method is not None and self._lazy:
+            self._materialize()
+        self._lazy = 0
+
+        codes = list(self._cards.codes)
+        if method is not None:
+            shuffle = SHUFFLES[method]
+            for _ in range(times):
+                codes = shuffle(codes, rng)
+        else:
+            shuffle = rng.shuffle
+            for _ in range(times):
+                shuffle(codes)
+        self._cards.codes[:] = bytearray(codes)
@@ -0,0 +1,147 @@
+#===============================================================================
+# PyDealer - Shuffles
+#-------------------------------------------------------------------------------
+# Version: 1.4.0
+# Updated: 10-01-2015
+# Author: Alex Crawford
+# License: GPLv3
+#===============================================================================
+
+"""
+The shuffles module contains models of the ways that people shuffle cards by
+hand, for ``Stack.shuffle(method=...)``. Unlike ``random.shuffle``, one of
+these shuffles does not mix the cards completely, so they can be used to
+simulate how well a deck is mixed by a dealer.
+
+- ``riffle`` is the Gilbert-Shannon-Reeds model of a riffle shuffle.
+- ``overhand`` is an overhand shuffle, of many small packets.
+- ``strip`` is a strip shuffle, of a few large packets.
+
+Each function takes a list of cards (or card codes), and returns a new,
+shuffled list. The ``batch`` module has versions for NumPy code arrays.
+
+"""
+
+
+#===============================================================================
+# Imports
+#===============================================================================
+
+from itertools import chain
+import random
+
+from pydealer.const import (
+    OVERHAND,
+    RIFFLE,
+    STRIP
+)
+
+
+#===============================================================================
+# Constants
+#===============================================================================
+
+# The chance of a packet ending between two cards, in an overhand shuffle,
+# which makes the packets 5 cards long, on average.
+OVERHAND_CUT_PROB = 0.2
+
+# The chance of a packet ending between two cards, in a strip shuffle, which
+# splits a 52 card deck into about 5 packets.
+STRIP_CUT_PROB = 0.08
+
+
+#===============================================================================
+# Shuffle Functions
+#===============================================================================
+
+def overhand(cards, rng=None, cut_prob=OVERHAND_CUT_PROB):
+    """
+    Overhand shuffles the given cards. The cards are split into packets,
+    with a packet ending between each pair of cards with the chance
+    ``cut_prob``, and the packets are stacked back up in reverse order, so
+    the cards within each packet stay in order.
+
+    :arg list cards:
+        The cards to shuffle.
+    :arg rng:
+        The random number generator. Defaults to the global ``random``
+        module.
+    :arg float cut_prob:
+        The chance of a packet ending between two cards.
+
+    :returns:
+        A list of the shuffled cards.
+
+    """
+    rand = (rng or random).random
+    cards = list(cards)
+    packets = []
+    start = 0
+
+    for i in range(1, len(cards)):
+        if rand() < cut_prob:
+            packets.append(cards[start:i])
+            start = i
+
+    packets.append(cards[start:])
+    packets.reverse()
+
+    return list(chain.from_iterable(packets))
+
+
+def riffle(cards, rng=None):
+    """
+    Riffle shuffles the given cards, with the Gilbert-Shannon-Reeds model.
+    The deck is cut into two packets, with the size of the first packet
+    following a binomial distribution, and the packets are interleaved,
+    with every interleaving equally likely. This is the same as giving each
+    position a fair coin flip, and filling the positions that came up tails
+    with the first packet, and the rest with the second packet, in order.
+
+    :arg list cards:
+        The cards to shuffle.
+    :arg rng:
+        The random number generator. Defaults to the global ``random``
+        module.
+
+    :returns:
+        A list of the shuffled cards.
+
+    """
+    rand = (rng or random).random
+    cards = list(cards)
+    flips = [rand() < 0.5 for _ in range(len(cards))]
+    cut = len(cards) - sum(flips)
+
+    first = iter(cards[:cut])
+    second = iter(cards[cut:])
+
+    return [next(second) if flip else next(first) for flip in flips]
+
+
+def strip(cards, rng=None, cut_prob=STRIP_CUT_PROB):
+    """
+    Strip shuffles the given cards. The same as ``overhand``, but with a
+    few large packets.
+
+    :arg list cards:
+        The cards to shuffle.
+    :arg rng:
+        The random number generator. Defaults to the global ``random``
+        module.
+    :arg float cut_prob:
+        The chance of a packet ending between two cards.
+
+    :returns:
+        A list of the shuffled cards.
+
+    """
+    return overhand(cards, rng, cut_prob)
+
+
+# The shuffle functions, by method name.
+SHUFFLES = {
+    RIFFLE: riffle,
+    OVERHAND: overhand,
+    STRIP: strip,
+}
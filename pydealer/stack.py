@@ -20,21 +20,41 @@ be used as a hand, or a discard pile, etc.
 # Imports
 #===============================================================================
 
-from collections import deque
+from collections import (
+    Counter,
+    deque
+)
+from heapq import merge
+from itertools import (
+    chain,
+    islice
+)
 import random
 
+from pydealer.codec import to_codes
 from pydealer.const import (
     BOTTOM,
     DEFAULT_RANKS,
     TOP
 )
+from pydealer.ranks import compile_ranks
+from pydealer.rng import (
+    make_randbelow,
+    make_rng,
+    secure_rng
+)
+from pydealer.shuffles import SHUFFLES
 from pydealer.tools import (
     check_sorted,
     check_term,
+    compile_term,
     find_card,
     open_cards,
     random_card,
+    remove_indices,
+    resolve_indices,
     save_cards,
+    sort_card_indices,
     sort_cards
 )
 
@@ -56,11 +76,28 @@ class Stack(object):
 
     :arg list cards:
         A list of cards to be the initial contents of the Stack.
-    :arg dict ranks:
-        If ``sort=True``, The rank dict to reference for sorting.
-        Defaults to ``DEFAULT_RANKS``.
+    :arg ranks:
+        If ``sort=True``, The rank dict, or ``Ranks`` instance to reference
+        for sorting. Defaults to ``DEFAULT_RANKS``.
     :arg bool sort:
         Whether or not to sort the stack upon instantiation.
+    :arg store:
+        The type of container to hold the cards in. Defaults to
+        ``collections.deque``. See the ``store`` module for the alternatives.
+    :arg bool indexed:
+        Whether or not to keep a membership index of the cards, which makes
+        ``in`` checks, and ``Stack.count`` O(1).
+    :arg bool lazy_shuffle:
+        Whether or not to shuffle lazily. If ``True``, ``Stack.shuffle``
+        only marks the cards as shuffled, and each card is picked at random
+        when it is dealt, so a shuffle costs O(cards dealt), instead of
+        O(cards in the stack). The order of the remaining cards is only
+        fixed when it is looked at.
+    :arg rng:
+        The random number generator for shuffling, and dealing at random.
+        Can be any ``random.Random`` compatible object, a NumPy
+        ``Generator``, or an int seed. Defaults to the global ``random``
+        module. See the ``rng`` module.
 
     """
     def __init__(self, **kwargs):
@@ -69,17 +106,30 @@ class Stack(object):
 
         :arg list cards:
             A list of cards to be the initial contents of the Stack.
-        :arg dict ranks:
-            If ``sort=True``, The rank dict to reference for sorting.
-            Defaults to ``DEFAULT_RANKS``.
+        :arg ranks:
+            If ``sort=True``, The rank dict, or ``Ranks`` instance to
+            reference for sorting. Defaults to ``DEFAULT_RANKS``.
         :arg bool sort:
             Whether or not to sort the stack upon instantiation.
+        :arg store:
+            The type of container to hold the cards in. Defaults to
+            ``collections.deque``.
+        :arg bool indexed:
+            Whether or not to keep a membership index of the cards.
+        :arg bool lazy_shuffle:
+            Whether or not to shuffle lazily.
+        :arg rng:
+            The random number generator, or seed.
 
         """
-        self._cards = deque(kwargs.get("cards", []))
-        self.ranks = kwargs.get("ranks", DEFAULT_RANKS)
-
-        self._i = 0
+        self._setup(
+            kwargs.get("cards", []),
+            kwargs.get("store", deque),
+            kwargs.get("ranks", DEFAULT_RANKS),
+            kwargs.get("indexed"),
+            kwargs.get("lazy_shuffle", False),
+            kwargs.get("rng")
+        )
 
         if kwargs.get("sort"):
             self.sort(self.ranks)
@@ -99,15 +149,18 @@ class Stack(object):
 
         """
         try:
-            new_stack = Stack(cards=(list(self.cards) + list(other.cards)))
+            new_stack = Stack(cards=(list(self._fixed_cards()) +
+                list(other.cards)))
         except:
-            new_stack = Stack(cards=(list(self.cards) + other))
+            new_stack = Stack(cards=(list(self._fixed_cards()) + other))
 
         return new_stack
 
     def __contains__(self, card):
         """
-        Allows for Card instance (not value & suit) inclusion checks.
+        Allows for Card instance (not value & suit) inclusion checks. Since
+        standard cards are interned, this is O(1) for them, if the Stack is
+        indexed.
 
         :arg Card card:
             The Card instance to check for.
@@ -116,7 +169,17 @@ class Stack(object):
             Whether or not the Card instance is in the Deck.
 
         """
-        return id(card) in [id(x) for x in self.cards]
+        if self._counts_stale:
+            self._rebuild_counts()
+
+        counts = self._counts
+        if counts is not None and getattr(card, "code", None) is not None:
+            return card in counts
+
+        for x in self._cards:
+            if x is card:
+                return True
+        return False
 
     def __delitem__(self, indice):
         """
@@ -126,7 +189,12 @@ class Stack(object):
             The indice to delete.
 
         """
-        del self.cards[indice]
+        if self._lazy:
+            self._materialize()
+
+        card = self._cards[indice]
+        del self._cards[indice]
+        self._removed([card])
 
     def __eq__(self, other):
         """
@@ -141,9 +209,12 @@ class Stack(object):
             ``True`` or ``False``.
 
         """
-        if len(self.cards) == len(other):
-            for i, card in enumerate(self.cards):
-                if card != other[i]:
+        if self._lazy:
+            self._materialize()
+
+        if len(self._cards) == len(other):
+            for card, other_card in zip(self._cards, other):
+                if card != other_card:
                     return False
             return True
         else:
@@ -161,18 +232,39 @@ class Stack(object):
             The ``Card`` at the given indice.
 
         """
-        self_len = len(self)
-        if isinstance(key, slice):
-            return [self[i] for i in xrange(*key.indices(self_len))]
-        elif isinstance(key, int):
-            if key < 0 :
-                key += self_len
-            if key >= self_len:
+        if self._lazy:
+            self._materialize()
+
+        cards = self._cards
+        if isinstance(key, int):
+            try:
+                return cards[key]
+            except IndexError:
                 raise IndexError("The index ({}) is out of range.".format(key))
-            return self.cards[key]
+        elif isinstance(key, slice):
+            if not isinstance(cards, deque):
+                return list(cards[key])
+            start, stop, step = key.indices(len(cards))
+            if step > 0:
+                return list(islice(cards, start, stop, step))
+            else:
+                return list(cards)[key]
         else:
             raise TypeError("Invalid argument type.")
 
+    def __iter__(self):
+        """
+        Allows iterating over the cards in the Stack, from bottom to top.
+
+        :returns:
+            An iterator over the cards in the stack.
+
+        """
+        if self._lazy:
+            self._materialize()
+
+        return iter(self._cards)
+
     def __len__(self):
         """
         Allows check the Stack length, with len.
@@ -181,7 +273,7 @@ class Stack(object):
             The length of the stack (self.cards).
 
         """
-        return len(self.cards)
+        return len(self._cards)
 
     def __ne__(self, other):
         """
@@ -196,9 +288,12 @@ class Stack(object):
             ``True`` or ``False``.
 
         """
-        if len(self.cards) == len(other):
-            for i, card in enumerate(self.cards):
-                if card != other[i]:
+        if self._lazy:
+            self._materialize()
+
+        if len(self._cards) == len(other):
+            for card, other_card in zip(self._cards, other):
+                if card != other_card:
                     return True
             return False
         else:
@@ -212,7 +307,7 @@ class Stack(object):
             A representation of the ``Deck`` instance.
 
         """
-        return "Stack(cards=%r)" % (self.cards)
+        return "Stack(cards=%r)" % (self._fixed_cards())
 
     def __setitem__(self, indice, value):
         """
@@ -227,7 +322,13 @@ class Stack(object):
             The Card to set the indice to.
 
         """
-        self.cards[indice] = value
+        if self._lazy:
+            self._materialize()
+
+        card = self._cards[indice]
+        self._cards[indice] = value
+        self._removed([card])
+        self._added([value])
 
     def __str__(self):
         """
@@ -238,9 +339,317 @@ class Stack(object):
             A str of the names of the cards in the stack.
 
         """
-        card_names = "".join([x.name + "\n" for x in self.cards]).rstrip("\n")
+        card_names = "".join([x.name + "\n" for x in self._fixed_cards()]).rstrip("\n")
         return "%s" % (card_names)
 
+    def _added(self, cards, end=None):
+        """
+        Updates the sorted flag, the membership index, and the position
+        index, after cards have been added to the stack.
+
+        :arg list cards:
+            The cards that were added.
+        :arg str end:
+            ``TOP``, if the cards were added to the top of the stack, in
+            order. Otherwise the position index is dropped, since the
+            positions of the cards have changed.
+
+        """
+        self._sorted_ranks = None
+
+        if self._counts is not None and not self._counts_stale:
+            self._counts.update(cards)
+
+        positions = self._positions
+        if positions is not None:
+            if end is TOP:
+                i = len(self._cards) - len(cards)
+                for card in cards:
+                    try:
+                        positions[card].append(i)
+                    except KeyError:
+                        positions[card] = [i]
+                    i += 1
+            else:
+                self._positions = None
+
+    def _deal_cards(self, num, end=TOP):
+        """
+        Removes up to ``num`` cards from the given end of the stack.
+
+        :arg int num:
+            The number of cards to deal.
+        :arg str end:
+            Which end to deal from. Can be ``TOP`` or ``BOTTOM``.
+
+        :returns:
+            A list of the dealt cards, in the order they were dealt.
+
+        """
+        cards = self._cards
+        num = min(num, len(cards))
+
+        if end == TOP:
+            pop, end = cards.pop, TOP
+        elif end == BOTTOM:
+            pop, end = cards.popleft, BOTTOM
+        else:
+            raise ValueError("Invalid end: %r" % (end,))
+
+        if num <= 0:
+            return []
+
+        if self._lazy:
+            dealt_cards = self._deal_lazy(num, end)
+            self._removed(dealt_cards)
+        else:
+            dealt_cards = [pop() for _ in xrange(num)]
+            self._removed(dealt_cards, end)
+
+        return dealt_cards
+
+    def _deal_lazy(self, num, end=TOP):
+        """
+        Removes ``num`` cards from the given end of a lazily shuffled stack.
+        The cards that have not been shuffled yet are at the bottom of the
+        stack. Each of them is picked uniformly at random from those cards,
+        and swapped with the card at the end being dealt from, before it is
+        removed, one step of a Fisher-Yates shuffle.
+
+        :arg int num:
+            The number of cards to deal. Must not be more than the number of
+            cards in the stack.
+        :arg str end:
+            Which end to deal from. Can be ``TOP`` or ``BOTTOM``.
+
+        :returns:
+            A list of the dealt cards, in the order they were dealt.
+
+        """
+        cards = self._cards
+        lazy = self._lazy
+        randbelow = make_randbelow(self.rng)
+        dealt_cards = []
+
+        if end is TOP:
+            # Cards added on top of the unshuffled cards are dealt as is.
+            fixed = min(num, len(cards) - lazy)
+            dealt_cards = [cards.pop() for _ in xrange(fixed)]
+            for _ in xrange(num - fixed):
+                i = randbelow(lazy)
+                lazy -= 1
+                dealt_cards.append(cards[i])
+                cards[i] = cards[lazy]
+                cards.pop()
+        else:
+            picks = min(num, lazy)
+            for _ in xrange(picks):
+                i = randbelow(lazy)
+                lazy -= 1
+                dealt_cards.append(cards[i])
+                cards[i] = cards[0]
+                cards.popleft()
+            dealt_cards += [cards.popleft() for _ in xrange(num - picks)]
+
+        self._lazy = lazy
+
+        return dealt_cards
+
+    def _find_terms(self, terms, limit=0):
+        """
+        Looks up the stack indices of the cards matching each of the given
+        terms, using the position index, which maps each distinct card in
+        the stack to its indices. The index is built on the first search,
+        and kept until the stack is changed in a way it can not follow. Each
+        term is compiled with ``compile_term``, so only the distinct cards
+        are checked against it, not every card in the stack.
+
+        :arg list terms:
+            The search terms.
+        :arg int limit:
+            The number of items to retrieve for each term. ``0`` equals
+            no limit.
+
+        :returns:
+            A list of stack indices, without duplicates, in the order of the
+            terms.
+
+        """
+        if self._lazy:
+            self._materialize()
+
+        positions = self._positions
+        if positions is None:
+            positions = self._positions = {}
+            for i, card in enumerate(self._cards):
+                try:
+                    positions[card].append(i)
+                except KeyError:
+                    positions[card] = [i]
+
+        found_indices = []
+        found = set()
+
+        for term in terms:
+            codes = compile_term(term)
+            matches = [
+                indices for card, indices in positions.items()
+                if card.code in codes or
+                (card.code is None and check_term(card, term))
+            ]
+
+            if len(matches) == 1:
+                indices = matches[0]
+            elif limit:
+                indices = merge(*matches)
+            else:
+                indices = sorted(chain.from_iterable(matches))
+
+            if found:
+                indices = (i for i in indices if i not in found)
+            indices = list(islice(indices, limit or None))
+            found_indices += indices
+            found.update(indices)
+
+        return found_indices
+
+    def _fixed_cards(self):
+        """
+        Returns the store of the stack, after fixing the order of any lazily
+        shuffled cards, for reading the cards.
+
+        :returns:
+            The store.
+
+        """
+        if self._lazy:
+            self._materialize()
+
+        return self._cards
+
+    def _materialize(self):
+        """
+        Fixes the order of the cards of a lazily shuffled stack, by
+        shuffling the cards that have not been shuffled yet.
+
+        """
+        lazy = self._lazy
+        self._lazy = 0
+
+        cards = list(self._cards)
+        unshuffled = cards[:lazy]
+        (self.rng or random).shuffle(unshuffled)
+        self._cards = self._store(unshuffled + cards[lazy:])
+
+    def _rebuild_counts(self):
+        """
+        Rebuilds the membership index, after the store may have been changed
+        in place, through ``Stack.cards``.
+
+        """
+        self._counts = Counter(self._cards)
+        self._counts_stale = False
+
+    def _removed(self, cards, end=None):
+        """
+        Updates the membership index, and the position index, after cards
+        have been removed from the stack. Removing cards never unsorts a
+        stack, so the sorted flag is kept.
+
+        :arg list cards:
+            The cards that were removed.
+        :arg str end:
+            ``TOP``, if the cards were popped off the top of the stack, in
+            the order given. Otherwise the position index is dropped, since
+            the positions of the cards have changed.
+
+        """
+        counts = self._counts
+        if counts is not None and not self._counts_stale:
+            for card in cards:
+                num = counts[card] - 1
+                if num:
+                    counts[card] = num
+                else:
+                    del counts[card]
+
+        positions = self._positions
+        if positions is not None:
+            if end is TOP:
+                for card in cards:
+                    indices = positions[card]
+                    indices.pop()
+                    if not indices:
+                        del positions[card]
+            else:
+                self._positions = None
+
+    def _setup(self, cards=(), store=deque, ranks=DEFAULT_RANKS,
+            indexed=False, lazy_shuffle=False, rng=None):
+        """
+        Sets up the attributes of a new stack. Used by the constructor, and
+        by the ``Deck`` constructor's fast path, so both set the same
+        attributes.
+
+        :arg cards:
+            The initial cards.
+        :arg store:
+            The type of container to hold the cards in.
+        :arg ranks:
+            The rank dict, or ``Ranks`` instance.
+        :arg bool indexed:
+            Whether or not to keep a membership index of the cards.
+        :arg bool lazy_shuffle:
+            Whether or not to shuffle lazily.
+        :arg rng:
+            The random number generator, or seed.
+
+        """
+        self._store = store
+        self._cards = store(cards)
+        self.ranks = ranks
+
+        self._i = 0
+        self._sorted_ranks = None
+        self._counts = Counter(self._cards) if indexed else None
+        self._counts_stale = False
+        self._positions = None
+        self.lazy_shuffle = lazy_shuffle
+        self._lazy = 0
+        self.rng = make_rng(rng)
+
+    def _take(self, terms, limit=0):
+        """
+        Removes the cards matching the given mix of stack indices, and search
+        terms from the stack. The terms are resolved with
+        ``resolve_indices``, using the position index for the search terms,
+        and the matching cards are taken out in a single pass.
+
+        :arg list terms:
+            The stack indices, and search terms.
+        :arg int limit:
+            The number of items to retrieve for each search term. ``0``
+            equals no limit.
+
+        :returns:
+            A list of the removed cards, in the order of the terms.
+
+        """
+        if self._lazy:
+            self._materialize()
+
+        indices = resolve_indices(self._cards, terms, limit,
+            lambda term: self._find_terms([term]))
+
+        if not indices:
+            return []
+
+        cards, got_cards = remove_indices(self._cards, indices)
+        self._cards = self._store(cards)
+        self._removed(got_cards)
+
+        return got_cards
+
     def add(self, cards, end=TOP):
         """
         Adds the given list of ``Card`` instances to the top of the stack.
@@ -253,40 +662,63 @@ class Stack(object):
             or ``BOTTOM`` ("bottom").
 
         """
+        try:
+            cards = list(cards)
+        except TypeError:
+            cards = [cards]
+
         if end is TOP:
-            try:
-                self.cards += cards
-            except:
-                self.cards += [cards]
+            self._cards.extend(cards)
         elif end is BOTTOM:
-            try:
-                self.cards.extendleft(cards)
-            except:
-                self.cards.extendleft([cards])
+            if self._lazy:
+                self._materialize()
+            self._cards.extendleft(cards)
+        else:
+            return
+
+        self._added(cards, end)
 
     @property
     def cards(self):
         """
-        The cards property.
+        The cards property. This is the Stack's store itself, not a copy, so
+        it can be changed in place. Since the Stack can not see those
+        changes, the sorted flag, and the position index are dropped, and
+        the membership index is rebuilt on its next use, whenever the
+        property is read.
 
         :returns:
             The cards in the Stack/Deck.
 
         """
-        return self._cards
+        self._sorted_ranks = None
+        self._positions = None
+        if self._counts is not None:
+            self._counts_stale = True
+
+        return self._fixed_cards()
 
     @cards.setter
     def cards(self, items):
         """
         The cards property setter. This makes sure that if ``Stack.cards`` is
-        set directly, that the items are in a deque.
+        set directly, that the items are in the Stack's store (a deque, by
+        default).
 
         :arg items:
             The list of Card instances, or a Stack/Deck instance to assign to
             the Stack/Deck.
 
         """
-        self._cards = deque(items)
+        if items is not self._cards:
+            self._cards = self._store(items)
+        self._sorted_ranks = None
+        self._lazy = 0
+        self._positions = None
+
+        if self._counts is not None:
+            self._counts = Counter(self._cards)
+            self._counts_stale = False
 
     def deal(self, num=1, end=TOP):
         """
@@ -301,27 +733,138 @@ class Stack(object):
             The given number of cards from the stack.
 
         """
-        ends = {TOP: self.cards.pop, BOTTOM: self.cards.popleft}
+        return Stack(cards=self._deal_cards(num, end))
 
-        self_size = self.size
+    def deal_codes(self, num=1, end=TOP):
+        """
+        Deals cards from the Stack, and returns their card codes, instead of
+        a new ``Stack``.
+
+        :arg int num:
+            The number of cards to deal.
+        :arg str end:
+            Which end to deal from. Can be ``0`` (top) or ``1`` (bottom).
+
+        :returns:
+            A tuple of the card codes of the dealt cards.
+
+        """
+        return tuple(to_codes(self._deal_cards(num, end)))
+
+    def deal_into(self, target, num=1, end=TOP):
+        """
+        Deals cards from the Stack straight into the given ``Stack`` (such as
+        a hand), without creating a new ``Stack`` for them. The cards are
+        added to the top of the target, in the order they are dealt, the same
+        as ``target.add(stack.deal(num, end))``.
+
+        :arg Stack target:
+            The stack to deal the cards into.
+        :arg int num:
+            The number of cards to deal.
+        :arg str end:
+            Which end to deal from. Can be ``0`` (top) or ``1`` (bottom).
+
+        :returns:
+            The number of cards dealt.
 
-        if num <= self_size:
-            dealt_cards = [None] * num
+        """
+        dealt_cards = self._deal_cards(num, end)
+        target.add(dealt_cards)
+
+        return len(dealt_cards)
+
+    def draw_random(self, preserve_order=False):
+        """
+        Removes a random card from anywhere in the Stack, and returns it.
+        Unless ``preserve_order=True``, the hole left by the card is filled
+        with the card from the top of the stack, so nothing has to be
+        shifted, and a draw is O(1) with a list based store, instead of O(n).
+
+        :arg bool preserve_order:
+            Whether or not to keep the rest of the cards in order.
+
+        :returns:
+            The drawn Card.
+
+        """
+        cards = self._cards
+        size = len(cards)
+
+        if not size:
+            raise IndexError("Can not draw from an empty stack.")
+
+        i = make_randbelow(self.rng)(size)
+        card = cards[i]
+
+        lazy = self._lazy
+        if i < lazy:
+            self._lazy = lazy - 1
+
+        if preserve_order:
+            del cards[i]
         else:
-            num = self_size
-            dealt_cards = [None] * self_size
+            if i < size - 1:
+                # Another card is moved into the hole, which can unsort
+                # the stack.
+                self._sorted_ranks = None
+            if i < lazy - 1:
+                # Keep the unshuffled cards together, at the bottom.
+                cards[i] = cards[lazy - 1]
+                i = lazy - 1
+            top_card = cards.pop()
+            if i < size - 1:
+                cards[i] = top_card
+
+        self._removed([card])
+
+        return card
+
+    def draw_random_many(self, num, preserve_order=False):
+        """
+        Removes ``num`` random cards from anywhere in the Stack, and returns
+        them, with ``Stack.draw_random``. If ``preserve_order=True``, the
+        cards are removed with ``Stack.sample`` instead, in one pass.
 
-        if self_size:
-            for n in xrange(num):
-                try:
-                    card = ends[end]()
-                    dealt_cards[n] = card
-                except:
-                    break
+        :arg int num:
+            The number of cards to draw.
+        :arg bool preserve_order:
+            Whether or not to keep the rest of the cards in order.
 
-            return Stack(cards=dealt_cards)
+        :returns:
+            A Stack of the drawn cards, in the order they were drawn.
+
+        """
+        if not 0 <= num <= len(self._cards):
+            raise ValueError("Invalid number of cards: %r" % (num,))
+
+        if preserve_order:
+            return self.sample(num)
+
+        draw_random = self.draw_random
+        return Stack(
+            cards=[draw_random() for _ in xrange(num)], store=self._store
+        )
+
+    def count(self, card):
+        """
+        Counts the cards in the stack equal to the given card (based on value
+        & suit, not instance). O(1) if the Stack is indexed.
+
+        :arg Card card:
+            The card to count.
+
+        :returns:
+            The number of matching cards in the stack.
+
+        """
+        if self._counts_stale:
+            self._rebuild_counts()
+
+        if self._counts is not None:
+            return self._counts.get(card, 0)
         else:
-            return Stack()
+            return self._cards.count(card)
 
     def empty(self, return_cards=False):
         """
@@ -335,12 +878,13 @@ class Stack(object):
             from the Stack.
 
         """
-        cards = list(self.cards)
-        self.cards = []
-
         if return_cards:
+            cards = list(self.cards)
+            self.cards = []
             return cards
 
+        self.cards = []
+
     def find(self, term, limit=0, sort=False, ranks=None):
         """
         Searches the stack for cards with a value, suit, name, or
@@ -354,9 +898,9 @@ class Stack(object):
             no limit.
         :arg bool sort:
             Whether or not to sort the results.
-        :arg dict ranks:
-            The rank dict to reference for sorting. If ``None``, it will
-            default to ``DEFAULT_RANKS``.
+        :arg ranks:
+            The rank dict, or ``Ranks`` instance to reference for sorting. If
+            ``None``, it will default to ``DEFAULT_RANKS``.
 
         :returns:
             A list of stack indices for the cards matching the given terms,
@@ -364,21 +908,7 @@ class Stack(object):
 
         """
         ranks = ranks or self.ranks
-        found_indices = []
-        count = 0
-
-        if not limit:
-            for i, card in enumerate(self.cards):
-                if check_term(card, term):
-                    found_indices.append(i)
-        else:
-            for i, card in enumerate(self.cards):
-                if count < limit:
-                    if check_term(card, term):
-                        found_indices.append(i)
-                        count += 1
-                else:
-                    break
+        found_indices = self._find_terms([term], limit)
 
         if sort:
             found_indices = sort_card_indices(self, found_indices, ranks)
@@ -397,9 +927,9 @@ class Stack(object):
             The number of items to retrieve for each term.
         :arg bool sort:
             Whether or not to sort the results, by poker ranks.
-        :arg dict ranks:
-            The rank dict to reference for sorting. If ``None``, it will
-            default to ``DEFAULT_RANKS``.
+        :arg ranks:
+            The rank dict, or ``Ranks`` instance to reference for sorting. If
+            ``None``, it will default to ``DEFAULT_RANKS``.
 
         :returns:
             A list of stack indices for the cards matching the given terms,
@@ -407,24 +937,7 @@ class Stack(object):
 
         """
         ranks = ranks or self.ranks
-        found_indices = []
-        count = 0
-
-        if not limit:
-            for term in terms:
-                for i, card in enumerate(self.cards):
-                    if check_term(card, term) and i not in found_indices:
-                        found_indices.append(i)
-        else:
-            for term in terms:
-                for i, card in enumerate(self.cards):
-                    if count < limit:
-                        if check_term(card, term) and i not in found_indices:
-                            found_indices.append(i)
-                            count += 1
-                    else:
-                        break
-                count = 0
+        found_indices = self._find_terms(terms, limit)
 
         if sort:
             found_indices = sort_card_indices(self, found_indices, ranks)
@@ -442,25 +955,16 @@ class Stack(object):
             The number of items to retrieve for each term.
         :arg bool sort:
             Whether or not to sort the results, by poker ranks.
-        :arg dict ranks:
-            The rank dict to reference for sorting. If ``None``, it will
-            default to ``DEFAULT_RANKS``.
+        :arg ranks:
+            The rank dict, or ``Ranks`` instance to reference for sorting. If
+            ``None``, it will default to ``DEFAULT_RANKS``.
 
         :returns:
             A list of the specified cards, if found.
 
         """
         ranks = ranks or self.ranks
-        got_cards = []
-
-        try:
-            indices = self.find(term, limit=limit)
-            got_cards = [self.cards[i] for i in indices]
-            self.cards = [v for i, v in enumerate(self.cards) if
-                i not in indices]
-        except:
-            got_cards = [self.cards[term]]
-            self.cards = [v for i, v in enumerate(self.cards) if i is not term]
+        got_cards = self._take([term], limit)
 
         if sort:
             got_cards = sort_cards(got_cards, ranks)
@@ -478,37 +982,16 @@ class Stack(object):
             The number of items to retrieve for each term.
         :arg bool sort:
             Whether or not to sort the results, by poker ranks.
-        :arg dict ranks:
-            The rank dict to reference for sorting. If ``None``, it will
-            default to ``DEFAULT_RANKS``.
+        :arg ranks:
+            The rank dict, or ``Ranks`` instance to reference for sorting. If
+            ``None``, it will default to ``DEFAULT_RANKS``.
 
         :returns:
             A list of the specified cards, if found.
 
         """
         ranks = ranks or self.ranks
-        got_cards = []
-
-        try:
-            indices = self.find_list(terms, limit=limit)
-            got_cards = [self.cards[i] for i in indices if self.cards[i]
-                not in got_cards]
-            self.cards = [v for i, v in enumerate(self.cards) if
-                i not in indices]
-        except:
-            indices = []
-            for item in terms:
-                try:
-                    card = self.cards[item]
-                    if card not in got_cards:
-                        got_cards.append(card)
-                        indices.append(item)
-                except:
-                    indices += self.find(item, limit=limit)
-                    got_cards += [self.cards[i] for i in indices if
-                        self.cards[i] not in got_cards]
-            self.cards = [v for i, v in enumerate(self.cards) if
-                i not in indices]
+        got_cards = self._take(terms, limit)
 
         if sort:
             got_cards = sort_cards(got_cards, ranks)
@@ -525,17 +1008,14 @@ class Stack(object):
             Where to insert the given card.
 
         """
-        self_size = len(self.cards)
-
-        if indice in [0, -1]:
-            if indice == -1:
-                self.cards.append(card)
-            else:
-                self.cards.appendleft(card)
-        elif indice != self_size:
-            half_x, half_y = self.split(indice)
-            self.cards = list(half_x.cards) + [card] + list(half_y.cards)
-
+        if indice == -1:
+            self._cards.append(card)
+            self._added([card], TOP)
+        else:
+            if self._lazy:
+                self._materialize()
+            self._cards.insert(indice, card)
+            self._added([card])
 
     def insert_list(self, cards, indice=-1):
         """
@@ -547,33 +1027,60 @@ class Stack(object):
             Where to insert the given cards.
 
         """
-        self_size = len(self.cards)
-
-        if indice in [0, -1]:
-            if indice == -1:
-                self.cards += cards
-            else:
-                self.cards.extendleft(cards)
-        elif indice != self_size:
-            half_x, half_y = self.split(indice)
-            self.cards = list(half_x.cards) + list(cards) + list(half_y.cards)
+        cards = list(cards)
+        stack = self._cards
+        self_size = len(stack)
+
+        if indice == -1 or indice >= self_size:
+            stack.extend(cards)
+            self._added(cards, TOP)
+            return
+
+        if self._lazy:
+            self._materialize()
+            stack = self._cards
+
+        if indice == 0 or indice <= -self_size:
+            stack.extendleft(reversed(cards))
+        elif isinstance(stack, deque):
+            indice %= self_size
+            stack.rotate(-indice)
+            stack.extendleft(reversed(cards))
+            stack.rotate(indice)
+        else:
+            indice %= self_size
+            for card in reversed(cards):
+                stack.insert(indice, card)
 
+        self._added(cards)
 
     def is_sorted(self, ranks=None):
         """
-        Checks whether the stack is sorted.
+        Checks whether the stack is sorted. The stack remembers when it is
+        sorted in ascending order by the given ranks, so repeated checks are
+        free until the stack is modified.
 
-        :arg dict ranks:
-            The rank dict to reference for checking. If ``None``, it will
-            default to ``DEFAULT_RANKS``.
+        :arg ranks:
+            The rank dict, or ``Ranks`` instance to reference for checking.
+            If ``None``, it will default to ``DEFAULT_RANKS``.
 
         :returns:
             Whether or not the cards are sorted.
 
         """
-        ranks = ranks or self.ranks
+        ranks = compile_ranks(ranks or self.ranks)
+
+        if self._sorted_ranks is ranks:
+            return True
 
-        return check_sorted(self, ranks)
+        if self._lazy:
+            self._materialize()
+
+        if check_sorted(self._cards, ranks, descending=False):
+            self._sorted_ranks = ranks
+            return True
+        else:
+            return check_sorted(self._cards, ranks)
 
     def open_cards(self, filename=None):
         """
@@ -587,24 +1094,84 @@ class Stack(object):
         """
         self.cards = open_cards(filename)
 
-    def random_card(self, remove=False):
+    def random_card(self, remove=False, preserve_order=True):
         """
         Returns a random card from the Stack. If ``remove=True``, it will
-        also remove the card from the deck.
+        also remove the card from the deck, with ``Stack.draw_random``.
 
         :arg bool remove:
             Whether or not to remove the card from the deck.
+        :arg bool preserve_order:
+            If ``remove=True``, whether or not to keep the rest of the cards
+            in order. Defaults to ``True``. With ``False``, the card is
+            removed in O(1), by swapping it with the top card.
 
         :returns:
             A random Card object, from the Stack.
 
         """
-        return random_card(self, remove)
+        if remove:
+            return self.draw_random(preserve_order)
+        else:
+            return random_card(self._cards, rng=self.rng)
 
     def reverse(self):
         """Reverse the order of the Stack in place."""
 
-        self.cards = self[::-1]
+        if self._lazy:
+            self._materialize()
+
+        self._cards.reverse()
+        self._sorted_ranks = None
+        self._positions = None
+
+    def sample(self, num=1, remove=True):
+        """
+        Picks ``num`` cards at random from anywhere in the Stack, with a
+        partial Fisher-Yates shuffle of the stack indices, so only ``num``
+        random numbers are drawn, however many cards are in the stack.
+
+        :arg int num:
+            The number of cards to pick.
+        :arg bool remove:
+            Whether or not to remove the picked cards from the stack.
+
+        :returns:
+            A Stack of the picked cards, in the order they were picked.
+
+        """
+        cards = self._cards
+        size = len(cards)
+
+        if not 0 <= num <= size:
+            raise ValueError("Invalid sample size: %r" % (num,))
+
+        if remove and self._lazy == size:
+            # Every card is unshuffled, so picking them off the top is
+            # already a uniform sample.
+            return Stack(cards=self._deal_cards(num), store=self._store)
+
+        randbelow = make_randbelow(self.rng)
+        swaps = {}
+        indices = []
+
+        for i in xrange(num):
+            j = i + randbelow(size - i)
+            indices.append(swaps.get(j, j))
+            swaps[j] = swaps.get(i, i)
+
+        if not remove:
+            return Stack(cards=[cards[i] for i in indices], store=self._store)
+
+        lazy = self._lazy
+        if lazy:
+            self._lazy -= sum(1 for i in indices if i < lazy)
+
+        cards, got_cards = remove_indices(cards, indices)
+        self._cards = self._store(cards)
+        self._removed(got_cards)
+
+        return Stack(cards=got_cards, store=self._store)
 
     def save_cards(self, filename=None):
         """
@@ -628,19 +1195,61 @@ class Stack(object):
         """
         self.cards = cards
 
-    def shuffle(self, times=1):
+    def shuffle(self, times=1, secure=False, method=None):
         """
-        Shuffles the Stack.
+        Shuffles the Stack. If the stack shuffles lazily, the cards are only
+        marked as shuffled, and ``times`` is ignored, unless a ``method`` is
+        given.
 
         .. note::
-            Shuffling large numbers of cards (100,000+) may take a while.
+            Shuffling large numbers of cards (100,000+) may take a while,
+            unless the stack shuffles lazily.
 
         :arg int times:
             The number of times to shuffle.
+        :arg bool secure:
+            Whether or not to shuffle with a cryptographically secure
+            generator (see ``rng.secure_rng``), instead of the stack's
+            ``rng``. A secure shuffle always shuffles all of the cards at
+            once, even if the stack shuffles lazily. To deal from a lazily
+            shuffled stack securely, give it ``rng=SecureRNG()`` instead.
+        :arg str method:
+            Optional. The way to shuffle, to simulate shuffling by hand. Can
+            be ``RIFFLE`` ("riffle"), ``OVERHAND`` ("overhand"), or
+            ``STRIP`` ("strip"). See the ``shuffles`` module. Defaults to a
+            perfect, uniform shuffle.
 
         """
+        if method is not None and method not in SHUFFLES:
+            raise ValueError("Invalid shuffle method: %r" % (method,))
+
+        if secure:
+            rng = secure_rng()
+        else:
+            rng = self.rng or random
+
+        if method is not None:
+            shuffle = SHUFFLES[method]
+            cards = list(self.cards)
+            for _ in xrange(times):
+                cards = shuffle(cards, rng)
+            self.cards = cards
+            return
+
+        self._sorted_ranks = None
+        self._positions = None
+
+        if self.lazy_shuffle and not secure:
+            self._lazy = len(self._cards)
+            return
+
+        # The whole stack is shuffled, so there is no need to fix the order
+        # of any lazily shuffled cards first.
+        self._lazy = 0
+
+        shuffle = rng.shuffle
         for _ in xrange(times):
-            random.shuffle(self.cards)
+            shuffle(self._cards)
 
     @property
     def size(self):
@@ -651,22 +1260,32 @@ class Stack(object):
             The number of cards in the stack.
 
         """
-        return len(self.cards)
+        return len(self._cards)
 
     def sort(self, ranks=None):
         """
-        Sorts the stack, either by poker ranks, or big two ranks.
+        Sorts the stack, either by poker ranks, or big two ranks. Sorting a
+        stack that is already known to be sorted by the same ranks does
+        nothing.
+
+        .. note::
+            The sorted state is tracked by the ``Stack`` methods, and is
+            dropped whenever ``Stack.cards`` is read, since the cards may
+            be changed through it.
 
-        :arg dict ranks:
-            The rank dict to reference for sorting. If ``None``, it will
-            default to ``DEFAULT_RANKS``.
+        :arg ranks:
+            The rank dict, or ``Ranks`` instance to reference for sorting. If
+            ``None``, it will default to ``DEFAULT_RANKS``.
 
         :returns:
             The sorted cards.
 
         """
-        ranks = ranks or self.ranks
-        self.cards = sort_cards(self.cards, ranks)
+        ranks = compile_ranks(ranks or self.ranks)
+
+        if self._sorted_ranks is not ranks:
+            self.cards = sort_cards(self._cards, ranks)
+            self._sorted_ranks = ranks
 
     def split(self, indice=None):
         """
@@ -682,14 +1301,19 @@ class Stack(object):
 
         """
         self_size = self.size
+        store = self._store
         if self_size > 1:
             if not indice:
-                mid = self_size // 2
-                return Stack(cards=self[0:mid]), Stack(cards=self[mid::])
-            else:
-                return Stack(cards=self[0:indice]), Stack(cards=self[indice::])
+                indice = self_size // 2
+            return (
+                Stack(cards=self[0:indice], store=store),
+                Stack(cards=self[indice::], store=store)
+            )
         else:
-            return Stack(cards=self.cards), Stack()
+            return (
+                Stack(cards=self._fixed_cards(), store=store),
+                Stack(store=store)
+            )
 
 
 #===============================================================================
@@ -0,0 +1,1473 @@
+#===============================================================================
+# PyDealer - Card Stores
+#-------------------------------------------------------------------------------
+# Version: 1.4.0
+# Updated: 10-01-2015
+# Author: Alex Crawford
+# License: GPLv3
+#===============================================================================
+
+"""
+This module contains the card stores, which a ``Stack`` can use to hold its
+cards, instead of the default ``collections.deque``. Every store has the same
+interface as a deque (``append``, ``appendleft``, ``pop``, ``popleft``,
+``extend``, ``extendleft``, ``insert``, ``rotate``, etc.), so they can be
+swapped freely, using the ``store`` argument of ``Stack`` and ``Deck``.
+
+A deque is O(1) at both ends, but indexing into the middle of it is O(n), and
+it can not be sliced. The ``ListDeque`` store is O(1) at both ends, and also
+supports O(1) indexing, and O(k) slicing, which makes it a better fit for
+large stacks, such as multi-deck shoes.
+
+Inserting into, or deleting from the middle of a deque, or a ``ListDeque`` is
+still O(n). The ``BlockList`` store splits the items into blocks of a few
+hundred items each, so inserting, deleting, and indexing anywhere in it only
+touches one block, found in O(log(n)) steps. This suits very large stacks,
+that have cards inserted mid-stack, such as cut cards, or returned cards.
+
+The ``CodeStore`` store holds the cards as one byte card codes, and keeps a
+count of each card, so counting cards is O(1). It is used by ``Shoe``.
+
+"""
+
+
+#===============================================================================
+# Imports
+#===============================================================================
+
+from itertools import (
+    chain,
+    islice
+)
+
+from pydealer.card import CARDS
+from pydealer.codec import (
+    to_code,
+    to_codes
+)
+
+
+#===============================================================================
+# ListDeque Class
+#===============================================================================
+
+class ListDeque(object):
+    """
+    A deque-like store, backed by a ``list``. The items live at the end of
+    the list, after a gap of unused slots, so ``appendleft`` and ``popleft``
+    only move the start of the gap, and the list is only shifted when the
+    gap runs out, or grows larger than the items themselves.
+
+    :arg iterable:
+        The initial items of the store.
+
+    """
+    __slots__ = ("_items", "_head")
+
+    def __init__(self, iterable=()):
+        """
+        ListDeque constructor method.
+
+        :arg iterable:
+            The initial items of the store.
+
+        """
+        self._items = list(iterable)
+        self._head = 0
+
+    def __copy__(self):
+        """
+        Returns a shallow copy of the store.
+
+        :returns:
+            A new ``ListDeque``, with the same items.
+
+        """
+        return self.copy()
+
+    def __delitem__(self, index):
+        """
+        Deletes the item at the given index.
+
+        :arg int index:
+            The index to delete.
+
+        """
+        del self._items[self._head + self._index(index)]
+
+    def __eq__(self, other):
+        """
+        Compares the store to another ``ListDeque``, item by item.
+
+        :arg other:
+            The other store.
+
+        :returns:
+            ``True`` or ``False``.
+
+        """
+        if not isinstance(other, ListDeque):
+            return NotImplemented
+
+        return (
+            len(self) == len(other) and
+            self._items[self._head:] == other._items[other._head:]
+        )
+
+    def __getitem__(self, key):
+        """
+        Returns the item at the given index, or a ``list`` of the items in
+        the given slice.
+
+        :arg key:
+            The index, or slice to get.
+
+        :returns:
+            The item, or list of items.
+
+        """
+        head = self._head
+
+        if isinstance(key, slice):
+            if not head:
+                return self._items[key]
+            start, stop, step = key.indices(len(self._items) - head)
+            if step > 0:
+                return self._items[head + start:head + stop:step]
+            else:
+                return self._items[head:][key]
+        elif key >= 0:
+            if not head:
+                return self._items[key]
+            if key < len(self._items) - head:
+                return self._items[head + key]
+        elif key >= head - len(self._items):
+            return self._items[key]
+
+        raise IndexError("ListDeque index out of range")
+
+    def __iadd__(self, other):
+        """
+        Extends the store with the given items, using ``+=``.
+
+        :arg other:
+            The items to add.
+
+        :returns:
+            The store itself.
+
+        """
+        self.extend(other)
+        return self
+
+    def __iter__(self):
+        """
+        Iterates over the items, from the left end to the right end.
+
+        :returns:
+            An iterator over the items.
+
+        """
+        return islice(self._items, self._head, None)
+
+    def __len__(self):
+        """
+        Returns the number of items in the store.
+
+        :returns:
+            The number of items.
+
+        """
+        return len(self._items) - self._head
+
+    def __ne__(self, other):
+        """
+        Compares the store to another ``ListDeque``, item by item.
+
+        :arg other:
+            The other store.
+
+        :returns:
+            ``True`` or ``False``.
+
+        """
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    def __reduce__(self):
+        """
+        Allows the store to be pickled.
+
+        :returns:
+            The callable and arguments used to rebuild the store.
+
+        """
+        return (self.__class__, (list(self),))
+
+    def __repr__(self):
+        """
+        Returns a string representation of the store.
+
+        :returns:
+            A string representation of the store.
+
+        """
+        return "%s(%r)" % (self.__class__.__name__, list(self))
+
+    def __reversed__(self):
+        """
+        Iterates over the items, from the right end to the left end.
+
+        :returns:
+            An iterator over the items.
+
+        """
+        return islice(reversed(self._items), len(self))
+
+    def __setitem__(self, index, value):
+        """
+        Sets the item at the given index.
+
+        :arg int index:
+            The index to set.
+        :arg value:
+            The new item.
+
+        """
+        self._items[self._head + self._index(index)] = value
+
+    def _compact(self):
+        """
+        Drops the gap at the start of the list.
+
+        """
+        if self._head:
+            del self._items[:self._head]
+            self._head = 0
+
+    def _index(self, index):
+        """
+        Checks, and normalizes the given index.
+
+        :arg int index:
+            The index to check. Can be negative.
+
+        :returns:
+            The index, counted from the left end.
+
+        """
+        size = len(self._items) - self._head
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("ListDeque index out of range")
+
+        return index
+
+    def _reserve(self, num):
+        """
+        Makes sure there are at least ``num`` free slots before the items.
+
+        :arg int num:
+            The number of free slots needed.
+
+        """
+        if self._head < num:
+            gap = max(num, len(self._items) - self._head, 8)
+            self._items[0:0] = [None] * (gap - self._head)
+            self._head = gap
+
+    def append(self, item):
+        """
+        Adds an item to the right end.
+
+        :arg item:
+            The item to add.
+
+        """
+        self._items.append(item)
+
+    def appendleft(self, item):
+        """
+        Adds an item to the left end.
+
+        :arg item:
+            The item to add.
+
+        """
+        self._reserve(1)
+        self._head -= 1
+        self._items[self._head] = item
+
+    def clear(self):
+        """
+        Removes all of the items.
+
+        """
+        self._items = []
+        self._head = 0
+
+    def copy(self):
+        """
+        Returns a shallow copy of the store.
+
+        :returns:
+            A new ``ListDeque``, with the same items.
+
+        """
+        return self.__class__(self)
+
+    def count(self, item):
+        """
+        Counts the items equal to the given item.
+
+        :arg item:
+            The item to count.
+
+        :returns:
+            The number of matching items.
+
+        """
+        return self._items.count(item) - (self._head if item is None else 0)
+
+    def extend(self, items):
+        """
+        Adds the given items to the right end.
+
+        :arg items:
+            The items to add.
+
+        """
+        self._items.extend(items)
+
+    def extendleft(self, items):
+        """
+        Adds the given items to the left end, one at a time, like
+        ``deque.extendleft``. The items end up in reverse order.
+
+        :arg items:
+            The items to add.
+
+        """
+        items = list(items)
+        items.reverse()
+        self._reserve(len(items))
+        self._items[self._head - len(items):self._head] = items
+        self._head -= len(items)
+
+    def index(self, item, start=0, stop=None):
+        """
+        Returns the index of the first item equal to the given item.
+
+        :arg item:
+            The item to look for.
+        :arg int start:
+            The index to start looking at.
+        :arg int stop:
+            The index to stop looking at.
+
+        :returns:
+            The index of the item.
+
+        """
+        size = len(self)
+        start, stop, _ = slice(start, stop).indices(size)
+
+        return self._items.index(item, self._head + start,
+            self._head + stop) - self._head
+
+    def insert(self, index, item):
+        """
+        Inserts an item before the given index, like ``list.insert``.
+
+        :arg int index:
+            The index to insert at.
+        :arg item:
+            The item to insert.
+
+        """
+        size = len(self)
+        if index < 0:
+            index = max(index + size, 0)
+        elif index > size:
+            index = size
+
+        if index == 0:
+            self.appendleft(item)
+        else:
+            self._items.insert(self._head + index, item)
+
+    def pop(self):
+        """
+        Removes, and returns the item at the right end.
+
+        :returns:
+            The removed item.
+
+        """
+        if len(self._items) == self._head:
+            raise IndexError("pop from an empty ListDeque")
+
+        item = self._items.pop()
+        if len(self._items) == self._head:
+            self.clear()
+
+        return item
+
+    def popleft(self):
+        """
+        Removes, and returns the item at the left end.
+
+        :returns:
+            The removed item.
+
+        """
+        head = self._head
+        items = self._items
+
+        if len(items) == head:
+            raise IndexError("pop from an empty ListDeque")
+
+        item = items[head]
+        items[head] = None
+        head += 1
+        self._head = head
+
+        if head == len(items):
+            self.clear()
+        elif head > 32 and head * 2 > len(items):
+            self._compact()
+
+        return item
+
+    def remove(self, item):
+        """
+        Removes the first item equal to the given item.
+
+        :arg item:
+            The item to remove.
+
+        """
+        del self._items[self.index(item) + self._head]
+
+    def reverse(self):
+        """
+        Reverses the items in place.
+
+        """
+        self._compact()
+        self._items.reverse()
+
+    def rotate(self, num=1):
+        """
+        Rotates the items ``num`` steps to the right, like ``deque.rotate``.
+        If ``num`` is negative, rotates to the left.
+
+        :arg int num:
+            The number of steps to rotate.
+
+        """
+        size = len(self)
+        if size:
+            num %= size
+            if num:
+                self._compact()
+                self._items[:] = self._items[-num:] + self._items[:-num]
+
+
+#===============================================================================
+# BlockList Class
+#===============================================================================
+
+class BlockList(object):
+    """
+    A deque-like store, made of a list of blocks (lists), which each hold up
+    to ``2 * load`` items. Inserting, or deleting an item only shifts the
+    items in its block. The block sizes are kept in a Fenwick tree, so the
+    block holding a given index is found in O(log(n)) steps.
+
+    :arg iterable:
+        The initial items of the store.
+    :arg int load:
+        The target number of items per block, at least ``2``. Blocks are
+        split when they grow past ``2 * load`` items, and merged with a
+        neighbour when they shrink below ``load // 2`` items.
+
+    """
+    __slots__ = ("_blocks", "_len", "_load", "_tree")
+
+    LOAD = 512
+
+    def __init__(self, iterable=(), load=None):
+        """
+        BlockList constructor method.
+
+        :arg iterable:
+            The initial items of the store.
+        :arg int load:
+            The target number of items per block. Defaults to ``LOAD``.
+
+        """
+        if load is not None and load < 2:
+            raise ValueError("Invalid load: %r" % (load,))
+
+        self._load = load or self.LOAD
+        self._blocks = []
+        self._len = 0
+        self._tree = None
+        self.extend(iterable)
+
+    def __copy__(self):
+        """
+        Returns a shallow copy of the store.
+
+        :returns:
+            A new ``BlockList``, with the same items.
+
+        """
+        return self.copy()
+
+    def __delitem__(self, index):
+        """
+        Deletes the item at the given index.
+
+        :arg int index:
+            The index to delete.
+
+        """
+        k, j = self._locate(self._index(index))
+        block = self._blocks[k]
+        del block[j]
+        self._len -= 1
+
+        if len(block) < self._load // 2:
+            self._fix(k)
+        else:
+            self._grow(k, -1)
+
+    def __eq__(self, other):
+        """
+        Compares the store to another ``BlockList``, item by item.
+
+        :arg other:
+            The other store.
+
+        :returns:
+            ``True`` or ``False``.
+
+        """
+        if not isinstance(other, BlockList):
+            return NotImplemented
+
+        return len(self) == len(other) and list(self) == list(other)
+
+    def __getitem__(self, key):
+        """
+        Returns the item at the given index, or a ``list`` of the items in
+        the given slice.
+
+        :arg key:
+            The index, or slice to get.
+
+        :returns:
+            The item, or list of items.
+
+        """
+        if isinstance(key, slice):
+            start, stop, step = key.indices(self._len)
+            if step < 0:
+                return list(self)[key]
+            if start >= stop:
+                return []
+            k, j = self._locate(start)
+            return list(islice(chain.from_iterable(self._blocks[k:]),
+                j, j + stop - start, step))
+
+        k, j = self._locate(self._index(key))
+        return self._blocks[k][j]
+
+    def __iadd__(self, other):
+        """
+        Extends the store with the given items, using ``+=``.
+
+        :arg other:
+            The items to add.
+
+        :returns:
+            The store itself.
+
+        """
+        self.extend(other)
+        return self
+
+    def __iter__(self):
+        """
+        Iterates over the items, from the left end to the right end.
+
+        :returns:
+            An iterator over the items.
+
+        """
+        return chain.from_iterable(self._blocks)
+
+    def __len__(self):
+        """
+        Returns the number of items in the store.
+
+        :returns:
+            The number of items.
+
+        """
+        return self._len
+
+    def __ne__(self, other):
+        """
+        Compares the store to another ``BlockList``, item by item.
+
+        :arg other:
+            The other store.
+
+        :returns:
+            ``True`` or ``False``.
+
+        """
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    def __reduce__(self):
+        """
+        Allows the store to be pickled.
+
+        :returns:
+            The callable and arguments used to rebuild the store.
+
+        """
+        return (self.__class__, (list(self), self._load))
+
+    def __repr__(self):
+        """
+        Returns a string representation of the store.
+
+        :returns:
+            A string representation of the store.
+
+        """
+        return "%s(%r)" % (self.__class__.__name__, list(self))
+
+    def __reversed__(self):
+        """
+        Iterates over the items, from the right end to the left end.
+
+        :returns:
+            An iterator over the items.
+
+        """
+        return chain.from_iterable(
+            reversed(block) for block in reversed(self._blocks))
+
+    def __setitem__(self, index, value):
+        """
+        Sets the item at the given index.
+
+        :arg int index:
+            The index to set.
+        :arg value:
+            The new item.
+
+        """
+        k, j = self._locate(self._index(index))
+        self._blocks[k][j] = value
+
+    def _build_tree(self):
+        """
+        Builds the Fenwick tree of the block sizes.
+
+        :returns:
+            The tree, as a list, where item ``i`` holds the total size of the
+            blocks ``i - (i & -i)`` to ``i - 1``.
+
+        """
+        tree = [0] + [len(block) for block in self._blocks]
+        size = len(tree)
+
+        for i in range(1, size):
+            j = i + (i & -i)
+            if j < size:
+                tree[j] += tree[i]
+
+        self._tree = tree
+        return tree
+
+    def _fix(self, k):
+        """
+        Splits the block at the given block index if it is too large, drops
+        it if it is empty, or merges it with a neighbour if it is too small.
+
+        :arg int k:
+            The block index.
+
+        """
+        blocks = self._blocks
+        block = blocks[k]
+        load = self._load
+        self._tree = None
+
+        if len(block) > 2 * load:
+            blocks[k:k + 1] = [
+                block[i:i + load] for i in range(0, len(block), load)
+            ]
+        elif not block:
+            del blocks[k]
+        elif len(block) < load // 2 and len(blocks) > 1:
+            if k == len(blocks) - 1:
+                k -= 1
+            merged = blocks[k] + blocks[k + 1]
+            if len(merged) > 2 * load:
+                half = len(merged) // 2
+                blocks[k:k + 2] = [merged[:half], merged[half:]]
+            else:
+                blocks[k:k + 2] = [merged]
+
+    def _grow(self, k, num):
+        """
+        Updates the Fenwick tree, after the block at the given block index
+        has grown, or shrunk by ``num`` items.
+
+        :arg int k:
+            The block index.
+        :arg int num:
+            The change in the size of the block.
+
+        """
+        tree = self._tree
+        if tree is not None:
+            size = len(tree)
+            i = k + 1
+            while i < size:
+                tree[i] += num
+                i += i & -i
+
+    def _index(self, index):
+        """
+        Checks, and normalizes the given index.
+
+        :arg int index:
+            The index to check. Can be negative.
+
+        :returns:
+            The index, counted from the left end.
+
+        """
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("BlockList index out of range")
+
+        return index
+
+    def _locate(self, index):
+        """
+        Finds the block that holds the item at the given index.
+
+        :arg int index:
+            The index of the item, counted from the left end. Must be in
+            range.
+
+        :returns:
+            The block index, and the index of the item within the block.
+
+        """
+        if index < len(self._blocks[0]):
+            return 0, index
+
+        tree = self._tree
+        if tree is None:
+            tree = self._build_tree()
+
+        size = len(tree)
+        step = 1 << ((size - 1).bit_length() - 1)
+        k = 0
+
+        while step:
+            if k + step < size and tree[k + step] <= index:
+                k += step
+                index -= tree[k]
+            step >>= 1
+
+        return k, index
+
+    def _split_at(self, index):
+        """
+        Makes sure a block starts at the given index.
+
+        :arg int index:
+            The index to split at. Can be equal to the length of the store.
+
+        :returns:
+            The block index of the block starting at the given index.
+
+        """
+        if index >= self._len:
+            return len(self._blocks)
+
+        k, j = self._locate(index)
+        if j:
+            block = self._blocks[k]
+            self._blocks[k:k + 1] = [block[:j], block[j:]]
+            self._tree = None
+            k += 1
+
+        return k
+
+    def append(self, item):
+        """
+        Adds an item to the right end.
+
+        :arg item:
+            The item to add.
+
+        """
+        blocks = self._blocks
+        if blocks and len(blocks[-1]) < 2 * self._load:
+            blocks[-1].append(item)
+            self._grow(len(blocks) - 1, 1)
+        else:
+            blocks.append([item])
+            self._tree = None
+        self._len += 1
+
+    def appendleft(self, item):
+        """
+        Adds an item to the left end.
+
+        :arg item:
+            The item to add.
+
+        """
+        blocks = self._blocks
+        if blocks and len(blocks[0]) < 2 * self._load:
+            blocks[0].insert(0, item)
+            self._grow(0, 1)
+        else:
+            blocks.insert(0, [item])
+            self._tree = None
+        self._len += 1
+
+    def clear(self):
+        """
+        Removes all of the items.
+
+        """
+        self._blocks = []
+        self._len = 0
+        self._tree = None
+
+    def copy(self):
+        """
+        Returns a shallow copy of the store.
+
+        :returns:
+            A new ``BlockList``, with the same items.
+
+        """
+        return self.__class__(self, self._load)
+
+    def count(self, item):
+        """
+        Counts the items equal to the given item.
+
+        :arg item:
+            The item to count.
+
+        :returns:
+            The number of matching items.
+
+        """
+        return sum(block.count(item) for block in self._blocks)
+
+    def extend(self, items):
+        """
+        Adds the given items to the right end.
+
+        :arg items:
+            The items to add.
+
+        """
+        items = list(items)
+        if not items:
+            return
+
+        blocks = self._blocks
+        load = self._load
+        self._len += len(items)
+        self._tree = None
+
+        if blocks and len(blocks[-1]) < load:
+            room = load - len(blocks[-1])
+            blocks[-1].extend(items[:room])
+            items = items[room:]
+
+        blocks.extend(items[i:i + load] for i in range(0, len(items), load))
+
+    def extendleft(self, items):
+        """
+        Adds the given items to the left end, one at a time, like
+        ``deque.extendleft``. The items end up in reverse order.
+
+        :arg items:
+            The items to add.
+
+        """
+        items = list(items)
+        items.reverse()
+        if not items:
+            return
+
+        blocks = self._blocks
+        load = self._load
+        self._len += len(items)
+        self._tree = None
+
+        if blocks and len(blocks[0]) < load:
+            room = load - len(blocks[0])
+            blocks[0][0:0] = items[-room:]
+            items = items[:-room]
+
+        # Any partial block goes first, at the left end of the store.
+        start = len(items) % load
+        new_blocks = [items[:start]] if start else []
+        new_blocks += [
+            items[i:i + load] for i in range(start, len(items), load)
+        ]
+        blocks[0:0] = new_blocks
+
+    def index(self, item, start=0, stop=None):
+        """
+        Returns the index of the first item equal to the given item.
+
+        :arg item:
+            The item to look for.
+        :arg int start:
+            The index to start looking at.
+        :arg int stop:
+            The index to stop looking at.
+
+        :returns:
+            The index of the item.
+
+        """
+        start, stop, _ = slice(start, stop).indices(self._len)
+        pos = 0
+
+        for block in self._blocks:
+            end = pos + len(block)
+            if pos >= stop:
+                break
+            if end > start:
+                try:
+                    return block.index(item, max(start - pos, 0),
+                        stop - pos) + pos
+                except ValueError:
+                    pass
+            pos = end
+
+        raise ValueError("BlockList.index(x): x not in BlockList")
+
+    def insert(self, index, item):
+        """
+        Inserts an item before the given index, like ``list.insert``.
+
+        :arg int index:
+            The index to insert at.
+        :arg item:
+            The item to insert.
+
+        """
+        size = self._len
+        if index < 0:
+            index = max(index + size, 0)
+        elif index > size:
+            index = size
+
+        if index == size:
+            self.append(item)
+            return
+
+        k, j = self._locate(index)
+        block = self._blocks[k]
+        block.insert(j, item)
+        self._len += 1
+
+        if len(block) > 2 * self._load:
+            self._fix(k)
+        else:
+            self._grow(k, 1)
+
+    def pop(self):
+        """
+        Removes, and returns the item at the right end.
+
+        :returns:
+            The removed item.
+
+        """
+        blocks = self._blocks
+        if not blocks:
+            raise IndexError("pop from an empty BlockList")
+
+        item = blocks[-1].pop()
+        self._len -= 1
+        if blocks[-1]:
+            self._grow(len(blocks) - 1, -1)
+        else:
+            blocks.pop()
+            self._tree = None
+
+        return item
+
+    def popleft(self):
+        """
+        Removes, and returns the item at the left end.
+
+        :returns:
+            The removed item.
+
+        """
+        blocks = self._blocks
+        if not blocks:
+            raise IndexError("pop from an empty BlockList")
+
+        item = blocks[0].pop(0)
+        self._len -= 1
+        if blocks[0]:
+            self._grow(0, -1)
+        else:
+            del blocks[0]
+            self._tree = None
+
+        return item
+
+    def remove(self, item):
+        """
+        Removes the first item equal to the given item.
+
+        :arg item:
+            The item to remove.
+
+        """
+        del self[self.index(item)]
+
+    def reverse(self):
+        """
+        Reverses the items in place.
+
+        """
+        self._blocks.reverse()
+        for block in self._blocks:
+            block.reverse()
+        self._tree = None
+
+    def rotate(self, num=1):
+        """
+        Rotates the items ``num`` steps to the right, like ``deque.rotate``.
+        If ``num`` is negative, rotates to the left. Only the block at the
+        split point is copied, the rest of the blocks are just moved.
+
+        :arg int num:
+            The number of steps to rotate.
+
+        """
+        size = self._len
+        if size:
+            num %= size
+            if num:
+                k = self._split_at(size - num)
+                blocks = self._blocks
+                blocks[:] = blocks[k:] + blocks[:k]
+                self._tree = None
+                # The blocks on either side of the old ends are now next to
+                # each other, and may be small enough to merge.
+                seam = len(blocks) - k
+                if len(blocks[seam]) < self._load // 2:
+                    self._fix(seam)
+
+#===============================================================================
+# CodeStore Class
+#===============================================================================
+
+class CodeStore(object):
+    """
+    A deque-like store, that holds the cards as their card codes, in a
+    ``bytearray``, one byte per card, instead of as ``Card`` references. The
+    cards are turned back into the shared ``Card`` instances when they are
+    read. The store also keeps a count of each card code, so ``count`` (and
+    the composition of the store) is O(1). Only cards from the card registry
+    can be stored.
+
+    :arg iterable:
+        The initial cards of the store.
+
+    """
+    __slots__ = ("codes", "_counts")
+
+    def __init__(self, iterable=()):
+        """
+        CodeStore constructor method.
+
+        :arg iterable:
+            The initial cards of the store.
+
+        """
+        self.codes = bytearray(to_codes(iterable))
+        self._counts = [0] * len(CARDS)
+        for code in self.codes:
+            self._counts[code] += 1
+
+    def __copy__(self):
+        """
+        Returns a shallow copy of the store.
+
+        :returns:
+            A new ``CodeStore``, with the same cards.
+
+        """
+        return self.copy()
+
+    def __delitem__(self, index):
+        """
+        Deletes the card at the given index.
+
+        :arg int index:
+            The index to delete.
+
+        """
+        self._counts[self.codes[index]] -= 1
+        del self.codes[index]
+
+    def __eq__(self, other):
+        """
+        Compares the store to another ``CodeStore``, card by card.
+
+        :arg other:
+            The other store.
+
+        :returns:
+            ``True`` or ``False``.
+
+        """
+        if not isinstance(other, CodeStore):
+            return NotImplemented
+
+        return self.codes == other.codes
+
+    def __getitem__(self, key):
+        """
+        Returns the card at the given index, or a ``list`` of the cards in
+        the given slice.
+
+        :arg key:
+            The index, or slice to get.
+
+        :returns:
+            The card, or list of cards.
+
+        """
+        if isinstance(key, slice):
+            return [CARDS[code] for code in self.codes[key]]
+
+        return CARDS[self.codes[key]]
+
+    def __iadd__(self, other):
+        """
+        Extends the store with the given cards, using ``+=``.
+
+        :arg other:
+            The cards to add.
+
+        :returns:
+            The store itself.
+
+        """
+        self.extend(other)
+        return self
+
+    def __iter__(self):
+        """
+        Iterates over the cards, from the left end to the right end.
+
+        :returns:
+            An iterator over the cards.
+
+        """
+        return (CARDS[code] for code in self.codes)
+
+    def __len__(self):
+        """
+        Returns the number of cards in the store.
+
+        :returns:
+            The number of cards.
+
+        """
+        return len(self.codes)
+
+    def __ne__(self, other):
+        """
+        Compares the store to another ``CodeStore``, card by card.
+
+        :arg other:
+            The other store.
+
+        :returns:
+            ``True`` or ``False``.
+
+        """
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    def __reduce__(self):
+        """
+        Allows the store to be pickled.
+
+        :returns:
+            The callable and arguments used to rebuild the store.
+
+        """
+        return (self.__class__, (list(self),))
+
+    def __repr__(self):
+        """
+        Returns a string representation of the store.
+
+        :returns:
+            A string representation of the store.
+
+        """
+        return "%s(%r)" % (self.__class__.__name__, list(self))
+
+    def __reversed__(self):
+        """
+        Iterates over the cards, from the right end to the left end.
+
+        :returns:
+            An iterator over the cards.
+
+        """
+        return (CARDS[code] for code in reversed(self.codes))
+
+    def __setitem__(self, index, card):
+        """
+        Sets the card at the given index.
+
+        :arg int index:
+            The index to set.
+        :arg Card card:
+            The new card.
+
+        """
+        code = to_code(card)
+        self._counts[self.codes[index]] -= 1
+        self.codes[index] = code
+        self._counts[code] += 1
+
+    def append(self, card):
+        """
+        Adds a card to the right end.
+
+        :arg Card card:
+            The card to add.
+
+        """
+        code = to_code(card)
+        self.codes.append(code)
+        self._counts[code] += 1
+
+    def appendleft(self, card):
+        """
+        Adds a card to the left end.
+
+        :arg Card card:
+            The card to add.
+
+        """
+        code = to_code(card)
+        self.codes.insert(0, code)
+        self._counts[code] += 1
+
+    def clear(self):
+        """
+        Removes all of the cards.
+
+        """
+        self.codes = bytearray()
+        self._counts = [0] * len(CARDS)
+
+    def copy(self):
+        """
+        Returns a shallow copy of the store.
+
+        :returns:
+            A new ``CodeStore``, with the same cards.
+
+        """
+        store = self.__class__()
+        store.codes = bytearray(self.codes)
+        store._counts = list(self._counts)
+        return store
+
+    def count(self, card):
+        """
+        Counts the cards equal to the given card. O(1).
+
+        :arg Card card:
+            The card to count.
+
+        :returns:
+            The number of matching cards.
+
+        """
+        code = getattr(card, "code", None)
+        return self._counts[code] if code is not None else 0
+
+    def counts(self):
+        """
+        Returns the number of each card in the store. O(1) in the size of the
+        store.
+
+        :returns:
+            A tuple of the number of cards with each card code, indexed by
+            card code.
+
+        """
+        return tuple(self._counts)
+
+    def extend(self, cards):
+        """
+        Adds the given cards to the right end.
+
+        :arg cards:
+            The cards to add.
+
+        """
+        codes = to_codes(cards)
+        self.codes.extend(codes)
+        for code in codes:
+            self._counts[code] += 1
+
+    def extendleft(self, cards):
+        """
+        Adds the given cards to the left end, one at a time, like
+        ``deque.extendleft``. The cards end up in reverse order.
+
+        :arg cards:
+            The cards to add.
+
+        """
+        codes = to_codes(cards)
+        codes.reverse()
+        self.codes[0:0] = bytearray(codes)
+        for code in codes:
+            self._counts[code] += 1
+
+    def index(self, card, start=0, stop=None):
+        """
+        Returns the index of the first card equal to the given card.
+
+        :arg Card card:
+            The card to look for.
+        :arg int start:
+            The index to start looking at.
+        :arg int stop:
+            The index to stop looking at.
+
+        :returns:
+            The index of the card.
+
+        """
+        if stop is None:
+            stop = len(self.codes)
+        code = getattr(card, "code", None)
+
+        if code is not None:
+            i = self.codes.find(bytearray([code]), start, stop)
+            if i >= 0:
+                return i
+
+        raise ValueError("CodeStore.index(x): x not in CodeStore")
+
+    def insert(self, index, card):
+        """
+        Inserts a card before the given index, like ``list.insert``.
+
+        :arg int index:
+            The index to insert at.
+        :arg Card card:
+            The card to insert.
+
+        """
+        code = to_code(card)
+        self.codes.insert(index, code)
+        self._counts[code] += 1
+
+    def pop(self):
+        """
+        Removes, and returns the card at the right end.
+
+        :returns:
+            The removed card.
+
+        """
+        if not self.codes:
+            raise IndexError("pop from an empty CodeStore")
+
+        code = self.codes.pop()
+        self._counts[code] -= 1
+        return CARDS[code]
+
+    def popleft(self):
+        """
+        Removes, and returns the card at the left end.
+
+        :returns:
+            The removed card.
+
+        """
+        if not self.codes:
+            raise IndexError("pop from an empty CodeStore")
+
+        code = self.codes[0]
+        del self.codes[0]
+        self._counts[code] -= 1
+        return CARDS[code]
+
+    def remove(self, card):
+        """
+        Removes the first card equal to the given card.
+
+        :arg Card card:
+            The card to remove.
+
+        """
+        del self[self.index(card)]
+
+    def reverse(self):
+        """
+        Reverses the cards in place.
+
+        """
+        self.codes.reverse()
+
+    def rotate(self, num=1):
+        """
+        Rotates the cards ``num`` steps to the right, like ``deque.rotate``.
+        If ``num`` is negative, rotates to the left.
+
+        :arg int num:
+            The number of steps to rotate.
+
+        """
+        size = len(self.codes)
+        if size:
+            num %= size
+            if num:
+                self.codes[:] = self.codes[-num:] + self.codes[:-num]
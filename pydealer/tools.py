@@ -19,15 +19,23 @@ of which are used by the classes in the PyDealer package, such as the functions
 # Imports
 #===============================================================================
 
+from collections import Counter
+from functools import lru_cache
+from itertools import islice
+from operator import index
 import random
 import time
 
-from pydealer.card import Card
+from pydealer.card import (
+    CARDS,
+    JOKER,
+    Card
+)
 from pydealer.const import (
     DEFAULT_RANKS,
-    VALUES,
-    SUITS
+    JOKER_CODE
 )
+from pydealer.ranks import compile_ranks
 
 # Dirty little try/except, to make PyDealer work with Python 3.
 try:
@@ -35,6 +43,19 @@ try:
 except:
     xrange = range
 
+# The 52 interned cards of a standard deck, in ``build_cards`` order.
+STANDARD_CARDS = CARDS[:JOKER_CODE]
+
+# Stacks with at least this many cards are sorted with ``counting_sort``.
+COUNTING_SORT_THRESHOLD = 1024
+
+# The search terms of each interned card, filled in by ``card_terms``.
+_CARD_TERMS = {}
+
+# The deck templates, keyed by the number of jokers, filled in by
+# ``deck_template``.
+_DECK_TEMPLATES = {}
+
 
 #===============================================================================
 # Utility Functions
@@ -43,7 +64,8 @@ except:
 def build_cards(jokers=False, num_jokers=0):
     """
     Builds a list containing a full French deck of 52 Card instances. The
-    cards are sorted according to ``DEFAULT_RANKS``.
+    cards are sorted according to ``DEFAULT_RANKS``. The cards are the shared
+    instances from the card registry, so no new cards are created.
 
     .. note:
         Adding jokers may break some functions & methods at the moment.
@@ -57,40 +79,70 @@ def build_cards(jokers=False, num_jokers=0):
         A list containing a full French deck of 52 Card instances.
 
     """
-    new_deck = []
-
-    if jokers:
-        new_deck += [Card("Joker", None) for i in xrange(num_jokers)]
-
-    new_deck += [Card(value, suit) for value in VALUES for suit in SUITS]
-
-    return new_deck
+    return list(deck_template(jokers, num_jokers))
 
 
-def check_sorted(cards, ranks=None):
+def check_sorted(cards, ranks=None, descending=True):
     """
-    Checks whether the given cards are sorted by the given ranks.
+    Checks whether the given cards are sorted by the given ranks. The cards
+    are checked in a single pass, without sorting a copy of them.
 
     :arg cards:
         The cards to check. Can be a ``Stack``, ``Deck``, or ``list`` of
         ``Card`` isntances.
-    :arg dict ranks:
-        The ranks to check against. Default is DEFAULT_RANKS.
+    :arg ranks:
+        The rank dict, or ``Ranks`` instance to check against. Default is
+        DEFAULT_RANKS.
+    :arg bool descending:
+        Whether or not cards sorted in descending order also count as
+        sorted.
 
     :returns:
         ``True`` or ``False``.
 
     """
-    ranks = ranks or DEFAULT_RANKS
+    key = compile_ranks(ranks).key
 
-    sorted_cards = sort_cards(cards, ranks)
+    keys = [key(card) for card in cards]
 
-    if cards == sorted_cards or cards[::-1] == sorted_cards:
+    if all(x <= y for x, y in zip(keys, keys[1:])):
         return True
+    elif descending:
+        return all(x >= y for x, y in zip(keys, keys[1:]))
     else:
         return False
 
 
+def card_terms(card):
+    """
+    Returns the normalized (lowercase) search terms that match the given
+    card: its full name, suit, value, abbreviation, and the first letters of
+    its suit and value.
+
+    :arg Card card:
+        The card to get the terms for.
+
+    :returns:
+        A tuple of the distinct search terms for the card.
+
+    """
+    try:
+        return _CARD_TERMS[card]
+    except KeyError:
+        pass
+
+    terms = [card.name, card.value, card.abbrev, card.value[0]]
+    if card.suit:
+        terms += [card.suit, card.suit[0]]
+
+    terms = tuple(set(term.lower() for term in terms))
+
+    if card.code is not None:
+        _CARD_TERMS[card] = terms
+
+    return terms
+
+
 def check_term(card, term):
     """
     Checks a given search term against a given card's full name, suit,
@@ -106,18 +158,11 @@ def check_term(card, term):
         ``True`` or ``False``.
 
     """
-    check_list = [
-        x.lower() for x in [card.name, card.suit, card.value, card.abbrev,
-        card.suit[0], card.value[0]]
-    ]
-
-    term = term.lower()
+    code = card.code
+    if code is not None:
+        return code in compile_term(term)
 
-    for check in check_list:
-        if check == term:
-            return True
-
-    return False
+    return term.lower() in card_terms(card)
 
 
 def compare_stacks(cards_x, cards_y, sorted=False):
@@ -152,6 +197,87 @@ def compare_stacks(cards_x, cards_y, sorted=False):
         return False
 
 
+@lru_cache(maxsize=1024)
+def compile_term(term):
+    """
+    Compiles the given search term into the set of codes of the cards it
+    matches, so that checking a card against the term is a single set
+    membership test. The results are cached, by the raw term.
+
+    :arg str term:
+        The search term. Can be a card full name, suit, value, or
+        abbreviation.
+
+    :returns:
+        A ``frozenset`` of the codes of the matching cards.
+
+    """
+    term = term.lower()
+
+    return frozenset(
+        card.code for card in CARDS if term in card_terms(card)
+    )
+
+
+def counting_sort(cards, ranks=None):
+    """
+    Sorts a given list of cards, by counting how many of each card there
+    are, and then laying them out in rank order. This takes linear time,
+    since there are only a handful of distinct cards. Falls back to a regular
+    sort if the stack contains cards outside of the card registry, or cards
+    that the ranks do not tell apart.
+
+    :arg cards:
+        The cards to sort.
+    :arg ranks:
+        The rank dict, or ``Ranks`` instance to reference for sorting. If
+        ``None``, it will default to ``DEFAULT_RANKS``.
+
+    :returns:
+        The sorted cards.
+
+    """
+    key = compile_ranks(ranks).key
+
+    counts = Counter(cards)
+    distinct = sorted(counts, key=key)
+
+    if (any(card.code is None for card in distinct) or
+            len(set(map(key, distinct))) != len(distinct)):
+        return sorted(cards, key=key)
+
+    sorted_cards = []
+    for card in distinct:
+        sorted_cards += [card] * counts[card]
+
+    return sorted_cards
+
+
+def deck_template(jokers=False, num_jokers=0):
+    """
+    Returns the cached, immutable template of a full French deck, which
+    ``build_cards``, and ``Deck.build`` copy the cards from. There is one
+    template for each number of jokers.
+
+    :arg bool jokers:
+        Whether or not to include jokers in the deck.
+    :arg int num_jokers:
+        The number of jokers to include.
+
+    :returns:
+        A tuple of the cards of the deck, in ``build_cards`` order.
+
+    """
+    num_jokers = num_jokers if jokers else 0
+
+    try:
+        return _DECK_TEMPLATES[num_jokers]
+    except KeyError:
+        template = (JOKER,) * num_jokers + STANDARD_CARDS
+        _DECK_TEMPLATES[num_jokers] = template
+        return template
+
+
 def find_card(cards, term, limit=0, sort=False, ranks=None):
     """
     Searches the given cards for cards with a value, suit, name, or
@@ -166,33 +292,19 @@ def find_card(cards, term, limit=0, sort=False, ranks=None):
         The number of items to retrieve for each term.
     :arg bool sort:
         Whether or not to sort the results, by poker ranks.
-    :arg dict ranks:
-        The rank dict to reference for sorting. If ``None``, it will
-        default to ``DEFAULT_RANKS``.
+    :arg ranks:
+        The rank dict, or ``Ranks`` instance to reference for sorting. If
+        ``None``, it will default to ``DEFAULT_RANKS``.
 
     :returns:
         A list of indices for the cards matching the given terms,
         if found.
 
     """
-    found_indices = []
-    count = 0
-
-    if not limit:
-        for i, card in enumerate(cards):
-            if check_term(card, term):
-                found_indices.append(i)
-    else:
-        for i, card in enumerate(cards):
-            if count < limit:
-                if check_term(card, term):
-                    found_indices.append(i)
-                    count += 1
-            else:
-                break
+    found_indices = list(islice(iter_matches(cards, term), limit or None))
 
     if sort:
-        found_indices = sort_card_indices(self, found_indices, ranks)
+        found_indices = sort_card_indices(cards, found_indices, ranks)
 
     return found_indices
 
@@ -211,9 +323,9 @@ def find_list(cards, terms, limit=0, sort=False, ranks=None):
         The number of items to retrieve for each term. 0 == no limit.
     :arg bool sort:
         Whether or not to sort the results, by poker ranks.
-    :arg dict ranks:
-        The rank dict to reference for sorting. If ``None``, it will
-        default to ``DEFAULT_RANKS``.
+    :arg ranks:
+        The rank dict, or ``Ranks`` instance to reference for sorting. If
+        ``None``, it will default to ``DEFAULT_RANKS``.
 
     :returns:
         A list of indices for the cards matching the given terms,
@@ -221,23 +333,15 @@ def find_list(cards, terms, limit=0, sort=False, ranks=None):
 
     """
     found_indices = []
-    count = 0
+    found = set()
 
-    if not limit:
-        for term in terms:
-            for i, card in enumerate(cards):
-                if check_term(card, term) and i not in found_indices:
-                    found_indices.append(i)
-    else:
-        for term in terms:
-            for i, card in enumerate(cards):
-                if count < limit:
-                    if check_term(card, term) and i not in found_indices:
-                        found_indices.append(i)
-                        count += 1
-                else:
-                    break
-            count = 0
+    for term in terms:
+        indices = iter_matches(cards, term)
+        if found:
+            indices = (i for i in indices if i not in found)
+        indices = list(islice(indices, limit or None))
+        found_indices += indices
+        found.update(indices)
 
     if sort:
         found_indices = sort_card_indices(cards, found_indices, ranks)
@@ -257,26 +361,20 @@ def get_card(cards, term, limit=0, sort=False, ranks=None):
         The number of items to retrieve for each term.
     :arg bool sort:
         Whether or not to sort the results, by poker ranks.
-    :arg dict ranks:
-        If ``sort=True``, the rank dict to refer to for sorting.
+    :arg ranks:
+        If ``sort=True``, the rank dict, or ``Ranks`` instance to refer to
+        for sorting.
 
     :returns:
         A copy of the given cards, with the found cards removed, and a list
         of the specified cards, if found.
 
     """
-    got_cards = []
-
-    try:
-        indices = find_card(cards, term, limit=limit)
-        got_cards = [cards[i] for i in indices]
-        cards = [v for i, v in enumerate(cards) if i not in indices]
-    except:
-        got_cards = [cards[term]]
-        cards = [v for i, v in enumerate(cards) if i is not term]
+    cards, got_cards = remove_indices(
+        cards, resolve_indices(cards, [term], limit))
 
     if sort:
-        got_cards = sort_cards(got_cards)
+        got_cards = sort_cards(got_cards, ranks)
 
     return cards, got_cards
 
@@ -294,33 +392,16 @@ def get_list(cards, terms, limit=0, sort=False, ranks=None):
         The number of items to retrieve for each term.
     :arg bool sort:
         Whether or not to sort the results, by poker ranks.
-    :arg dict ranks:
-        If ``sort=True``, the rank dict to refer to for sorting.
+    :arg ranks:
+        If ``sort=True``, the rank dict, or ``Ranks`` instance to refer to
+        for sorting.
 
     :returns:
         A list of the specified cards, if found.
 
     """
-    got_cards = []
-
-    try:
-        indices = find_list(cards, terms, limit=limit)
-        got_cards = [cards[i] for i in indices if cards[i]
-            not in got_cards]
-        cards = [v for i, v in enumerate(cards) if i not in indices]
-    except:
-        indices = []
-        for item in terms:
-            try:
-                card = cards[item]
-                if card not in got_cards:
-                    got_cards.append(card)
-                    indices.append(item)
-            except:
-                indices += find_card(cards, item, limit=limit)
-                got_cards += [cards[i] for i in indices if
-                    cards[i] not in got_cards]
-        cards = [v for i, v in enumerate(cards) if i not in indices]
+    cards, got_cards = remove_indices(
+        cards, resolve_indices(cards, terms, limit))
 
     if sort:
         got_cards = sort_cards(got_cards, ranks)
@@ -328,6 +409,30 @@ def get_list(cards, terms, limit=0, sort=False, ranks=None):
     return cards, got_cards
 
 
+def iter_matches(cards, term):
+    """
+    Iterates over the indices of the given cards, that match the given search
+    term. The term is compiled with ``compile_term``, so each card is checked
+    with a single set membership test.
+
+    :arg cards:
+        The cards to search. Can be a ``Stack``, ``Deck`` or ``list``.
+    :arg str term:
+        The search term. Can be a card full name, value, suit,
+        or abbreviation.
+
+    :returns:
+        An iterator over the indices of the matching cards, in order.
+
+    """
+    codes = compile_term(term)
+
+    for i, card in enumerate(cards):
+        code = card.code
+        if code in codes or (code is None and check_term(card, term)):
+            yield i
+
+
 def open_cards(filename=None):
     """
     Open cards from a txt file.
@@ -338,7 +443,8 @@ def open_cards(filename=None):
         and day. For example, "cards-20140711.txt".
 
     :returns:
-        The opened cards, as a list.
+        The opened cards, as a list. Standard cards are the shared instances
+        from the card registry.
 
     """
     filename = filename or "cards-%s.txt" % (time.strftime("%Y%m%d"))
@@ -349,31 +455,133 @@ def open_cards(filename=None):
     cards = [None] * len(card_data)
 
     for i, card in enumerate(card_data):
-        card = card.split()
-        cards[i] = Card(card[0], card[1])
+        value, suit = card.split()
+        cards[i] = Card(value, suit if suit != "None" else None)
 
     return cards
 
 
-def random_card(cards, remove=False):
+def random_card(cards, remove=False, preserve_order=True, rng=None):
     """
     Returns a random card from the Stack. If ``remove=True``, it will
-    also remove the card from the deck.
+    also remove the card from the deck. With ``preserve_order=False``, the
+    card is swapped with the last card before it is removed, which is O(1),
+    instead of O(n), but changes the order of the rest of the cards.
 
+    :arg cards:
+        The cards to pick from. Can be a ``Stack``, ``Deck`` or ``list``.
     :arg bool remove:
         Whether or not to remove the card from the deck.
+    :arg bool preserve_order:
+        If ``remove=True``, whether or not to keep the rest of the cards in
+        order. Defaults to ``True``.
+    :arg rng:
+        The random number generator to use, if the cards are not a
+        ``Stack``, which uses its own. Defaults to the global ``random``
+        module.
 
     :returns:
         A random Card object, from the Stack.
 
     """
+    rng = rng or random
+
     if not remove:
-        return random.choice(cards)
-    else:
-        i = random.randrange(len(cards))
-        card = cards[i]
+        return rng.choice(cards)
+    elif hasattr(cards, "draw_random"):
+        return cards.draw_random(preserve_order)
+
+    i = rng.randrange(len(cards))
+    card = cards[i]
+
+    if preserve_order:
         del cards[i]
-        return card
+    else:
+        last_card = cards.pop()
+        if i < len(cards):
+            cards[i] = last_card
+
+    return card
+
+
+def remove_indices(cards, indices):
+    """
+    Removes the cards at the given indices, in a single pass over the cards.
+
+    :arg cards:
+        The cards to remove from. Can be a ``Stack``, ``Deck`` or ``list``.
+        The given cards are not changed.
+    :arg list indices:
+        The indices of the cards to remove, without duplicates, such as the
+        ones returned by ``resolve_indices``. Must not be negative.
+
+    :returns:
+        A list of the remaining cards, and a list of the removed cards, in
+        the order of the given indices.
+
+    """
+    cards = list(cards)
+    got_cards = [cards[i] for i in indices]
+
+    if len(indices) == 1:
+        del cards[indices[0]]
+    elif indices:
+        indices = set(indices)
+        cards = [card for i, card in enumerate(cards) if i not in indices]
+
+    return cards, got_cards
+
+
+def resolve_indices(cards, terms, limit=0, find=None):
+    """
+    Resolves the given mix of stack indices, and search terms into a list of
+    stack indices, without duplicates. Duplicates are dropped by index, not
+    by comparing the cards, so identical cards (such as in a multi-deck
+    stack) are all kept.
+
+    :arg cards:
+        The cards the terms refer to. Can be a ``Stack``, ``Deck`` or
+        ``list``.
+    :arg list terms:
+        A list of card's full names, values, suits, abbreviations, or stack
+        indices. Negative indices count from the end of the cards.
+    :arg int limit:
+        The number of items to retrieve for each search term. ``0`` equals
+        no limit.
+    :arg find:
+        A function that takes a search term, and returns the ascending
+        indices of the matching cards. Defaults to ``iter_matches``.
+
+    :returns:
+        A list of stack indices, in the order of the terms. Raises
+        ``IndexError`` if an index is out of range.
+
+    """
+    size = len(cards)
+    find = find or (lambda term: iter_matches(cards, term))
+
+    found_indices = []
+    found = set()
+
+    for term in terms:
+        try:
+            i = index(term)
+        except TypeError:
+            indices = find(term)
+            if found:
+                indices = (i for i in indices if i not in found)
+            indices = list(islice(indices, limit or None))
+        else:
+            if i < 0:
+                i += size
+            if not 0 <= i < size:
+                raise IndexError("The index (%s) is out of range." % (term,))
+            indices = [i] if i not in found else []
+
+        found_indices += indices
+        found.update(indices)
+
+    return found_indices
 
 
 def save_cards(cards, filename=None):
@@ -407,27 +615,17 @@ def sort_card_indices(cards, indices, ranks=None):
         ``list``
     :arg list indices:
         The indices to sort.
-    :arg dict ranks:
-        The rank dict to reference for sorting. If ``None``, it will
-        default to ``DEFAULT_RANKS``.
+    :arg ranks:
+        The rank dict, or ``Ranks`` instance to reference for sorting. If
+        ``None``, it will default to ``DEFAULT_RANKS``.
 
     :returns:
         The sorted indices.
 
     """
-    ranks = ranks or DEFAULT_RANKS
+    key = compile_ranks(ranks).key
 
-    if ranks.get("suits"):
-        indices = sorted(
-            indices,
-            key=lambda x: ranks["suits"][cards[x].suit] if
-                cards[x].suit != None else 0
-        )
-    if ranks.get("values"):
-        indices = sorted(
-            indices,
-            key=lambda x: ranks["values"][cards[x].value]
-        )
+    indices = sorted(indices, key=lambda x: key(cards[x]))
 
     return indices
 
@@ -435,28 +633,22 @@ def sort_card_indices(cards, indices, ranks=None):
 def sort_cards(cards, ranks=None):
     """
     Sorts a given list of cards, either by poker ranks, or big two ranks.
+    Each card is sorted by a single composite key (value rank, then suit
+    rank). Large stacks are sorted with ``counting_sort``.
 
     :arg cards:
         The cards to sort.
-    :arg dict ranks:
-        The rank dict to reference for sorting. If ``None``, it will
-        default to ``DEFAULT_RANKS``.
+    :arg ranks:
+        The rank dict, or ``Ranks`` instance to reference for sorting. If
+        ``None``, it will default to ``DEFAULT_RANKS``.
 
     :returns:
         The sorted cards.
 
     """
-    ranks = ranks or DEFAULT_RANKS
+    ranks = compile_ranks(ranks)
 
-    if ranks.get("suits"):
-        cards = sorted(
-            cards,
-            key=lambda x: ranks["suits"][x.suit] if x.suit != None else 0
-        )
-    if ranks.get("values"):
-        cards = sorted(
-            cards,
-            key=lambda x: ranks["values"][x.value]
-        )
+    if len(cards) >= COUNTING_SORT_THRESHOLD:
+        return counting_sort(cards, ranks)
 
-    return cards
\ No newline at end of file
+    return sorted(cards, key=ranks.key)
\ No newline at end of file
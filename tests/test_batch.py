@@ -0,0 +1,165 @@
+#===============================================================================
+# PyDealer - Tests - Deck Batch
+#-------------------------------------------------------------------------------
+# Version: 1.4.0
+# Updated: 10-01-2015
+# Author: Alex Crawford
+# License: GPLv3
+#===============================================================================
+
+#===============================================================================
+# Imports
+#===============================================================================
+
+import unittest
+
+import pydealer
+from pydealer.batch import (
+    DeckBatch,
+    numpy,
+    overhand_codes,
+    riffle_codes,
+    rising_sequences,
+    strip_codes,
+    to_cards
+)
+from pydealer.const import BLOCK
+
+
+#===============================================================================
+# TestDeckBatch Class
+#===============================================================================
+
+@unittest.skipIf(numpy is None, "NumPy is not installed.")
+class TestDeckBatch(unittest.TestCase):
+
+    def setUp(self):
+        """"""
+        self.batch = DeckBatch(100, rng=1)
+
+    def test_build(self):
+        """"""
+        self.assertEqual(len(self.batch), 100)
+        self.assertEqual(self.batch.size, 52)
+        self.assertEqual(self.batch.codes.dtype, numpy.int8)
+        self.assertEqual(self.batch.codes[7].tolist(), list(range(52)))
+
+    def test_deal(self):
+        """"""
+        cards = self.batch.deal(3)
+
+        self.assertEqual(cards.shape, (100, 3))
+        self.assertEqual(cards[0].tolist(), [51, 50, 49])
+        self.assertEqual(self.batch.size, 49)
+        self.assertEqual(self.batch.deal(60).shape, (100, 49))
+        self.assertEqual(self.batch.deal().shape, (100, 0))
+
+    def test_deal_hands(self):
+        """"""
+        hands = self.batch.deal_hands(3, 2)
+        blocks = self.batch.deal_hands(2, 3, BLOCK)
+
+        self.assertEqual(hands.shape, (100, 3, 2))
+        self.assertEqual(hands[0].tolist(), [[51, 48], [50, 47], [49, 46]])
+        self.assertEqual(blocks[0].tolist(), [[45, 44, 43], [42, 41, 40]])
+        self.assertRaises(ValueError, self.batch.deal_hands, 10, 5)
+        self.assertRaises(ValueError, self.batch.deal_hands, 2, 2, "spiral")
+
+    def test_shuffle(self):
+        """"""
+        self.batch.shuffle()
+        self.batch.burn()
+        dealt = numpy.hstack([self.batch.deal(20), self.batch.deal(10)])
+        rest = self.batch.codes[:, :self.batch.size]
+
+        self.assertEqual(self.batch.size, 21)
+        self.assertEqual(rest.shape, (100, 21))
+        self.assertNotEqual(dealt[0].tolist(), dealt[1].tolist())
+        for i in range(100):
+            self.assertEqual(len(set(dealt[i].tolist() + rest[i].tolist())),
+                51)
+
+    def test_shuffle_uniform(self):
+        """"""
+        batch = DeckBatch(30000, rng=2)
+        batch.shuffle()
+
+        counts = numpy.bincount(batch.deal(2)[:, 1], minlength=52)
+
+        self.assertTrue(counts.min() > 450)
+        self.assertTrue(counts.max() < 700)
+
+    def test_shuffle_exact(self):
+        """"""
+        batch = DeckBatch(10, rng=5)
+        batch.shuffle()
+
+        picks = numpy.random.default_rng(5).integers(0, [[52]],
+            size=(1, 10), dtype=numpy.intp)
+
+        self.assertEqual(batch.deal(1)[:, 0].tolist(), picks[0].tolist())
+        self.assertEqual(batch.size, 51)
+
+    def test_shuffle_seed(self):
+        """"""
+        batch = DeckBatch(100, rng=1)
+
+        self.batch.shuffle()
+        batch.shuffle()
+
+        self.assertEqual(self.batch.deal(5).tolist(), batch.deal(5).tolist())
+        self.assertEqual(self.batch.codes.tolist(), batch.codes.tolist())
+
+    def test_to_cards(self):
+        """"""
+        cards = to_cards(self.batch.deal_hands(2, 2))
+
+        self.assertEqual(cards.shape, (100, 2, 2))
+        self.assertIs(cards[0, 0, 0], pydealer.card.CARDS[51])
+
+    def test_to_stacks(self):
+        """"""
+        self.batch.deal(2)
+
+        stacks = self.batch.to_stacks()
+
+        self.assertEqual(len(stacks), 100)
+        self.assertEqual(list(stacks[3]), pydealer.tools.build_cards()[:50])
+
+    def test_shuffle_method(self):
+        """"""
+        self.batch.deal(2)
+
+        self.batch.shuffle(3, method="riffle")
+
+        self.assertEqual(self.batch.size, 50)
+        self.assertEqual(self.batch.codes[:, 50:].tolist(), [[50, 51]] * 100)
+        self.assertEqual(numpy.sort(self.batch.codes, axis=1).tolist(),
+            [list(range(52))] * 100)
+        self.assertTrue(rising_sequences(self.batch.codes[:, :50]).max() <= 8)
+        self.assertRaises(ValueError, self.batch.shuffle, method="faro")
+
+    def test_overhand_codes(self):
+        """"""
+        codes = numpy.tile(numpy.arange(52, dtype=numpy.int8), (10, 1))
+
+        self.assertEqual(overhand_codes(codes, self.batch.rng, 0).tolist(),
+            codes.tolist())
+        self.assertEqual(overhand_codes(codes, self.batch.rng, 1).tolist(),
+            codes[:, ::-1].tolist())
+        self.assertEqual(numpy.sort(strip_codes(codes, self.batch.rng),
+            axis=1).tolist(), codes.tolist())
+
+    def test_riffle_codes(self):
+        """"""
+        codes = numpy.tile(numpy.array([0, 1], dtype=numpy.int8), (40000, 1))
+
+        shuffled_codes = riffle_codes(codes, self.batch.rng)
+
+        self.assertTrue(9500 < shuffled_codes[:, 0].sum() < 10500)
+
+    def test_rising_sequences(self):
+        """"""
+        codes = numpy.array([[0, 1, 2, 3], [3, 2, 1, 0], [2, 0, 3, 1]])
+
+        self.assertEqual(rising_sequences(codes).tolist(), [1, 4, 2])
@@ -11,6 +11,7 @@
 # Imports
 #===============================================================================
 
+import pickle
 import unittest
 
 import pydealer
@@ -38,6 +39,88 @@ class TestCard(unittest.TestCase):
 
         self.assertEqual(name, "Ace of Spades")
 
+    def test_compare_cards(self):
+        """"""
+        cards = pydealer.tools.build_cards()
+        big2_values = {"values": pydealer.const.BIG2_RANKS["values"]}
+        for ranks in [None, pydealer.const.BIG2_RANKS, big2_values,
+                pydealer.const.POKER_RANKS["values"],
+                pydealer.ranks.compile_ranks(pydealer.const.BIG2_RANKS)]:
+            key = pydealer.ranks.compile_ranks(ranks).key
+            for card in cards[::5]:
+                for other in cards[::3]:
+                    expected = (key(card) > key(other)) - \
+                        (key(card) < key(other))
+                    self.assertEqual(
+                        pydealer.card.compare_cards(card, other, ranks),
+                        expected)
+
+    def test_interned(self):
+        """"""
+        ace_spades = pydealer.Card("ace", "spades")
+
+        self.assertIs(self.card, ace_spades)
+        self.assertIs(pydealer.Card("Joker", None), pydealer.card.JOKER)
+
+    def test_not_interned(self):
+        """"""
+        card_x = pydealer.Card("Knight", "Swords")
+        card_y = pydealer.Card("Knight", "Swords")
+
+        self.assertIsNot(card_x, card_y)
+        self.assertEqual(card_x, card_y)
+        self.assertIsNone(card_x.code)
+
+    def test_lookup_abbrev(self):
+        """"""
+        self.assertIs(pydealer.card.lookup_abbrev("as"), self.card)
+        self.assertIs(pydealer.card.lookup_abbrev("10H"),
+            pydealer.Card("10", "Hearts"))
+        self.assertIsNone(pydealer.card.lookup_abbrev("ZZ"))
+
+    def test_lookup_card(self):
+        """"""
+        self.assertIs(pydealer.card.lookup_card("Ace", "Spades"), self.card)
+        self.assertIsNone(pydealer.card.lookup_card("Knight", "Swords"))
+
+    def test_lookup_code(self):
+        """"""
+        self.assertIs(pydealer.card.lookup_code(self.card.code), self.card)
+        self.assertEqual(pydealer.card.lookup_code(0).name, "2 of Diamonds")
+        self.assertIsNone(pydealer.card.lookup_code(99))
+
+    def test_immutable(self):
+        """"""
+        with self.assertRaises(AttributeError):
+            self.card.value = "King"
+        with self.assertRaises(AttributeError):
+            del self.card.suit
+        with self.assertRaises(AttributeError):
+            self.card.foo = "bar"
+
+    def test_code(self):
+        """"""
+        self.assertEqual(pydealer.Card("2", "Diamonds").code, 0)
+        self.assertEqual(self.card.code, 51)
+        self.assertEqual(pydealer.Card("Joker", None).code,
+            pydealer.const.JOKER_CODE)
+
+    def test_ordinal(self):
+        """"""
+        two_diamonds = pydealer.Card("2", "Diamonds")
+        two_spades = pydealer.Card("2", "Spades")
+        three_diamonds = pydealer.Card("3", "Diamonds")
+
+        self.assertLess(two_diamonds.ordinal, two_spades.ordinal)
+        self.assertLess(two_spades.ordinal, three_diamonds.ordinal)
+        self.assertIsNone(pydealer.Card("Knight", "Swords").ordinal)
+
+    def test_pickle(self):
+        """"""
+        card = pickle.loads(pickle.dumps(self.card))
+
+        self.assertIs(card, self.card)
+
     def test_value(self):
         """"""
         self.assertEqual(self.card.value, "Ace")
@@ -0,0 +1,105 @@
+#===============================================================================
+# PyDealer - Tests - Codec
+#-------------------------------------------------------------------------------
+# Version: 1.4.0
+# Updated: 10-01-2015
+# Author: Alex Crawford
+# License: GPLv3
+#===============================================================================
+
+#===============================================================================
+# Imports
+#===============================================================================
+
+import unittest
+
+import pydealer
+from pydealer import codec
+
+
+#===============================================================================
+# TestCodec Class
+#===============================================================================
+
+class TestCodec(unittest.TestCase):
+
+    def setUp(self):
+        """"""
+        self.ace_spades = pydealer.Card("Ace", "Spades")
+        self.two_diamonds = pydealer.Card("2", "Diamonds")
+        self.cards = [self.ace_spades, self.two_diamonds]
+        self.deck = pydealer.Deck()
+
+    def test_count_mask(self):
+        """"""
+        self.assertEqual(codec.count_mask(codec.DECK_MASK), 52)
+        self.assertEqual(codec.count_mask(0), 0)
+
+    def test_from_bytes(self):
+        """"""
+        cards = codec.from_bytes(b"\x33\x00")
+
+        self.assertEqual(cards, self.cards)
+        self.assertRaises(ValueError, codec.from_bytes, b"\x00\x40")
+
+    def test_from_code(self):
+        """"""
+        self.assertIs(codec.from_code(51), self.ace_spades)
+        self.assertRaises(ValueError, codec.from_code, 99)
+
+    def test_from_codes(self):
+        """"""
+        cards = codec.from_codes([51, 0])
+
+        self.assertEqual(cards, self.cards)
+        self.assertRaises(ValueError, codec.from_codes, [0, -1])
+
+    def test_from_mask(self):
+        """"""
+        cards = codec.from_mask((1 << 51) | 1)
+
+        self.assertEqual(cards, [self.two_diamonds, self.ace_spades])
+        self.assertRaises(ValueError, codec.from_mask, 1 << 60)
+
+    def test_to_bytes(self):
+        """"""
+        shoe = pydealer.Shoe(num_decks=2, lazy_shuffle=True)
+        shoe.shuffle()
+
+        data = codec.to_bytes(shoe)
+
+        self.assertEqual(codec.to_bytes(self.deck), bytes(bytearray(range(52))))
+        self.assertEqual(codec.to_bytes(self.cards), b"\x33\x00")
+        self.assertEqual(codec.from_bytes(data), list(shoe))
+        self.assertEqual(len(data), 104)
+
+    def test_to_code(self):
+        """"""
+        self.assertEqual(codec.to_code(self.ace_spades), 51)
+        self.assertRaises(ValueError, codec.to_code,
+            pydealer.Card("Knight", "Swords"))
+
+    def test_to_codes(self):
+        """"""
+        codes = codec.to_codes(self.deck)
+
+        self.assertEqual(codes, list(range(52)))
+        self.assertEqual(codec.from_codes(codes), list(self.deck.cards))
+
+    def test_to_mask(self):
+        """"""
+        self.assertEqual(codec.to_mask(self.deck), codec.DECK_MASK)
+        self.assertEqual(codec.to_mask(self.cards + self.cards),
+            (1 << 51) | 1)
+
+    def test_mask_set_ops(self):
+        """"""
+        hand = codec.to_mask(self.cards)
+        live = codec.DECK_MASK & ~hand
+
+        self.assertEqual(codec.count_mask(live), 50)
+        self.assertFalse(live & (1 << self.ace_spades.code))
+
+
+# if __name__ == '__main__':
+#     unittest.main()
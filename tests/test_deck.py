@@ -11,6 +11,7 @@
 # Imports
 #===============================================================================
 
+from collections import deque
 import unittest
 
 import pydealer
@@ -40,6 +41,35 @@ class TestDeck(unittest.TestCase):
 
         self.assertEqual(len(self.empty_deck.cards), 52)
 
+    def test_init_fast_path(self):
+        """"""
+        class BigDeck(pydealer.Deck):
+            def build(self):
+                self.add(pydealer.tools.build_cards() * 2)
+
+        deck = pydealer.Deck(build=True, jokers=False)
+
+        self.assertEqual(self.deck, deck)
+        self.assertEqual(self.deck.decks_used, deck.decks_used)
+        self.assertEqual(self.deck.rebuild, deck.rebuild)
+        self.assertEqual(self.deck.ranks, deck.ranks)
+        self.assertEqual(BigDeck().size, 104)
+        self.deck.add(self.deck.deal(5), pydealer.BOTTOM)
+        self.assertEqual(len(self.deck.find("Spades")), 13)
+
+    def test_init_fast_path_attrs(self):
+        """"""
+        deck = pydealer.Deck()
+        other = pydealer.Deck(build=True, store=deque)
+
+        attrs = vars(deck)
+        other_attrs = vars(other)
+
+        self.assertEqual(sorted(attrs), sorted(other_attrs))
+        self.assertEqual(list(attrs.pop("_cards")),
+            list(other_attrs.pop("_cards")))
+        self.assertEqual(attrs, other_attrs)
+
     def test_deal(self):
         """"""
         card_names = ["Ace of Spades", "Ace of Hearts",
@@ -50,6 +80,19 @@ class TestDeck(unittest.TestCase):
         for i, name in enumerate(card_names):
             self.assertEqual(dealt_cards[i].name, name)
 
+    def test_deal_lazy_shuffle(self):
+        """"""
+        deck = pydealer.Deck(lazy_shuffle=True, rebuild=True, re_shuffle=True)
+        deck.shuffle()
+
+        cards = deck.deal(60)
+
+        self.assertEqual(deck.size, 44)
+        self.assertEqual(deck.decks_used, 2)
+        self.assertEqual(sorted(cards[:52], key=id),
+            sorted(pydealer.tools.build_cards(), key=id))
+        self.assertNotEqual(list(cards[:52]), pydealer.tools.build_cards())
+
     def test_deal_rebuild(self):
         """"""
         card_names = ["Ace of Spades", "Ace of Hearts",
@@ -61,6 +104,107 @@ class TestDeck(unittest.TestCase):
 
         self.assertEquals(self.deck.size, 51)
 
+    def test_deal_rebuild_indexed(self):
+        """"""
+        deck = pydealer.Deck(rebuild=True, indexed=True)
+        ace_spades = pydealer.Card("Ace", "Spades")
+
+        deck.deal(53)
+
+        self.assertEqual(deck.count(ace_spades), 0)
+        self.assertEqual(deck.count(pydealer.Card("2", "Diamonds")), 1)
+
+    def test_deal_codes_rebuild(self):
+        """"""
+        self.deck.rebuild = True
+
+        codes = self.deck.deal_codes(104)
+
+        self.assertEqual(sorted(codes), sorted(list(range(52)) * 2))
+        self.assertEqual(self.deck.size, 0)
+        self.assertEqual(self.deck.decks_used, 2)
+
+    def test_deal_hands(self):
+        """"""
+        top = self.deck[::-1]
+
+        hands = self.deck.deal_hands(4, 3)
+
+        self.assertEqual(len(hands), 4)
+        for i, hand in enumerate(hands):
+            self.assertIsInstance(hand, pydealer.Stack)
+            self.assertEqual(list(hand), top[i:12:4])
+        self.assertEqual(self.deck.size, 40)
+
+    def test_deal_hands_block(self):
+        """"""
+        top = self.deck[::-1]
+        hands = [pydealer.Stack(cards=[top[-1]]) for _ in range(4)]
+
+        result = self.deck.deal_hands(4, 3, order=pydealer.BLOCK, hands=hands)
+
+        self.assertIs(result, hands)
+        for i, hand in enumerate(hands):
+            self.assertEqual(list(hand)[1:], top[i * 3:i * 3 + 3])
+        self.assertRaises(ValueError, self.deck.deal_hands, 2, 1,
+            hands=hands)
+        self.assertRaises(ValueError, self.deck.deal_hands, 2, 1,
+            order="spiral")
+
+    def test_deal_hands_codes(self):
+        """"""
+        self.deck.rebuild = True
+
+        hands = self.deck.deal_hands(10, 6, codes=True)
+
+        self.assertEqual([len(hand) for hand in hands], [6] * 10)
+        self.assertIsInstance(hands[0][0], int)
+        self.assertEqual(self.deck.size, 44)
+
+    def test_deal_hands_short(self):
+        """"""
+        hands = self.deck.deal_hands(5, 11)
+
+        self.assertEqual([hand.size for hand in hands], [11, 11, 10, 10, 10])
+        self.assertEqual(self.deck.size, 0)
+
+    def test_deal_into(self):
+        """"""
+        hands = [pydealer.Stack() for _ in range(10)]
+
+        for _ in range(2):
+            for hand in hands:
+                self.deck.deal_into(hand)
+
+        self.assertEqual(self.deck.size, 32)
+        self.assertEqual([hand.size for hand in hands], [2] * 10)
+        self.assertEqual(self.deck.deal_into(hands[0], 40), 32)
+        self.assertEqual(self.deck.deal_into(hands[0], 5, rebuild=True), 5)
+        self.assertEqual(self.deck.size, 47)
+
+    def test_stream(self):
+        """"""
+        stream = self.deck.stream()
+
+        cards = [next(stream) for _ in range(156)]
+
+        self.assertEqual(self.deck.size, 0)
+        self.assertEqual(self.deck.decks_used, 3)
+        for i in range(0, 156, 52):
+            self.assertEqual(sorted(cards[i:i + 52], key=id),
+                sorted(pydealer.tools.build_cards(), key=id))
+
+    def test_stream_chunks(self):
+        """"""
+        self.deck.deal(50)
+        stream = self.deck.stream(size=5, codes=True)
+
+        chunks = [next(stream) for _ in range(21)]
+
+        self.assertEqual([len(chunk) for chunk in chunks], [5] * 21)
+        codes = sum(chunks, [])
+        self.assertEqual(sorted(codes[2:54]), list(range(52)))
+
     def test_repr(self):
         """"""
         result = repr(self.empty_deck)
@@ -0,0 +1,101 @@
+#===============================================================================
+# PyDealer - Tests - Provably Fair Shuffles
+#-------------------------------------------------------------------------------
+# Version: 1.4.0
+# Updated: 10-01-2015
+# Author: Alex Crawford
+# License: GPLv3
+#===============================================================================
+
+#===============================================================================
+# Imports
+#===============================================================================
+
+from hashlib import sha256
+import unittest
+
+import pydealer
+from pydealer import fair
+from pydealer.batch import numpy
+from pydealer.codec import to_bytes
+
+
+#===============================================================================
+# TestFair Class
+#===============================================================================
+
+class TestFair(unittest.TestCase):
+
+    def setUp(self):
+        """"""
+        self.server_seed = "server"
+        self.client_seed = "client"
+
+    def test_fair_seed(self):
+        """"""
+        seed = fair.fair_seed(self.server_seed, self.client_seed)
+
+        self.assertEqual(len(seed), 32)
+        self.assertEqual(seed, fair.fair_seed(b"server", b"client"))
+        self.assertNotEqual(seed, fair.fair_seed("server", "client2"))
+        self.assertRaises(TypeError, fair.fair_seed, 1, "client")
+
+    def test_fair_deck(self):
+        """"""
+        deck = fair.fair_deck(self.server_seed, self.client_seed, 3)
+
+        self.assertEqual(deck, fair.fair_deck("server", "client", 3))
+        self.assertNotEqual(deck, fair.fair_deck("server", "client", 4))
+        self.assertEqual(sorted(deck, key=id),
+            sorted(pydealer.tools.build_cards(), key=id))
+
+    def test_commit(self):
+        """"""
+        deck, commitment = fair.commit(self.server_seed, self.client_seed, 5)
+        seed = fair.fair_seed(self.server_seed, self.client_seed)
+        order = b"\x05" + b"\x00" * 7 + to_bytes(deck)
+
+        self.assertEqual(deck, fair.fair_deck("server", "client", 5))
+        self.assertEqual(commitment, sha256(seed + order).hexdigest())
+
+    def test_verify(self):
+        """"""
+        commitment = fair.commit(self.server_seed, self.client_seed, 5)[1]
+
+        self.assertTrue(fair.verify(commitment, "server", "client", 5))
+        self.assertFalse(fair.verify(commitment, "server", "client", 6))
+        self.assertFalse(fair.verify(commitment, "server2", "client", 5))
+        self.assertFalse(fair.verify(commitment, "server", "client2", 5))
+
+    def test_commit_many(self):
+        """"""
+        commitments = fair.commit_many(self.server_seed, self.client_seed,
+            range(10, 20))
+
+        self.assertEqual(len(set(commitments)), 10)
+        self.assertEqual(commitments, [fair.commit("server", "client", i)[1]
+            for i in range(10, 20)])
+
+    def test_commit_orders(self):
+        """"""
+        decks = [pydealer.Deck.from_seed(1, i) for i in range(3)]
+        orders = [to_bytes(deck) for deck in decks]
+
+        commitments = fair.commit_orders(orders, "salt")
+
+        self.assertEqual(commitments[1],
+            sha256(b"salt" + orders[1]).hexdigest())
+        self.assertEqual(fair.commit_orders(decks, b"salt"), commitments)
+        self.assertNotEqual(fair.commit_orders(orders), commitments)
+
+    @unittest.skipIf(numpy is None, "NumPy is not installed.")
+    def test_commit_orders_batch(self):
+        """"""
+        batch = pydealer.DeckBatch(5, rng=1)
+        batch.shuffle()
+
+        commitments = fair.commit_orders(batch.codes, "salt")
+
+        self.assertEqual(commitments, fair.commit_orders(batch.to_stacks(),
+            "salt"))
+        self.assertEqual(len(set(commitments)), 5)
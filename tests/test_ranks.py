@@ -0,0 +1,130 @@
+#===============================================================================
+# PyDealer - Tests - Ranks
+#-------------------------------------------------------------------------------
+# Version: 1.4.0
+# Updated: 10-01-2015
+# Author: Alex Crawford
+# License: GPLv3
+#===============================================================================
+
+#===============================================================================
+# Imports
+#===============================================================================
+
+import random
+import unittest
+
+import pydealer
+from pydealer.const import (
+    BIG2_RANKS,
+    DEFAULT_RANKS,
+    POKER_RANKS
+)
+from pydealer.ranks import (
+    Ranks,
+    compile_ranks
+)
+
+
+#===============================================================================
+# TestRanks Class
+#===============================================================================
+
+class TestRanks(unittest.TestCase):
+
+    def setUp(self):
+        """"""
+        self.ace_spades = pydealer.Card("Ace", "Spades")
+        self.ace_hearts = pydealer.Card("Ace", "Hearts")
+        self.two_spades = pydealer.Card("2", "Spades")
+        self.cards = pydealer.tools.build_cards()
+        random.shuffle(self.cards)
+
+    def two_pass_sort(self, cards, ranks):
+        """"""
+        if ranks.get("suits"):
+            cards = sorted(cards, key=lambda x: ranks["suits"][x.suit])
+        if ranks.get("values"):
+            cards = sorted(cards, key=lambda x: ranks["values"][x.value])
+
+        return cards
+
+    def test_compile_cached(self):
+        """"""
+        ranks = compile_ranks(BIG2_RANKS)
+
+        self.assertIs(compile_ranks(BIG2_RANKS), ranks)
+        self.assertIs(compile_ranks(ranks), ranks)
+        self.assertIs(compile_ranks(), compile_ranks(DEFAULT_RANKS))
+
+    def test_compile_changed(self):
+        """"""
+        ranks = {
+            "values": dict(DEFAULT_RANKS["values"]),
+            "suits": dict(DEFAULT_RANKS["suits"])
+        }
+        cards = pydealer.tools.sort_cards(self.cards, ranks)
+        self.assertTrue(self.ace_spades.gt(self.ace_hearts, ranks))
+
+        ranks["suits"]["Hearts"] = 9
+
+        self.assertTrue(self.ace_hearts.gt(self.ace_spades, ranks))
+        self.assertEqual(pydealer.tools.sort_cards(self.cards, ranks),
+            self.two_pass_sort(self.cards, ranks))
+        self.assertNotEqual(pydealer.tools.sort_cards(self.cards, ranks),
+            cards)
+        self.assertIs(compile_ranks(ranks), compile_ranks(ranks))
+
+    def test_key_order(self):
+        """"""
+        for rank_dict in [DEFAULT_RANKS, BIG2_RANKS, POKER_RANKS]:
+            ranks = Ranks(rank_dict)
+            self.assertEqual(
+                sorted(self.cards, key=ranks.key),
+                self.two_pass_sort(self.cards, rank_dict)
+            )
+
+    def test_flat_dict(self):
+        """"""
+        ranks = Ranks(POKER_RANKS["values"])
+
+        self.assertTrue(self.ace_spades.eq(self.ace_hearts, ranks))
+        self.assertTrue(self.ace_spades.gt(self.two_spades, ranks))
+
+    def test_suits_only(self):
+        """"""
+        ranks = Ranks({"suits": BIG2_RANKS["suits"]})
+
+        self.assertTrue(self.two_spades.eq(self.ace_spades, ranks))
+        self.assertTrue(self.two_spades.gt(self.ace_hearts, ranks))
+
+    def test_trump_order(self):
+        """"""
+        trumps = {
+            "values": POKER_RANKS["values"],
+            "suits": {"Hearts": 10, "Spades": 1, "Clubs": 1, "Diamonds": 1}
+        }
+
+        self.assertTrue(self.ace_hearts.gt(self.ace_spades, trumps))
+        self.assertTrue(self.ace_spades.gt(self.two_spades, trumps))
+
+    def test_missing_value(self):
+        """"""
+        ranks = Ranks({"values": {"Ace": 1}})
+
+        self.assertEqual(ranks.key(self.ace_spades), 1)
+        self.assertRaises(KeyError, ranks.key, self.two_spades)
+
+    def test_non_int_ranks(self):
+        """"""
+        ranks = Ranks({
+            "values": {"Ace": 1.5, "2": 0.5},
+            "suits": BIG2_RANKS["suits"]
+        })
+
+        self.assertTrue(self.ace_hearts.gt(self.two_spades, ranks))
+        self.assertTrue(self.ace_spades.gt(self.ace_hearts, ranks))
+
+
+# if __name__ == '__main__':
+#     unittest.main()
@@ -0,0 +1,304 @@
+#===============================================================================
+# PyDealer - Tests - RNG
+#-------------------------------------------------------------------------------
+# Version: 1.4.0
+# Updated: 10-01-2015
+# Author: Alex Crawford
+# License: GPLv3
+#===============================================================================
+
+#===============================================================================
+# Imports
+#===============================================================================
+
+import os
+import pickle
+import random
+import unittest
+
+import pydealer
+from pydealer.rng import (
+    CounterRNG,
+    NumPyRNG,
+    SecureRNG,
+    make_randbelow,
+    make_rng,
+    numpy,
+    secure_rng,
+    spawn_rngs
+)
+
+
+#===============================================================================
+# IntRNG Class
+#===============================================================================
+
+class IntRNG(CounterRNG):
+    """
+    A CounterRNG that can not make floats, to check that random indices
+    are exact.
+
+    """
+    # Otherwise random.Random would make _randbelow from random.
+    _randbelow = CounterRNG._randbelow
+
+    def random(self):
+        """"""
+        raise AssertionError("Random indices should not use floats.")
+
+
+#===============================================================================
+# TestRNG Class
+#===============================================================================
+
+class TestRNG(unittest.TestCase):
+
+    def test_make_rng(self):
+        """"""
+        rng = random.Random(1)
+
+        self.assertIsNone(make_rng())
+        self.assertIs(make_rng(rng), rng)
+        self.assertEqual(make_rng(5).random(), random.Random(5).random())
+
+    def test_make_randbelow(self):
+        """"""
+        rng = CounterRNG(2)
+        randbelow = make_randbelow(rng)
+        counts = [0] * 3
+        for _ in range(6000):
+            counts[randbelow(3)] += 1
+
+        self.assertEqual(make_randbelow(), random.randrange)
+        self.assertEqual(randbelow, rng._randbelow)
+        self.assertTrue(all(1800 < num < 2200 for num in counts))
+        self.assertTrue(0 <= randbelow(1 << 70) < 1 << 70)
+
+    def test_exact_indices(self):
+        """"""
+        deck = pydealer.Deck(rng=IntRNG(3), lazy_shuffle=True)
+        deck.shuffle()
+
+        cards = deck.deal(5) + deck.sample(5) + deck.draw_random_many(5)
+        cards.add([deck.random_card(remove=True)])
+        cards.add(next(deck.stream(5)))
+
+        self.assertEqual(len(cards), 21)
+        self.assertEqual(deck.size, 0)
+
+    def test_deck_rng(self):
+        """"""
+        deck_x = pydealer.Deck(rng=random.Random(3))
+        deck_y = pydealer.Deck(rng=3)
+
+        deck_x.shuffle()
+        deck_y.shuffle()
+
+        self.assertEqual(deck_x, deck_y)
+        self.assertNotEqual(list(deck_x), pydealer.tools.build_cards())
+
+    def test_deck_rng_global(self):
+        """"""
+        deck = pydealer.Deck(rng=11)
+        state = random.getstate()
+
+        deck.shuffle()
+        deck.random_card(remove=True)
+        next(deck.stream())
+
+        self.assertEqual(random.getstate(), state)
+
+    def test_lazy_rng(self):
+        """"""
+        hands = []
+        for _ in range(2):
+            deck = pydealer.Deck(rng=8, lazy_shuffle=True)
+            deck.shuffle()
+            hands.append(list(deck.deal(10)) + list(deck.sample(5)) +
+                list(deck.draw_random_many(5)) + list(deck))
+
+        self.assertEqual(hands[0], hands[1])
+
+    def test_shoe_rng(self):
+        """"""
+        shoe_x = pydealer.Shoe(num_decks=2, rng=4)
+        shoe_y = pydealer.Shoe(num_decks=2, rng=4)
+
+        shoe_x.reshuffle()
+        shoe_y.reshuffle()
+
+        self.assertEqual(shoe_x, shoe_y)
+
+    def test_spawn_rngs(self):
+        """"""
+        rngs_x = spawn_rngs(42, 4)
+        rngs_y = spawn_rngs(42, 2)
+
+        floats_x = [rng.random() for rng in rngs_x]
+        floats_y = [rng.random() for rng in rngs_y]
+
+        self.assertEqual(floats_x[:2], floats_y)
+        self.assertEqual(len(set(floats_x)), 4)
+
+    @unittest.skipIf(numpy is None, "NumPy is not installed.")
+    def test_numpy_rng(self):
+        """"""
+        deck_x = pydealer.Deck(rng=numpy.random.default_rng(5))
+        deck_y = pydealer.Deck(rng=numpy.random.default_rng(5))
+
+        deck_x.shuffle()
+        deck_y.shuffle()
+
+        self.assertIsInstance(deck_x.rng, NumPyRNG)
+        self.assertEqual(deck_x, deck_y)
+        self.assertEqual(sorted(deck_x, key=id),
+            sorted(pydealer.tools.build_cards(), key=id))
+        self.assertEqual(deck_x.deal(5), deck_y.deal(5))
+        self.assertTrue(0 <= deck_x.rng.randrange(3) < 3)
+
+    @unittest.skipIf(numpy is None, "NumPy is not installed.")
+    def test_numpy_spawn_rngs(self):
+        """"""
+        rngs_x = spawn_rngs(numpy.random.default_rng(5), 3)
+        rngs_y = spawn_rngs(numpy.random.default_rng(5), 3)
+
+        floats_x = [rng.random() for rng in rngs_x]
+
+        self.assertEqual(floats_x, [rng.random() for rng in rngs_y])
+        self.assertEqual(len(set(floats_x)), 3)
+
+    def test_counter_rng(self):
+        """"""
+        rng = CounterRNG(5, 3)
+
+        floats = [rng.random() for _ in range(20)]
+        state = rng.getstate()
+        bits = rng.getrandbits(200)
+        rng.setstate(state)
+
+        self.assertEqual(rng.getrandbits(200), bits)
+        self.assertEqual(CounterRNG(5, 3).random(), floats[0])
+        self.assertNotEqual(CounterRNG(5, 4).random(), floats[0])
+        self.assertNotEqual(CounterRNG("5", 3).random(), floats[0])
+        self.assertTrue(all(0 <= x < 1 for x in floats))
+        self.assertRaises(ValueError, CounterRNG, 5, -1)
+
+    def test_counter_rng_pickle(self):
+        """"""
+        rng = CounterRNG(5)
+        rng.random()
+
+        copy = pickle.loads(pickle.dumps(rng))
+
+        self.assertEqual(copy.getrandbits(100), rng.getrandbits(100))
+
+    def test_counter_rng_shuffle(self):
+        """"""
+        rng = CounterRNG(1)
+        counts = {}
+        for _ in range(6000):
+            cards = [0, 1, 2]
+            rng.shuffle(cards)
+            counts[tuple(cards)] = counts.get(tuple(cards), 0) + 1
+
+        self.assertEqual(len(counts), 6)
+        for num in counts.values():
+            self.assertTrue(850 < num < 1150)
+
+    def test_counter_rng_spawn(self):
+        """"""
+        rng = CounterRNG(9)
+
+        children = spawn_rngs(rng, 2) + spawn_rngs(rng, 2)
+
+        floats = [child.random() for child in children]
+        self.assertEqual(len(set(floats)), 4)
+        self.assertEqual(floats[:2],
+            [child.random() for child in CounterRNG(9).spawn(2)])
+
+    def test_from_seed(self):
+        """"""
+        deck = pydealer.Deck.from_seed(7, 1000)
+
+        self.assertEqual(deck, pydealer.Deck.from_seed(7, 1000))
+        self.assertNotEqual(deck, pydealer.Deck.from_seed(7, 1001))
+        self.assertEqual(sorted(deck, key=id),
+            sorted(pydealer.tools.build_cards(), key=id))
+        self.assertEqual(deck.deal(5),
+            pydealer.Deck.from_seed(7, 1000).deal(5))
+        self.assertIsInstance(pydealer.Shoe.from_seed(7, num_decks=2),
+            pydealer.Shoe)
+
+    def test_secure_rng(self):
+        """"""
+        rng = SecureRNG(64)
+
+        floats = [rng.random() for _ in range(20)]
+
+        self.assertTrue(all(0 <= x < 1 for x in floats))
+        self.assertEqual(len(set(floats)), 20)
+        self.assertTrue(0 <= rng.randrange(52) < 52)
+        self.assertRaises(NotImplementedError, rng.getstate)
+        self.assertIs(secure_rng(), secure_rng())
+        self.assertTrue(all(isinstance(child, SecureRNG)
+            for child in spawn_rngs(rng, 2)))
+
+    def test_secure_rng_shuffle(self):
+        """"""
+        rng = SecureRNG()
+        counts = {}
+        for _ in range(6000):
+            cards = [0, 1, 2]
+            rng.shuffle(cards)
+            counts[tuple(cards)] = counts.get(tuple(cards), 0) + 1
+
+        self.assertEqual(len(counts), 6)
+        for num in counts.values():
+            self.assertTrue(850 < num < 1150)
+
+    @unittest.skipIf(not hasattr(os, "register_at_fork"),
+        "os.fork is not available.")
+    def test_secure_rng_fork(self):
+        """"""
+        rng = SecureRNG()
+        rng.random()
+        pydealer.Deck().shuffle(secure=True)
+
+        def deal():
+            deck = pydealer.Deck()
+            deck.shuffle(secure=True)
+            bits = rng.getrandbits(64).to_bytes(8, "little")
+            return pydealer.codec.to_bytes(deck) + bits
+
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if not pid:
+            os.close(read_fd)
+            os.write(write_fd, deal())
+            os._exit(0)
+
+        os.close(write_fd)
+        parent = deal()
+        with os.fdopen(read_fd, "rb") as pipe:
+            child = pipe.read()
+        os.waitpid(pid, 0)
+
+        self.assertEqual(len(child), 60)
+        self.assertNotEqual(child[:52], parent[:52])
+        self.assertNotEqual(child[52:], parent[52:])
+
+    def test_shuffle_secure(self):
+        """"""
+        deck = pydealer.Deck(rng=5, lazy_shuffle=True)
+        shoe = pydealer.Shoe(num_decks=2)
+        state = random.getstate()
+
+        deck.shuffle(secure=True)
+        shoe.reshuffle(secure=True)
+
+        self.assertEqual(random.getstate(), state)
+        self.assertEqual(deck._lazy, 0)
+        self.assertEqual(sorted(deck, key=id),
+            sorted(pydealer.tools.build_cards(), key=id))
+        self.assertEqual(pydealer.Deck(rng=5).rng.random(), deck.rng.random())
+        self.assertEqual(sum(shoe.counts), 103)
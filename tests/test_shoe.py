@@ -0,0 +1,142 @@
+#===============================================================================
+# PyDealer - Tests - Shoe
+#-------------------------------------------------------------------------------
+# Version: 1.4.0
+# Updated: 10-01-2015
+# Author: Alex Crawford
+# License: GPLv3
+#===============================================================================
+
+#===============================================================================
+# Imports
+#===============================================================================
+
+import unittest
+
+import pydealer
+from pydealer.store import CodeStore
+
+
+#===============================================================================
+# TestShoe Class
+#===============================================================================
+
+class TestShoe(unittest.TestCase):
+
+    def setUp(self):
+        """"""
+        self.shoe = pydealer.Shoe()
+        self.ace_spades = pydealer.Card("Ace", "Spades")
+        # pass
+
+    def test_build(self):
+        """"""
+        self.assertEqual(self.shoe.size, 312)
+        self.assertEqual(self.shoe.decks_used, 6)
+        self.assertIsInstance(self.shoe.cards, CodeStore)
+        self.assertEqual(self.shoe.counts, (6,) * 52 + (0,))
+
+    def test_burn(self):
+        """"""
+        top = self.shoe[-1]
+
+        burned = self.shoe.burn()
+
+        self.assertEqual(burned, (top.code,))
+        self.assertEqual(self.shoe.size, 311)
+        self.assertEqual(len(self.shoe.burn(3)), 3)
+
+    def test_contains(self):
+        """"""
+        self.shoe.get_list(["AS"])
+
+        self.assertNotIn(self.ace_spades, self.shoe)
+        self.assertIn(pydealer.Card("Ace", "Hearts"), self.shoe)
+        self.assertNotIn(pydealer.Card("Knight", "Spades"), self.shoe)
+
+    def test_counts(self):
+        """"""
+        self.shoe.shuffle()
+        dealt = self.shoe.deal(100)
+
+        counts = self.shoe.counts
+        for card in pydealer.tools.build_cards():
+            self.assertEqual(counts[card.code], 6 - dealt.count(card))
+            self.assertEqual(self.shoe.count(card), 6 - dealt.count(card))
+
+    def test_cut(self):
+        """"""
+        cards = list(self.shoe)
+
+        self.shoe.cut(100)
+
+        self.assertEqual(list(self.shoe), cards[100:] + cards[:100])
+
+    def test_needs_shuffle(self):
+        """"""
+        shoe = pydealer.Shoe(num_decks=2, penetration=0.5)
+
+        self.assertEqual(shoe.cut_card, 52)
+        shoe.deal(51)
+        self.assertFalse(shoe.needs_shuffle)
+        shoe.deal(1)
+        self.assertTrue(shoe.needs_shuffle)
+        self.assertRaises(ValueError, shoe.place_cut_card, 1.5)
+
+    def test_remaining(self):
+        """"""
+        self.shoe.get_list(["Hearts"])
+
+        self.assertEqual(self.shoe.remaining("Hearts"), 0)
+        self.assertEqual(self.shoe.remaining("Spades"), 78)
+        self.assertEqual(self.shoe.remaining("A"), 18)
+        self.assertEqual(self.shoe.remaining("10S"), 6)
+
+    def test_reshuffle(self):
+        """"""
+        shoe = pydealer.Shoe(num_decks=8, burn_cards=1)
+        shoe.deal(300)
+
+        shoe.reshuffle()
+
+        self.assertEqual(shoe.size, 415)
+        self.assertEqual(shoe.cut_card, 104)
+        self.assertEqual(sum(shoe.counts), 415)
+        self.assertFalse(shoe.is_sorted())
+
+    def test_reshuffle_lazy(self):
+        """"""
+        shoe = pydealer.Shoe(num_decks=2, lazy_shuffle=True)
+
+        shoe.reshuffle()
+        hand = shoe.deal(3)
+        shoe.cut(10)
+
+        self.assertEqual(shoe.size, 100)
+        self.assertEqual(shoe._lazy, 0)
+        self.assertEqual(sum(shoe.counts), 100)
+        self.assertEqual(len(hand), 3)
+
+    def test_stack_methods(self):
+        """"""
+        self.shoe.shuffle()
+        found = self.shoe.find("AS")
+        hand = self.shoe.deal(5)
+
+        self.assertEqual(len(found), 6)
+        self.assertIsInstance(hand, pydealer.Stack)
+        self.shoe.add(hand)
+        self.shoe.sort()
+        self.assertEqual(list(self.shoe),
+            sorted(pydealer.tools.build_cards() * 6,
+            key=pydealer.ranks.DEFAULT.key))
+
+    def test_stream(self):
+        """"""
+        shoe = pydealer.Shoe(num_decks=2, build=False)
+
+        cards = next(shoe.stream(size=104))
+
+        self.assertEqual(shoe.decks_used, 2)
+        self.assertEqual(sorted(cards, key=id),
+            sorted(pydealer.tools.build_cards() * 2, key=id))
@@ -0,0 +1,104 @@
+#===============================================================================
+# PyDealer - Tests - Shuffles
+#-------------------------------------------------------------------------------
+# Version: 1.4.0
+# Updated: 10-01-2015
+# Author: Alex Crawford
+# License: GPLv3
+#===============================================================================
+
+#===============================================================================
+# Imports
+#===============================================================================
+
+import random
+import unittest
+
+import pydealer
+from pydealer.shuffles import (
+    overhand,
+    riffle,
+    strip
+)
+
+
+#===============================================================================
+# TestShuffles Class
+#===============================================================================
+
+class TestShuffles(unittest.TestCase):
+
+    def setUp(self):
+        """"""
+        self.rng = random.Random(1)
+        self.codes = list(range(52))
+
+    def rising_sequences(self, codes):
+        """"""
+        positions = sorted(range(len(codes)), key=codes.__getitem__)
+        return 1 + sum(
+            1 for i in range(1, len(codes)) if positions[i] < positions[i - 1]
+        )
+
+    def test_overhand(self):
+        """"""
+        codes = overhand(self.codes, self.rng)
+
+        self.assertEqual(sorted(codes), self.codes)
+        self.assertNotEqual(codes, self.codes)
+        self.assertEqual(overhand(self.codes, self.rng, 0), self.codes)
+        self.assertEqual(overhand(self.codes, self.rng, 1), self.codes[::-1])
+
+    def test_riffle(self):
+        """"""
+        codes = riffle(self.codes, self.rng)
+
+        self.assertEqual(sorted(codes), self.codes)
+        self.assertEqual(self.rising_sequences(codes), 2)
+        self.assertEqual(riffle([], self.rng), [])
+
+    def test_riffle_two_cards(self):
+        """"""
+        swapped = sum(1 for _ in range(4000) if riffle([0, 1], self.rng)[0])
+
+        self.assertTrue(900 < swapped < 1100)
+
+    def test_strip(self):
+        """"""
+        codes = strip(self.codes, self.rng)
+
+        self.assertEqual(sorted(codes), self.codes)
+        self.assertNotEqual(codes, self.codes)
+
+    def test_stack_shuffle(self):
+        """"""
+        deck = pydealer.Deck(rng=3, indexed=True)
+
+        deck.shuffle(7, method="riffle")
+        codes = pydealer.codec.to_codes(deck)
+
+        self.assertEqual(sorted(codes), self.codes)
+        self.assertTrue(self.rising_sequences(codes) <= 2 ** 7)
+        self.assertEqual(deck.count(deck[0]), 1)
+        self.assertRaises(ValueError, deck.shuffle, method="faro")
+
+    def test_stack_shuffle_lazy(self):
+        """"""
+        deck = pydealer.Deck(rng=3, lazy_shuffle=True)
+        deck.shuffle()
+
+        deck.shuffle(method="overhand")
+
+        self.assertEqual(deck._lazy, 0)
+        self.assertEqual(sorted(pydealer.codec.to_codes(deck)), self.codes)
+
+    def test_shoe_shuffle(self):
+        """"""
+        shoe = pydealer.Shoe(num_decks=2, rng=3, lazy_shuffle=True)
+        shoe.shuffle()
+
+        shoe.shuffle(2, method="strip")
+
+        self.assertEqual(shoe._lazy, 0)
+        self.assertEqual(sum(shoe.counts), 104)
+        self.assertRaises(ValueError, shoe.shuffle, method="faro")
@@ -11,6 +11,7 @@
 # Imports
 #===============================================================================
 
+import random
 import unittest
 
 import pydealer
@@ -72,6 +73,60 @@ class TestStack(unittest.TestCase):
         result = self.ace_spades in self.stack
         self.assertTrue(result)
 
+    def test_contains_indexed(self):
+        """"""
+        stack = pydealer.Stack(cards=self.cards, indexed=True)
+        knight = pydealer.Card("Knight", "Swords")
+
+        self.assertIn(self.ace_spades, stack)
+        self.assertNotIn(pydealer.Card("3", "Clubs"), stack)
+        self.assertNotIn(knight, stack)
+
+        stack.add(knight)
+
+        self.assertIn(knight, stack)
+        self.assertNotIn(pydealer.Card("Knight", "Swords"), stack)
+
+    def test_count(self):
+        """"""
+        for indexed in [False, True]:
+            stack = pydealer.Stack(cards=self.cards * 3, indexed=indexed)
+            self.assertEqual(stack.count(self.ace_spades), 3)
+            stack.get("AS")
+            self.assertEqual(stack.count(self.ace_spades), 0)
+            self.assertEqual(stack.count(self.seven_clubs), 3)
+
+    def test_index_updates(self):
+        """"""
+        stack = pydealer.Stack(cards=pydealer.tools.build_cards(),
+            indexed=True)
+
+        stack.add(self.cards)
+        stack.add(self.ace_spades, BOTTOM)
+        stack.insert(self.two_diamonds, 10)
+        stack.insert_list(self.cards, 20)
+        stack.deal(5)
+        stack.deal(5, BOTTOM)
+        stack.get("Hearts")
+        stack.get_list(["2", "AS"])
+        stack[3] = self.queen_hearts
+        del stack[7]
+        stack.random_card(remove=True)
+        stack.shuffle()
+        stack.sort()
+
+        for card in pydealer.tools.build_cards():
+            self.assertEqual(stack.count(card), list(stack).count(card))
+            self.assertEqual(card in stack, card in list(stack))
+
+        stack.set_cards(self.cards)
+
+        self.assertEqual(stack.count(self.ace_spades), 1)
+
+        stack.empty()
+
+        self.assertNotIn(self.ace_spades, stack)
+
     def test_deal_single(self):
         """"""
         cards = self.full_stack.deal()
@@ -86,6 +141,125 @@ class TestStack(unittest.TestCase):
         self.assertEqual(len(cards), 7)
         self.assertIsInstance(cards[0], pydealer.Card)
 
+    def test_deal_bottom(self):
+        """"""
+        bottom = self.full_stack[:3]
+
+        cards = self.full_stack.deal(3, BOTTOM)
+
+        self.assertEqual(list(cards), bottom)
+        self.assertRaises(ValueError, self.full_stack.deal, 1, "middle")
+
+    def test_deal_codes(self):
+        """"""
+        top = self.full_stack[-2:]
+
+        codes = self.full_stack.deal_codes(2)
+
+        self.assertEqual(codes, (top[1].code, top[0].code))
+        self.assertEqual(self.full_stack.size, 50)
+        self.assertEqual(self.stack.deal_codes(5), ())
+
+    def test_deal_into(self):
+        """"""
+        hand = pydealer.Stack(cards=[self.ace_spades])
+        expected = list(self.full_stack.split(49)[1].deal(3))
+
+        num = self.full_stack.deal_into(hand, 3)
+
+        self.assertEqual(num, 3)
+        self.assertEqual(list(hand), [self.ace_spades] + expected)
+        self.assertEqual(self.full_stack.size, 49)
+        self.assertEqual(self.stack.deal_into(hand, 2), 0)
+
+    def test_deal_lazy(self):
+        """"""
+        counts = {}
+        for _ in range(3000):
+            stack = pydealer.Stack(cards=self.cards[:3], lazy_shuffle=True)
+            stack.shuffle()
+            stack.add(self.seven_clubs)
+            order = tuple(card.value for card in stack.deal(4))
+            counts[order] = counts.get(order, 0) + 1
+
+        self.assertEqual(len(counts), 6)
+        for order, num in counts.items():
+            self.assertEqual(order[0], "7")
+            self.assertTrue(400 < num < 600)
+
+    def test_deal_lazy_bottom(self):
+        """"""
+        stack = pydealer.Stack(cards=self.cards[:3], lazy_shuffle=True)
+        stack.shuffle()
+        stack.add(self.seven_clubs)
+
+        cards = stack.deal(4, BOTTOM)
+
+        self.assertIs(cards[-1], self.seven_clubs)
+        self.assertEqual(sorted(cards, key=id), sorted(self.cards, key=id))
+
+    def test_draw_random(self):
+        """"""
+        cards = list(self.full_stack)
+
+        drawn = [self.full_stack.draw_random() for _ in range(52)]
+
+        self.assertEqual(self.full_stack.size, 0)
+        self.assertEqual(sorted(drawn, key=id), sorted(cards, key=id))
+        self.assertRaises(IndexError, self.full_stack.draw_random)
+
+    def test_draw_random_sorted(self):
+        """"""
+        deck = pydealer.Deck(rng=1)
+        deck.sort()
+
+        deck.draw_random_many(5)
+        key = pydealer.ranks.compile_ranks().key
+        cards = list(deck)
+
+        self.assertNotEqual(cards, sorted(cards, key=key))
+        self.assertFalse(deck.is_sorted())
+        deck.sort()
+        self.assertEqual(list(deck), sorted(cards, key=key))
+        self.assertTrue(deck.is_sorted())
+
+    def test_draw_random_preserve_order(self):
+        """"""
+        card = self.small_stack.draw_random(preserve_order=True)
+
+        self.assertEqual(list(self.small_stack),
+            [x for x in self.cards if x is not card])
+
+    def test_draw_random_many(self):
+        """"""
+        stack = pydealer.Stack(cards=self.cards * 2, indexed=True)
+
+        drawn = stack.draw_random_many(5)
+
+        self.assertIsInstance(drawn, pydealer.Stack)
+        self.assertEqual(stack.size, 3)
+        self.assertEqual(sorted(list(drawn) + list(stack), key=id),
+            sorted(self.cards * 2, key=id))
+        for card in self.cards:
+            self.assertEqual(stack.count(card), list(stack).count(card))
+        self.assertRaises(ValueError, stack.draw_random_many, 4)
+
+    def test_draw_random_lazy(self):
+        """"""
+        stack = pydealer.Stack(cards=pydealer.tools.build_cards(),
+            lazy_shuffle=True)
+        stack.shuffle()
+        stack.add(self.cards)
+
+        drawn = stack.draw_random_many(30)
+        drawn += stack.draw_random_many(10, preserve_order=True)
+        dealt = stack.deal(16)
+
+        self.assertEqual(stack.size, 0)
+        self.assertEqual(stack._lazy, 0)
+        self.assertEqual(sorted(list(drawn) + list(dealt), key=id),
+            sorted(pydealer.tools.build_cards() + self.cards, key=id))
+
     def test_del_item(self):
         """"""
         card = self.full_stack[0]
@@ -147,6 +321,58 @@ class TestStack(unittest.TestCase):
 
         self.assertEqual(len(found), 1)
 
+    def test_find_index_updates(self):
+        """"""
+        terms = ["Spades", "AS", "10", "10H", "Queen", "2 of Diamonds", "j"]
+        stack = pydealer.Stack(cards=pydealer.tools.build_cards() * 2)
+
+        def check():
+            for term in terms:
+                expected = [i for i, card in enumerate(stack)
+                    if pydealer.tools.check_term(card, term)]
+                self.assertEqual(stack.find(term), expected)
+
+        check()
+        stack.add(self.cards)
+        check()
+        stack.deal(7)
+        check()
+        stack.insert(self.ace_spades)
+        check()
+        stack.deal(3, BOTTOM)
+        check()
+        stack.add(self.cards, BOTTOM)
+        check()
+        stack.shuffle()
+        check()
+        deck = pydealer.Deck(rebuild=True)
+        deck.find("AS")
+        deck.deal(60)
+        self.assertEqual(deck.find("Spades"), list(range(3, 44, 4)))
+
+    def test_find_limit_order(self):
+        """"""
+        cards = pydealer.tools.build_cards() * 2 + [
+            pydealer.Card("Knight", "Spades")]
+        random.shuffle(cards)
+        stack = pydealer.Stack(cards=cards)
+
+        for term in ["Spades", "Knight", "A", "Hearts"]:
+            expected = pydealer.tools.find_card(cards, term)
+            self.assertEqual(stack.find(term), expected)
+            self.assertEqual(stack.find(term, limit=5), expected[:5])
+        self.assertEqual(stack.find_list(["A", "Spades"], limit=3),
+            pydealer.tools.find_list(cards, ["A", "Spades"], limit=3))
+
+    def test_find_sort(self):
+        """"""
+        self.full_stack.shuffle()
+        found = self.full_stack.find("Ace", sort=True,
+            ranks=pydealer.Ranks(pydealer.BIG2_RANKS))
+        suits = [self.full_stack[i].suit for i in found]
+
+        self.assertEqual(suits, ["Diamonds", "Clubs", "Hearts", "Spades"])
+
     def test_find_list_full(self):
         """"""
         full_list = ["Ace of Spades", "2 of Diamonds", "Queen of Hearts",
@@ -279,6 +505,39 @@ class TestStack(unittest.TestCase):
 
         self.assertEqual(len(found), 1)
 
+    def test_get_list_indices(self):
+        """"""
+        stack = pydealer.Stack(cards=pydealer.tools.build_cards() * 2,
+            indexed=True)
+        first, last = stack[0], stack[-1]
+
+        found = stack.get_list([0, -1, 0, "2 of Diamonds"])
+
+        self.assertEqual(found, [first, last, first])
+        self.assertEqual(stack.size, 101)
+        self.assertEqual(stack.count(first), 0)
+        self.assertRaises(IndexError, stack.get_list, [200])
+
+    def test_get_list_shoe(self):
+        """"""
+        stack = pydealer.Stack(cards=pydealer.tools.build_cards() * 8)
+
+        found = stack.get_list(["AS", "Ace of Spades", "KH"])
+
+        self.assertEqual(len(found), 16)
+        self.assertEqual(stack.size, 400)
+        self.assertEqual(stack.find_list(["AS", "KH"]), [])
+
+    def test_get_negative(self):
+        """"""
+        last = self.full_stack[-1]
+
+        found = self.full_stack.get(-1)
+
+        self.assertEqual(found, [last])
+        self.assertEqual(self.full_stack.size, 51)
+        self.assertNotIn(last, self.full_stack)
+
     def test_getitem(self):
         """"""
         card = self.full_stack[0]
@@ -303,6 +562,43 @@ class TestStack(unittest.TestCase):
 
         self.assertEqual(stack_slice, self.cards)
 
+    def test_insert_end(self):
+        """"""
+        self.small_stack.insert(self.ace_spades, 4)
+        self.small_stack.insert(self.seven_clubs, -2)
+
+        self.assertIs(self.small_stack[5], self.ace_spades)
+        self.assertIs(self.small_stack[3], self.seven_clubs)
+
+    def test_insert_list_ends(self):
+        """"""
+        for indice in [0, 2, -1, 4, -2]:
+            stack = pydealer.Stack(cards=self.cards)
+            stack.insert_list(self.cards, indice)
+            expected = list(self.cards)
+            if indice == -1:
+                expected += self.cards
+            else:
+                expected[indice:indice] = self.cards
+
+            self.assertEqual(list(stack), expected)
+
+    def test_insert_list_lazy(self):
+        """"""
+        deck = pydealer.Deck(rng=3, lazy_shuffle=True, indexed=True)
+        other = pydealer.Deck(rng=3, lazy_shuffle=True)
+        deck.shuffle()
+        other.shuffle()
+        expected = list(other)
+        expected[5:5] = [self.ace_spades]
+
+        deck.insert_list([self.ace_spades], 5)
+
+        self.assertEqual(deck.size, 53)
+        self.assertEqual(list(deck), expected)
+        self.assertEqual(deck.count(self.ace_spades), 2)
+        self.assertEqual(deck.count(self.seven_clubs), 1)
+
     def test_iter(self):
         """"""
         for card in self.full_stack:
@@ -320,6 +616,57 @@ class TestStack(unittest.TestCase):
 
         self.assertTrue(result)
 
+    def test_is_sorted(self):
+        """"""
+        self.assertTrue(self.full_stack.is_sorted())
+        self.assertFalse(self.small_stack.is_sorted())
+
+        self.small_stack.sort()
+
+        self.assertTrue(self.small_stack.is_sorted())
+
+        self.small_stack.reverse()
+
+        self.assertTrue(self.small_stack.is_sorted())
+
+    def test_is_sorted_cleared(self):
+        """"""
+        self.full_stack.sort()
+        self.full_stack.deal(5)
+
+        self.assertTrue(self.full_stack.is_sorted())
+
+        self.full_stack.add(self.two_diamonds)
+
+        self.assertFalse(self.full_stack.is_sorted())
+
+        self.full_stack.sort()
+        self.full_stack.shuffle()
+
+        self.assertFalse(self.full_stack.is_sorted())
+
+    def test_cards_in_place(self):
+        """"""
+        stack = pydealer.Stack(cards=pydealer.tools.build_cards(),
+            indexed=True)
+        stack.sort()
+        stack.find("AS")
+
+        cards = stack.cards
+        cards[0], cards[51] = cards[51], cards[0]
+        stack.cards.append(self.ace_spades)
+        stack.cards.remove(self.two_diamonds)
+
+        self.assertFalse(stack.is_sorted())
+        self.assertEqual(stack.find("AS"), [0, 51])
+        self.assertEqual(stack.count(self.ace_spades), 2)
+        self.assertEqual(stack.count(self.two_diamonds), 0)
+        self.assertFalse(self.two_diamonds in stack)
+        stack.sort()
+        self.assertEqual(stack[0], pydealer.Card("2", "Clubs"))
+        stack.deal()
+        self.assertEqual(stack.count(self.ace_spades), 1)
+
     def test_open_cards(self):
         """"""
         indices = [0, 1, 2, 3]
@@ -330,8 +677,11 @@ class TestStack(unittest.TestCase):
     def test_random_card(self):
         """"""
         card = self.full_stack.random_card()
+        removed = self.full_stack.random_card(remove=True)
 
         self.assertIsInstance(card, pydealer.Card)
+        self.assertEqual(list(self.full_stack),
+            [x for x in pydealer.tools.build_cards() if x is not removed])
 
     def test_repr(self):
         """"""
@@ -348,6 +698,43 @@ class TestStack(unittest.TestCase):
 
         self.assertEqual(cards_reversed_x, cards_reversed_y)
 
+    def test_sample(self):
+        """"""
+        cards = list(self.full_stack)
+
+        sample = self.full_stack.sample(5)
+
+        self.assertIsInstance(sample, pydealer.Stack)
+        self.assertEqual(self.full_stack.size, 47)
+        self.assertEqual([card for card in cards if card not in sample],
+            list(self.full_stack))
+        self.assertRaises(ValueError, self.full_stack.sample, 48)
+
+    def test_sample_keep(self):
+        """"""
+        counts = dict((card, 0) for card in self.cards)
+        for _ in range(2000):
+            for card in self.small_stack.sample(2, remove=False):
+                counts[card] += 1
+
+        self.assertEqual(self.small_stack.size, 4)
+        for num in counts.values():
+            self.assertTrue(900 < num < 1100)
+
+    def test_sample_lazy(self):
+        """"""
+        stack = pydealer.Stack(cards=pydealer.tools.build_cards(),
+            lazy_shuffle=True)
+        stack.shuffle()
+        stack.add(self.cards)
+
+        sample = stack.sample(20)
+        hand = stack.deal(36)
+
+        self.assertEqual(stack.size, 0)
+        self.assertEqual(sorted(list(sample) + list(hand), key=id),
+            sorted(pydealer.tools.build_cards() + self.cards, key=id))
+
     def test_save_cards(self):
         """"""
         names = ["Ace Spades\n", "2 Diamonds\n", "Queen Hearts\n", "7 Clubs"]
@@ -379,6 +766,20 @@ class TestStack(unittest.TestCase):
 
         self.assertNotEqual(cards_before, cards_after)
 
+    def test_shuffle_lazy(self):
+        """"""
+        stack = pydealer.Stack(cards=pydealer.tools.build_cards(),
+            lazy_shuffle=True)
+        stack.sort()
+        stack.shuffle()
+
+        self.assertEqual(stack.size, 52)
+        self.assertFalse(stack.is_sorted())
+        self.assertEqual(stack._lazy, 0)
+        self.assertEqual(list(stack), list(stack.cards))
+        self.assertEqual(sorted(stack, key=id),
+            sorted(pydealer.tools.build_cards(), key=id))
+
     def test_size(self):
         """"""
         self.assertEqual(self.full_stack.size, 52)
@@ -392,6 +793,18 @@ class TestStack(unittest.TestCase):
 
         self.assertEqual(list(self.small_stack.cards), ordered)
 
+    def test_sort_large(self):
+        """"""
+        stack = pydealer.Stack(cards=pydealer.tools.build_cards() * 24)
+        stack.shuffle()
+
+        stack.sort(pydealer.BIG2_RANKS)
+
+        self.assertEqual(stack.size, 52 * 24)
+        self.assertIs(stack[0], pydealer.Card("3", "Diamonds"))
+        self.assertIs(stack[-1], pydealer.Card("2", "Spades"))
+        self.assertTrue(stack.is_sorted(pydealer.BIG2_RANKS))
+
     def test_split(self):
         """"""
         s1, s2 = self.small_stack.split()
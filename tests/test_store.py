@@ -0,0 +1,246 @@
+#===============================================================================
+# PyDealer - Tests - Store
+#-------------------------------------------------------------------------------
+# Version: 1.4.0
+# Updated: 10-01-2015
+# Author: Alex Crawford
+# License: GPLv3
+#===============================================================================
+
+#===============================================================================
+# Imports
+#===============================================================================
+
+from collections import deque
+from functools import partial
+import pickle
+import random
+import unittest
+
+import pydealer
+from pydealer.card import CARDS
+from pydealer.store import (
+    BlockList,
+    CodeStore,
+    ListDeque
+)
+
+
+#===============================================================================
+# TestStore Class
+#===============================================================================
+
+class TestStore(unittest.TestCase):
+
+    STORES = [ListDeque, BlockList, partial(BlockList, load=4)]
+
+    def setUp(self):
+        """"""
+        self.rng = random.Random(1234)
+
+    def random_ops(self, store_type, num=2000, item=None):
+        """"""
+        item = item or (lambda i: i)
+        store = store_type(map(item, range(10)))
+        expected = deque(map(item, range(10)))
+
+        for i in range(num):
+            i = item(i)
+            op = self.rng.randrange(9)
+            if op == 0:
+                store.append(i)
+                expected.append(i)
+            elif op == 1:
+                store.appendleft(i)
+                expected.appendleft(i)
+            elif op == 2 and expected:
+                self.assertEqual(store.pop(), expected.pop())
+            elif op == 3 and expected:
+                self.assertEqual(store.popleft(), expected.popleft())
+            elif op == 4:
+                store.extend([i, i])
+                expected.extend([i, i])
+            elif op == 5:
+                store.extendleft([i, expected[0] if expected else i])
+                expected.extendleft([i, expected[0] if expected else i])
+            elif op == 6:
+                j = self.rng.randrange(-len(expected) - 2, len(expected) + 2)
+                store.insert(j, i)
+                expected.insert(j, i)
+            elif op == 7 and expected:
+                j = self.rng.randrange(len(expected))
+                del store[j]
+                del expected[j]
+            elif op == 8:
+                j = self.rng.randrange(-5, 5)
+                store.rotate(j)
+                expected.rotate(j)
+
+            self.assertEqual(len(store), len(expected))
+
+        self.assertEqual(list(store), list(expected))
+
+        return store, expected
+
+    def test_random_ops(self):
+        """"""
+        for store_type in self.STORES:
+            self.random_ops(store_type)
+
+    def test_block_list_extendleft(self):
+        """"""
+        store = BlockList(range(10), load=8)
+        expected = list(range(10))
+
+        for i in range(3000):
+            store.extendleft([i])
+            expected.insert(0, i)
+        store.extendleft(range(20))
+        expected[0:0] = range(19, -1, -1)
+
+        self.assertEqual(list(store), expected)
+        self.assertTrue(len(store._blocks) <= len(expected) // 8 + 2)
+        for block in store._blocks:
+            self.assertTrue(0 < len(block) <= 16)
+
+    def test_block_list_load(self):
+        """"""
+        store = BlockList(range(10), load=2)
+
+        for _ in range(5):
+            del store[-1]
+            store.pop()
+
+        self.assertEqual(len(store), 0)
+        self.assertRaises(ValueError, BlockList, range(10), load=1)
+
+    def test_block_list_blocks(self):
+        """"""
+        store = BlockList(range(100), load=4)
+        expected = list(range(100))
+
+        for i in range(300):
+            j = self.rng.randrange(len(expected) + 1)
+            if self.rng.random() < 0.5 or not expected:
+                store.insert(j, i)
+                expected.insert(j, i)
+            else:
+                j = min(j, len(expected) - 1)
+                del store[j]
+                del expected[j]
+            self.assertEqual(store[j - 1], expected[j - 1])
+
+        self.assertEqual(list(store), expected)
+        self.assertEqual(store.index(expected[-1]), len(expected) - 1)
+        for block in store._blocks:
+            self.assertTrue(0 < len(block) <= 8)
+
+    def test_code_store(self):
+        """"""
+        item = lambda i: CARDS[i % len(CARDS)]
+        store, expected = self.random_ops(CodeStore, item=item)
+        items = list(expected)
+
+        for card in CARDS:
+            self.assertEqual(store.count(card), items.count(card))
+        self.assertEqual(store.counts(),
+            tuple(items.count(card) for card in CARDS))
+        for i in range(-len(items), len(items), 7):
+            self.assertIs(store[i], items[i])
+        self.assertEqual(store[5:40:3], items[5:40:3])
+        self.assertEqual(list(reversed(store)), items[::-1])
+        self.assertEqual(store.index(items[-1]), items.index(items[-1]))
+        self.assertEqual(pickle.loads(pickle.dumps(store)), store)
+        self.assertRaises(ValueError, store.append,
+            pydealer.Card("Knight", "Spades"))
+
+    def test_code_store_counts(self):
+        """"""
+        store = CodeStore(pydealer.tools.build_cards() * 2)
+        ace_spades = pydealer.Card("Ace", "Spades")
+
+        store.remove(ace_spades)
+        store[0] = ace_spades
+        del store[1]
+        store.popleft()
+
+        self.assertEqual(store.count(ace_spades), 1)
+        self.assertEqual(sum(store.counts()), len(store))
+        self.assertEqual(store.counts(),
+            tuple(list(store).count(card) for card in CARDS))
+        store.clear()
+        self.assertEqual(sum(store.counts()), 0)
+
+    def test_indexing(self):
+        """"""
+        for store_type in self.STORES:
+            store, expected = self.random_ops(store_type, 500)
+            items = list(expected)
+            for i in range(-len(items), len(items)):
+                self.assertEqual(store[i], items[i])
+            self.assertRaises(IndexError, store.__getitem__, len(items))
+
+    def test_slicing(self):
+        """"""
+        for store_type in self.STORES:
+            store, expected = self.random_ops(store_type, 500)
+            items = list(expected)
+            for key in [slice(None), slice(3, 40), slice(-20, None),
+                    slice(None, None, -1), slice(40, 3, -3), slice(1, 90, 7)]:
+                self.assertEqual(list(store[key]), items[key])
+
+    def test_pop_empty(self):
+        """"""
+        for store_type in self.STORES:
+            store = store_type()
+            self.assertRaises(IndexError, store.pop)
+            self.assertRaises(IndexError, store.popleft)
+
+    def test_misc(self):
+        """"""
+        for store_type in self.STORES:
+            store = store_type([3, 1, 2, 1])
+            store.appendleft(0)
+            self.assertEqual(store.count(1), 2)
+            self.assertEqual(store.index(2), 3)
+            store.remove(1)
+            self.assertEqual(list(store), [0, 3, 2, 1])
+            store.reverse()
+            self.assertEqual(list(reversed(store)), [0, 3, 2, 1])
+            store[0] = 9
+            self.assertEqual(list(pickle.loads(pickle.dumps(store))),
+                [9, 2, 3, 0])
+            store += [5]
+            self.assertEqual(list(store.copy()), [9, 2, 3, 0, 5])
+            store.clear()
+            self.assertEqual(len(store), 0)
+
+    def test_stack_store(self):
+        """"""
+        for store_type in self.STORES:
+            stack = pydealer.Stack(cards=pydealer.tools.build_cards(),
+                store=store_type)
+            deck = pydealer.Deck()
+            self.assertIsInstance(stack.cards, type(store_type()))
+            self.assertEqual(stack, deck)
+            self.assertEqual(stack[10:20], deck[10:20])
+            self.assertEqual(stack[::-1], deck[::-1])
+            stack.deal(3)
+            stack.deal(3, pydealer.BOTTOM)
+            self.assertEqual(list(stack), deck[3:-3])
+            half_x, half_y = stack.split()
+            self.assertIsInstance(half_x.cards, type(store_type()))
+            stack.add(pydealer.Card("Ace", "Spades"), pydealer.BOTTOM)
+            self.assertEqual(stack[0].abbrev, "AS")
+            stack.shuffle()
+            stack.sort()
+            self.assertTrue(stack.is_sorted())
+            stack.insert(pydealer.Card("2", "Clubs"), 20)
+            stack.insert_list(deck[:5], 30)
+            self.assertEqual(stack[20].abbrev, "2C")
+            self.assertEqual(stack[30:35], deck[:5])
+            self.assertIsInstance(stack.cards, type(store_type()))
+
+
+# if __name__ == '__main__':
+#     unittest.main()
@@ -13,9 +13,17 @@
 
 import unittest
 
+from test_batch import TestDeckBatch
 from test_card import TestCard
+from test_codec import TestCodec
 from test_deck import TestDeck
+from test_fair import TestFair
+from test_ranks import TestRanks
+from test_rng import TestRNG
+from test_shoe import TestShoe
+from test_shuffles import TestShuffles
 from test_stack import TestStack
+from test_store import TestStore
 from test_tools import TestTools
 
 
@@ -23,7 +31,8 @@ from test_tools import TestTools
 # Tests List
 #===============================================================================
 
-TESTS = [TestCard, TestStack, TestDeck, TestTools]
+TESTS = [TestCard, TestStack, TestDeck, TestTools, TestCodec, TestRanks,
+    TestStore, TestShoe, TestRNG, TestDeckBatch, TestShuffles, TestFair]
 
 
 #===============================================================================
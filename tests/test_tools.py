@@ -11,6 +11,7 @@
 # Imports
 #===============================================================================
 
+import random
 import unittest
 
 import pydealer
@@ -57,18 +58,68 @@ class TestTools(unittest.TestCase):
 
         self.assertEqual(list(self.deck.cards), cards)
 
+    def test_build_cards_interned(self):
+        """"""
+        cards_x = pydealer.tools.build_cards()
+        cards_y = pydealer.tools.build_cards(jokers=True, num_jokers=2)
+
+        for card_x, card_y in zip(cards_x, cards_y[2:]):
+            self.assertIs(card_x, card_y)
+        self.assertIs(cards_y[0], cards_y[1])
+
+    def test_deck_template(self):
+        """"""
+        template = pydealer.tools.deck_template()
+        cards = pydealer.tools.build_cards()
+
+        self.assertIsInstance(template, tuple)
+        self.assertIs(pydealer.tools.deck_template(False, 2), template)
+        self.assertEqual(len(pydealer.tools.deck_template(True, 2)), 54)
+        cards.pop()
+        self.assertEqual(len(template), 52)
+        self.assertEqual(len(pydealer.tools.build_cards()), 52)
+
     def test_check_sorted(self):
         """"""
         result = pydealer.tools.check_sorted(self.deck)
 
         self.assertEqual(result, True)
 
+    def test_check_sorted_descending(self):
+        """"""
+        cards = list(self.deck.cards)[::-1]
+
+        self.assertTrue(pydealer.tools.check_sorted(cards))
+        self.assertFalse(pydealer.tools.check_sorted(cards,
+            descending=False))
+        self.assertFalse(pydealer.tools.check_sorted(self.cards))
+
     def test_check_term(self):
         """"""
         result = pydealer.tools.check_term(self.deck[0], "2 of Diamonds")
 
         self.assertEqual(result, True)
 
+    def test_check_term_custom(self):
+        """"""
+        knight = pydealer.Card("Knight", "Spades")
+
+        self.assertTrue(pydealer.tools.check_term(knight, "knight"))
+        self.assertTrue(pydealer.tools.check_term(knight, "S"))
+        self.assertFalse(pydealer.tools.check_term(knight, "Hearts"))
+
+    def test_compile_term(self):
+        """"""
+        hearts = pydealer.tools.compile_term("Hearts")
+        ten_spades = pydealer.tools.compile_term("10S")
+
+        self.assertEqual(len(hearts), 13)
+        self.assertEqual(len(pydealer.tools.compile_term("A")), 4)
+        self.assertEqual(ten_spades, set([pydealer.Card("10", "Spades").code]))
+        self.assertIs(pydealer.tools.compile_term("Hearts"), hearts)
+        for card in pydealer.card.CARDS:
+            self.assertEqual(card.code in hearts, card.suit == "Hearts")
+
     def test_compare_stacks(self):
         """"""
         other_deck = pydealer.Deck()
@@ -77,6 +128,27 @@ class TestTools(unittest.TestCase):
 
         self.assertEqual(result, True)
 
+    def test_counting_sort(self):
+        """"""
+        cards = pydealer.tools.build_cards() * 3
+        random.shuffle(cards)
+
+        for ranks in [None, pydealer.BIG2_RANKS, pydealer.POKER_RANKS]:
+            self.assertEqual(
+                pydealer.tools.counting_sort(cards, ranks),
+                sorted(cards, key=pydealer.ranks.compile_ranks(ranks).key)
+            )
+
+    def test_counting_sort_custom(self):
+        """"""
+        knight = pydealer.Card("Knight", "Spades")
+        ranks = {"values": {"Knight": 1, "Ace": 2}}
+        cards = [pydealer.Card("Ace", "Spades"), knight]
+
+        result = pydealer.tools.counting_sort(cards, ranks)
+
+        self.assertIs(result[0], knight)
+
     def test_find_card_abbrev(self):
         """"""
         found = pydealer.tools.find_card(self.deck, "AS")
@@ -115,6 +187,14 @@ class TestTools(unittest.TestCase):
 
         self.assertEqual(len(found), 1)
 
+    def test_find_card_custom(self):
+        """"""
+        cards = [self.ace_spades, pydealer.Card("Knight", "Spades"),
+            self.queen_hearts, self.ace_spades]
+
+        self.assertEqual(pydealer.tools.find_card(cards, "spades"), [0, 1, 3])
+        self.assertEqual(pydealer.tools.find_card(cards, "S", limit=2), [0, 1])
+
     def test_find_list_full(self):
         """"""
         full_list = ["Ace of Spades", "2 of Diamonds", "Queen of Hearts",
@@ -198,6 +278,40 @@ class TestTools(unittest.TestCase):
         for card in got_cards:
             self.assertEqual(card.suit, "Spades")
 
+    def test_get_card_negative(self):
+        """"""
+        left, found = pydealer.tools.get_card(self.cards, -1)
+
+        self.assertEqual(found, [self.seven_clubs])
+        self.assertEqual(left, self.cards[:-1])
+
+    def test_random_card(self):
+        """"""
+        cards = list(self.cards)
+
+        card = pydealer.tools.random_card(cards, remove=True,
+            preserve_order=False)
+
+        self.assertEqual(len(cards), 3)
+        self.assertNotIn(card, cards)
+        card = pydealer.tools.random_card(self.stack, remove=True)
+        self.assertEqual(list(self.stack),
+            [x for x in self.cards if x is not card])
+        cards = list(self.cards)
+        card = pydealer.tools.random_card(cards, remove=True)
+        self.assertEqual(cards, [x for x in self.cards if x is not card])
+
+    def test_resolve_indices(self):
+        """"""
+        cards = pydealer.tools.build_cards() * 2
+
+        indices = pydealer.tools.resolve_indices(cards, ["AS", -1, 51, "Ace"],
+            limit=2)
+
+        self.assertEqual(indices, [51, 103, 48, 49])
+        self.assertRaises(IndexError, pydealer.tools.resolve_indices, cards,
+            [-105])
+
     def test_get_card_limit(self):
         """"""
         left, got_cards = pydealer.tools.get_card(self.deck, "Spades", limit=1)
@@ -246,6 +360,16 @@ class TestTools(unittest.TestCase):
 
         self.get_list_helper(left, got_cards)
 
+    def test_get_list_indices(self):
+        """"""
+        cards = pydealer.tools.build_cards() * 2
+
+        left, found = pydealer.tools.get_list(cards, [-1, "AS", 103, 0, 51])
+
+        self.assertEqual(found, [cards[-1], cards[51], cards[0]])
+        self.assertEqual(len(left), 101)
+        self.assertEqual(len(cards), 104)
+
     def test_get_list_limit(self):
         """"""
         left, got_cards = pydealer.tools.get_list(self.stack, ["Spades"], limit=1)